@@ -1,6 +1,77 @@
 """This file contains class for data import from file (Singleton)"""
 
 import os
+import numpy as np
+from instance_cache import load_cache, store_cache
+from instance_reader import read_instance
+
+
+class CSRMatrix:
+    """Compressed sparse row 0/1 matrix. Row i holds indices[indptr[i]:indptr[i + 1]].
+
+    Indexing and iteration give rows as lists, so it can be used in place of
+    a list of lists. Indexed rows are converted once and cached, so repeated
+    access does not allocate; callers must not modify them. row() gives an
+    array view instead.
+    """
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray) -> None:
+        self.indptr = indptr
+        self.indices = indices
+        self._rows = None
+
+    @classmethod
+    def from_lists(cls, rows: list[list[int]]) -> "CSRMatrix":
+        """Build from a list of rows"""
+        indptr = np.zeros(len(rows) + 1, dtype=np.int32)
+        indptr[1:] = np.cumsum([len(row) for row in rows])
+        indices = np.fromiter(
+            (idx for row in rows for idx in row), dtype=np.int32, count=indptr[-1]
+        )
+        return cls(indptr, indices)
+
+    def transpose(self, columns: int) -> "CSRMatrix":
+        """Return the transposed matrix, every row sorted ascending
+
+        Args:
+            columns (int): Number of columns (rows of the result)
+        """
+        row_ids = np.repeat(
+            np.arange(len(self), dtype=np.int32), np.diff(self.indptr)
+        )
+        order = np.argsort(self.indices, kind="stable")
+        indptr = np.zeros(columns + 1, dtype=np.int32)
+        indptr[1:] = np.cumsum(np.bincount(self.indices, minlength=columns))
+        return CSRMatrix(indptr, row_ids[order])
+
+    def row(self, i: int) -> np.ndarray:
+        """Return row i as an array view"""
+        return self.indices[self.indptr[i] : self.indptr[i + 1]]
+
+    def row_lengths(self) -> np.ndarray:
+        """Return number of entries in each row"""
+        return np.diff(self.indptr)
+
+    def nnz(self) -> int:
+        """Return number of stored entries"""
+        return int(self.indptr[-1])
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    def __getitem__(self, i: int) -> list[int]:
+        if self._rows is None:
+            self._rows = [None] * len(self)
+        row = self._rows[i]
+        if row is None:
+            row = self._rows[i] = self.indices[self.indptr[i] : self.indptr[i + 1]].tolist()
+        return row
+
+    def __iter__(self):
+        indptr = self.indptr.tolist()
+        indices = self.indices.tolist()
+        for i in range(len(self)):
+            yield indices[indptr[i] : indptr[i + 1]]
 
 
 class DataLoader:
@@ -11,65 +82,135 @@ class DataLoader:
     _element_covers: list[list[int]]
     _subset_covers: list[list[int]]
 
-    def __init__(self, file_path: str) -> None:
+    def __init__(self, file_path: str, representation: str = "lists") -> None:
         """Initialize with path to instance file
 
         Args:
             file_path (str): Path to instance file
+            representation (str): "lists" keeps covers as lists of lists, "csr" keeps only
+                CSR arrays and the cover getters return row views over them
         """
         base_dir = os.path.dirname(__file__)
         self._file_path = os.path.join(base_dir, "instances", file_path)
-
-    def fetch_data(self) -> None:
-        """Load data from file to class attributes with zero-based indexing"""
-        with open(self._file_path, "r") as f:
-            lines = [line.strip() for line in f if line.strip()]
-            if not lines:
-                raise ValueError("File is empty or unreadable.")
-
-        n_elements, n_subsets = map(int, lines[0].split())
-        if n_elements <= 0 or n_subsets <= 0:
+        if representation not in ("lists", "csr"):
             raise ValueError(
-                f"Invalid instance: n_elements={n_elements}, n_subsets={n_subsets}"
+                f"Invalid representation: {representation}. Valid options: ['lists', 'csr']"
             )
-        self._n = n_elements
-        self._m = n_subsets
-
-        costs: list[int] = []
-        idx = 1
-        while len(costs) < self._m and idx < len(lines):
-            costs.extend(map(int, lines[idx].split()))
-            idx += 1
-        if len(costs) < self._m:
-            raise ValueError(
-                f"Not enough cost entries: expected {self._m}, got {len(costs)}"
+        self._representation = representation
+        self._element_csr = None
+        self._subset_csr = None
+        self._cost_array = None
+
+    @classmethod
+    def from_arrays(
+        cls,
+        n: int,
+        m: int,
+        costs: np.ndarray,
+        element_indptr: np.ndarray,
+        element_indices: np.ndarray,
+        representation: str = "lists",
+    ) -> "DataLoader":
+        """Create a loader holding instance data given in memory (e.g. a reduced instance)
+
+        Args:
+            n (int): Number of elements
+            m (int): Number of subsets
+            costs (np.ndarray): Cost of each subset
+            element_indptr (np.ndarray): CSR row pointers of subsets covering each element
+            element_indices (np.ndarray): CSR indices (zero-based) of subsets covering each element
+            representation (str): "lists" or "csr", see __init__
+
+        Returns:
+            DataLoader: Loader with fetched data, not backed by any file
+        """
+        dl = cls("", representation)
+        dl._file_path = ""
+        element_indptr = np.asarray(element_indptr, dtype=np.int32)
+        element_indices = np.asarray(element_indices, dtype=np.int32)
+        subset_csr = CSRMatrix(element_indptr, element_indices).transpose(m)
+        dl._set_arrays(
+            n,
+            m,
+            np.asarray(costs, dtype=np.int32),
+            element_indptr,
+            element_indices,
+            subset_csr.indptr,
+            subset_csr.indices,
+        )
+        return dl
+
+    def fetch_data(self, use_cache: bool = False, verify_cache: bool = False) -> None:
+        """Load data from file to class attributes with zero-based indexing
+
+        Loading from the cache is zero-copy only with representation="csr": the
+        "lists" representation copies the memory-mapped arrays into lists of lists.
+
+        Args:
+            use_cache (bool): If True, memory-map the binary cache of the instance
+                (see instance_cache), building or rebuilding it when missing or stale
+            verify_cache (bool): If True, check the checksum of the whole cached
+                payload instead of trusting a cache whose source size and mtime match
+        """
+        if use_cache:
+            cached = load_cache(self._file_path, verify=verify_cache)
+            if cached is not None:
+                self._set_arrays(*cached)
+                return
+
+        self._parse_file()
+
+        if use_cache:
+            element_csr = self.get_element_csr()
+            subset_csr = self.get_subset_csr()
+            store_cache(
+                self._file_path,
+                self._n,
+                self._m,
+                self.get_cost_array(),
+                element_csr.indptr,
+                element_csr.indices,
+                subset_csr.indptr,
+                subset_csr.indices,
             )
-        self._costs = costs[: self._m]
-
-        element_covers: list[list[int]] = []
-        for _ in range(self._n):
-            if idx >= len(lines):
-                raise ValueError("Unexpected end of file when reading element covers.")
-            parts = list(map(int, lines[idx].split()))
-            idx += 1
-            count = parts[0]
-            entries = parts[1:]
-            while len(entries) < count and idx < len(lines):
-                entries.extend(map(int, lines[idx].split()))
-                idx += 1
-            if len(entries) < count:
-                raise ValueError(
-                    f"Not enough subset indices for element: expected {count}, got {len(entries)}"
-                )
-            element_covers.append([e - 1 for e in entries])
-
-        self._element_covers = element_covers
-
-        subset_covers: list[list[int]] = [[] for _ in range(self._m)]
-        for elem_idx, subsets in enumerate(self._element_covers):
-            for s in subsets:
-                subset_covers[s].append(elem_idx)
-        self._subset_covers = [sorted(lst) for lst in subset_covers]
+
+    def _set_arrays(
+        self,
+        n: int,
+        m: int,
+        costs: np.ndarray,
+        element_indptr: np.ndarray,
+        element_indices: np.ndarray,
+        subset_indptr: np.ndarray,
+        subset_indices: np.ndarray,
+    ) -> None:
+        """Set instance data from CSR arrays"""
+        self._n = n
+        self._m = m
+        self._cost_array = np.asarray(costs, dtype=np.int64)
+        self._costs = costs.tolist()
+        self._element_csr = CSRMatrix(element_indptr, element_indices)
+        self._subset_csr = CSRMatrix(subset_indptr, subset_indices)
+        if self._representation == "csr":
+            self._element_covers = self._element_csr
+            self._subset_covers = self._subset_csr
+        else:
+            self._element_covers = list(self._element_csr)
+            self._subset_covers = list(self._subset_csr)
+
+    def _parse_file(self) -> None:
+        """Parse the instance file with the streaming reader (plain, gzip, bz2 or xz)"""
+        n, m, costs, element_indptr, element_indices = read_instance(self._file_path)
+        subset_csr = CSRMatrix(element_indptr, element_indices).transpose(m)
+        self._set_arrays(
+            n,
+            m,
+            costs,
+            element_indptr,
+            element_indices,
+            subset_csr.indptr,
+            subset_csr.indices,
+        )
 
     def get_n(self) -> int:
         """Get number of elements that need to be covered"""
@@ -91,10 +232,27 @@ class DataLoader:
         """Return cost of each subset"""
         return self._costs
 
+    def get_element_csr(self) -> CSRMatrix:
+        """Return subsets covering each element as CSR arrays (built on first use)"""
+        if self._element_csr is None:
+            self._element_csr = CSRMatrix.from_lists(self._element_covers)
+        return self._element_csr
+
+    def get_subset_csr(self) -> CSRMatrix:
+        """Return elements covered by each subset as CSR arrays (built on first use)"""
+        if self._subset_csr is None:
+            self._subset_csr = self.get_element_csr().transpose(self._m)
+        return self._subset_csr
+
+    def get_cost_array(self) -> np.ndarray:
+        """Return cost of each subset as an array"""
+        if self._cost_array is None:
+            self._cost_array = np.asarray(self._costs, dtype=np.int64)
+        return self._cost_array
+
     def calculate_density(self) -> float:
         """Calculate the density of the instance"""
-        subset_covers = self.get_subset_covers()
-        total_elements_covered = sum(len(covers) for covers in subset_covers)
+        total_elements_covered = self.get_subset_csr().nnz()
         density = (
             total_elements_covered / (self.get_m() * self.get_n()) * 100
             if self.get_m() > 0 and self.get_n() > 0
@@ -0,0 +1,84 @@
+"""This file contains benchmarks of the Validator coverage engines and batched population evaluation."""
+
+from DataLoader import DataLoader
+from validator import Validator
+from random_correct import RandomSolutionGenerator
+import random
+import time
+
+
+def bench_instance(file_name: str, solutions_count: int = 200, repeats: int = 20):
+    """Time is_correct on the same random solutions with both coverage engines.
+
+    Args:
+        file_name (str): Instance file inside the instances directory.
+        solutions_count (int): Number of random solutions to evaluate.
+        repeats (int): How many times every solution is evaluated.
+    """
+    dl = DataLoader(file_name)
+    dl.fetch_data()
+    validators = {
+        "set": Validator(dl, coverage_engine="set"),
+        "bitset": Validator(dl, coverage_engine="bitset"),
+    }
+
+    random.seed(0)
+    rsg = RandomSolutionGenerator(validators["bitset"])
+    solutions = [rsg.generate_random_solution() for _ in range(solutions_count)]
+
+    timings = {}
+    for engine, validator in validators.items():
+        start_time = time.perf_counter()
+        for _ in range(repeats):
+            for solution in solutions:
+                validator.is_correct(solution)
+        timings[engine] = time.perf_counter() - start_time
+
+    evaluations = solutions_count * repeats
+    print(f"=== {file_name} ({evaluations} evaluations) ===")
+    for engine, elapsed in timings.items():
+        print(
+            f"{engine:>7}: {elapsed:.3f} s ({evaluations / elapsed:,.0f} evaluations/s)"
+        )
+    print(f"Speedup: {timings['set'] / timings['bitset']:.1f}x")
+
+
+def bench_batch(file_name: str, population_size: int = 5000, repeats: int = 7):
+    """Time a per-solution evaluation loop against Validator.evaluate_batch.
+
+    Args:
+        file_name (str): Instance file inside the instances directory.
+        population_size (int): Number of solutions in the population.
+        repeats (int): Number of timed runs of each, the fastest one counts.
+    """
+    dl = DataLoader(file_name)
+    dl.fetch_data()
+    validator = Validator(dl)
+
+    random.seed(0)
+    rsg = RandomSolutionGenerator(validator)
+    population = [rsg.generate_random_solution() for _ in range(population_size)]
+    validator.evaluate_batch(population[:1])  # Build packed cover matrix
+
+    loop_time = batch_time = float("inf")
+    for _ in range(repeats):  # Best of several runs, single runs are noisy
+        start_time = time.perf_counter()
+        for solution in population:
+            validator.complex_eval_without_fitness(solution)
+        loop_time = min(loop_time, time.perf_counter() - start_time)
+
+        start_time = time.perf_counter()
+        validator.evaluate_batch(population)
+        batch_time = min(batch_time, time.perf_counter() - start_time)
+
+    print(f"=== {file_name} (population of {population_size}) ===")
+    print(f" loop: {loop_time:.3f} s")
+    print(f"batch: {batch_time:.3f} s")
+    print(f"Speedup: {loop_time / batch_time:.1f}x")
+
+
+if __name__ == "__main__":
+    bench_instance("scp41.txt")
+    bench_instance("scpd1.txt")
+    bench_batch("scp41.txt")
+    bench_batch("scpd1.txt")
@@ -0,0 +1,41 @@
+"""This file contains a benchmark comparing the scan and lazy (priority queue) greedy methods."""
+
+from DataLoader import DataLoader
+from validator import Validator
+from greedy import GreedySolutionGenerator
+import time
+
+
+def bench_instance(file_name: str, starts_count: int = 20):
+    """Build greedy solutions from the same start subsets with both methods.
+
+    Args:
+        file_name (str): Instance file inside the instances directory.
+        starts_count (int): Number of start subsets to generate from.
+    """
+    dl = DataLoader(file_name)
+    dl.fetch_data()
+    validator = Validator(dl)
+    starts = [None] + list(range(0, validator._m, validator._m // starts_count))
+
+    results = {}
+    timings = {}
+    for method in ["scan", "lazy"]:
+        gsg = GreedySolutionGenerator(validator, method=method)
+        start_time = time.perf_counter()
+        results[method] = [gsg._generate_greedy_solution(start) for start in starts]
+        timings[method] = time.perf_counter() - start_time
+
+    identical = all(
+        scan.subsets == lazy.subsets
+        for scan, lazy in zip(results["scan"], results["lazy"])
+    )
+    print(f"=== {file_name} ({len(starts)} greedy solutions) ===")
+    for method, elapsed in timings.items():
+        print(f"{method:>5}: {elapsed:.3f} s ({elapsed / len(starts) * 1000:.1f} ms each)")
+    print(f"Speedup: {timings['scan'] / timings['lazy']:.1f}x, identical: {identical}")
+
+
+if __name__ == "__main__":
+    bench_instance("scp41.txt")
+    bench_instance("scpd1.txt")
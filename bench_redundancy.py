@@ -0,0 +1,69 @@
+"""This file contains a microbenchmark of redundant subset removal (full recomputation vs cover counts)."""
+
+from DataLoader import DataLoader
+from validator import Validator
+from solution import Solution
+import random
+import time
+
+
+def remove_redundant_by_recomputation(validator: Validator, solution: Solution) -> None:
+    """Previous implementation - recomputes coverage for every candidate index."""
+    current_covered = set(validator.calculate_covered_elements(solution))
+    for i in range(len(solution.subsets)):
+        if i >= len(solution.subsets):
+            continue
+        temp_subsets = solution.subsets[:i] + solution.subsets[i + 1 :]
+        temp_covered = set(validator.calculate_covered_elements(Solution(temp_subsets)))
+        if temp_covered == current_covered:
+            solution.subsets.pop(i)
+    validator.complex_eval_without_fitness(solution)
+
+
+def bench_instance(file_name: str, solutions_count: int = 50):
+    """Time redundancy removal on bloated random covers.
+
+    Args:
+        file_name (str): Instance file inside the instances directory.
+        solutions_count (int): Number of solutions to clean up.
+    """
+    dl = DataLoader(file_name)
+    dl.fetch_data()
+    validator = Validator(dl)
+
+    random.seed(0)
+    solutions = []
+    for _ in range(solutions_count):
+        order = list(range(validator._m))
+        random.shuffle(order)
+        solution = Solution([])
+        while not solution.is_correct():
+            validator.add_subset(solution, order.pop())
+        solutions.append(solution.subsets)
+
+    print(f"=== {file_name} ({solutions_count} solutions) ===")
+    timings = {}
+    costs = {}
+    methods = {
+        "recompute": lambda sol: remove_redundant_by_recomputation(validator, sol),
+        "index": lambda sol: validator.eliminate_redundant_subsets(sol, "index"),
+        "reverse": lambda sol: validator.eliminate_redundant_subsets(sol, "reverse"),
+        "cost": lambda sol: validator.eliminate_redundant_subsets(sol, "cost"),
+    }
+    for name, method in methods.items():
+        cleaned = [Solution(list(subsets)) for subsets in solutions]
+        start_time = time.perf_counter()
+        for solution in cleaned:
+            method(solution)
+        timings[name] = time.perf_counter() - start_time
+        costs[name] = sum(sol.get_cost_sum() for sol in cleaned) / len(cleaned)
+
+    for name in methods:
+        print(
+            f"{name:>9}: {timings[name]:.3f} s, avg cost {costs[name]:.1f}, "
+            f"speedup {timings['recompute'] / timings[name]:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    bench_instance("scpd1.txt")
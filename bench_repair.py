@@ -0,0 +1,54 @@
+"""This file contains a benchmark of the repair methods (random vs coverage-aware) on broken solutions."""
+
+from DataLoader import DataLoader
+from validator import Validator
+from solution import Solution
+from mutations import Mutations
+from random_correct import RandomSolutionGenerator
+import random
+import time
+
+
+def bench_instance(file_name: str, solutions_count: int = 200, removed: int = 5):
+    """Time repair of random covers with some subsets removed, and compare resulting costs.
+
+    Args:
+        file_name (str): Instance file inside the instances directory.
+        solutions_count (int): Number of solutions to repair.
+        removed (int): Number of subsets removed from every solution.
+    """
+    dl = DataLoader(file_name)
+    dl.fetch_data()
+    validator = Validator(dl)
+
+    rng = random.Random(0)
+    rsg = RandomSolutionGenerator(validator)
+    broken = []
+    for _ in range(solutions_count):
+        subsets = list(rsg.generate_random_solution(rng).subsets)
+        rng.shuffle(subsets)
+        broken.append(subsets[removed:])
+
+    print(f"=== {file_name} ({solutions_count} solutions, {removed} subsets removed) ===")
+    timings = {}
+    for method in Mutations.REPAIR_METHODS:
+        solutions = [Solution(subsets) for subsets in broken]
+        method_rng = random.Random(1)
+        start_time = time.perf_counter()
+        repaired = [
+            Mutations.repair_solution(solution, validator, method_rng, method)
+            for solution in solutions
+        ]
+        timings[method] = time.perf_counter() - start_time
+        assert all(validator.is_correct(solution) for solution in repaired)
+        avg_cost = sum(validator.sum_costs(sol) for sol in repaired) / len(repaired)
+        avg_size = sum(len(sol.subsets) for sol in repaired) / len(repaired)
+        print(
+            f"{method:>9}: {timings[method]:.3f} s, avg cost {avg_cost:.1f}, "
+            f"avg subsets {avg_size:.1f}, speedup {timings['random'] / timings[method]:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    bench_instance("scp41.txt")
+    bench_instance("scpd1.txt")
@@ -0,0 +1,46 @@
+"""This file contains a benchmark of the Simulated Annealing engines (solution vs delta) on iterations per second."""
+
+from DataLoader import DataLoader
+from validator import Validator
+from simulated_annealing import SimulatedAnnealing
+from mutations import Mutations
+import time
+
+
+def bench_instance(file_name: str, iterations: int = 20000, seed: int = 0):
+    """Run both SA engines with every repair method and compare speed and final cost.
+
+    Args:
+        file_name (str): Instance file inside the instances directory.
+        iterations (int): Number of iterations of every run.
+        seed (int): Seed of every run.
+    """
+    dl = DataLoader(file_name)
+    dl.fetch_data()
+    validator = Validator(dl)
+
+    print(f"=== {file_name} ({iterations} iterations) ===")
+    for repair_method in Mutations.REPAIR_METHODS:
+        rates = {}
+        for engine in ["solution", "delta"]:
+            sa = SimulatedAnnealing(
+                validator, seed=seed, repair_method=repair_method, engine=engine
+            )
+            start_time = time.perf_counter()
+            best = sa.run(
+                initial_temp=100.0,
+                min_temp=1e-6,
+                cooling_rate=0.9995,
+                max_iterations=iterations,
+            )
+            elapsed = time.perf_counter() - start_time
+            rates[engine] = iterations / elapsed
+            print(
+                f"{repair_method:>9} {engine:>8}: {elapsed:.2f} s, "
+                f"{rates[engine]:.0f} it/s, best cost {best.get_cost_sum()}"
+            )
+        print(f"{'':>9} speedup {rates['delta'] / rates['solution']:.1f}x")
+
+
+if __name__ == "__main__":
+    bench_instance("scp41.txt")
@@ -0,0 +1,328 @@
+"""This file contains the headless benchmark harness - solvers over the instances directory with regression tracking.
+
+Usage:
+    python benchmark.py --output results.json
+    python benchmark.py --baseline results.json --output new.json
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+from DataLoader import DataLoader
+from evolutionary import EvolutionaryAlgorithm
+from greedy import GreedySolutionGenerator
+from random_correct import RandomSolutionGenerator
+from rng import make_rng
+from simulated_annealing import SimulatedAnnealing
+from stopping import WallClockBudget
+from validator import Validator
+
+SOLVERS = ["greedy", "random", "ea", "sa"]
+
+# Optimal costs of the OR-Library instances
+KNOWN_OPTIMA = {
+    "scp41.txt": 429,
+    "scp51.txt": 253,
+    "scpa1.txt": 253,
+    "scpb1.txt": 69,
+    "scpc1.txt": 227,
+    "scpd1.txt": 60,
+}
+
+# Runs shorter than this (seconds) are too noisy to compare time and throughput
+MIN_TIMED_RUN = 0.1
+
+BUDGETS = {
+    "full": {
+        "random_solutions": 200,
+        "ea_population": 50,
+        "ea_generations": 100,
+        "sa_iterations": 20000,
+        "time_limit": 60.0,
+    },
+    "quick": {
+        "random_solutions": 20,
+        "ea_population": 20,
+        "ea_generations": 10,
+        "sa_iterations": 2000,
+        "time_limit": 10.0,
+    },
+}
+
+
+def _peak_memory_kb() -> Optional[int]:
+    """Peak resident memory of this process in KiB, None if unknown"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak  # Bytes on macOS
+
+
+def _solve(validator, solver: str, seed: int, budget: dict):
+    """Run one solver, return its best solution, number of evaluations and stop reason"""
+    stopping = WallClockBudget(budget["time_limit"])
+    with contextlib.redirect_stdout(io.StringIO()):
+        if solver == "greedy":
+            best = GreedySolutionGenerator(validator)._generate_greedy_solution()
+            return best, 1, None
+        if solver == "random":
+            rng = make_rng(seed)
+            generator = RandomSolutionGenerator(validator)
+            solutions = [
+                generator.generate_random_solution(rng)
+                for _ in range(budget["random_solutions"])
+            ]
+            best = min(solutions, key=lambda sol: sol.get_cost_sum())
+            return best, len(solutions), None
+        if solver == "ea":
+            ea = EvolutionaryAlgorithm(
+                validator, population_size=budget["ea_population"], seed=seed
+            )
+            best, best_history, _ = ea.run(
+                budget["ea_generations"], verbose=False, stopping=stopping
+            )
+            evaluations = budget["ea_population"] * (len(best_history) + 1)
+            return best, evaluations, ea.stop_reason
+        if solver == "sa":
+            sa = SimulatedAnnealing(validator, seed=seed)
+            best = sa.run(
+                cooling_rate=0.9995,
+                max_iterations=budget["sa_iterations"],
+                stopping=stopping,
+            )
+            return best, len(sa.history["iterations"]), sa.stop_reason
+    raise ValueError(f"Invalid solver: {solver}. Valid options: {SOLVERS}")
+
+
+def run_solver(instance: str, solver: str, seed: int, budget: dict) -> dict:
+    """Run one solver on one instance and measure it. Meant to run in a fresh process,
+    so peak memory belongs to this run only.
+
+    Peak resident memory (ru_maxrss) of short runs is dominated by the
+    interpreter and the instance, so the run is repeated with tracemalloc to
+    measure the peak of memory it allocates itself. Tracing slows allocations
+    down several times, so it is kept out of the timed run.
+
+    Args:
+        instance (str): Instance file inside the instances directory.
+        solver (str): One of SOLVERS.
+        seed (int): Seed of the run.
+        budget (dict): Run budget, see BUDGETS.
+
+    Returns:
+        dict: Measurements of the run
+    """
+    result = {"instance": instance, "solver": solver, "seed": seed}
+    try:
+        dl = DataLoader(instance)
+        dl.fetch_data(use_cache=True)
+    except (OSError, ValueError) as e:
+        result["error"] = str(e)
+        return result
+    validator = Validator(dl)
+
+    start_time = time.perf_counter()
+    best, evaluations, stop_reason = _solve(validator, solver, seed, budget)
+    elapsed = time.perf_counter() - start_time
+    peak_memory = _peak_memory_kb()
+
+    tracemalloc.start()
+    _solve(validator, solver, seed, budget)
+    _, peak_traced = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    validator.complex_eval_without_fitness(best)
+    optimum = KNOWN_OPTIMA.get(instance)
+    if stop_reason is not None:
+        result["stop_reason"] = stop_reason
+    result.update(
+        {
+            "time": elapsed,
+            "evaluations": evaluations,
+            "evaluations_per_second": evaluations / elapsed if elapsed > 0 else None,
+            "peak_memory_kb": peak_memory,
+            "peak_traced_kb": peak_traced // 1024,
+            "best_cost": best.get_cost_sum(),
+            "correct": best.is_correct(),
+            "optimum": optimum,
+            "gap": (best.get_cost_sum() - optimum) / optimum if optimum else None,
+        }
+    )
+    return result
+
+
+def list_instances() -> List[str]:
+    """Return instance files of the instances directory"""
+    directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), "instances")
+    return sorted(
+        name
+        for name in os.listdir(directory)
+        if os.path.isfile(os.path.join(directory, name))
+    )
+
+
+def run_benchmarks(
+    instances: List[str], solvers: List[str], seed: int, budget: dict
+) -> List[dict]:
+    """Run every solver on every instance, each in a fresh process.
+
+    Args:
+        instances (List[str]): Instance files.
+        solvers (List[str]): Solvers to run.
+        seed (int): Seed of every run.
+        budget (dict): Run budget, see BUDGETS.
+
+    Returns:
+        List[dict]: Measurements of all runs
+    """
+    results = []
+    context = multiprocessing.get_context("spawn")
+    for instance in instances:
+        for solver in solvers:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                result = executor.submit(
+                    run_solver, instance, solver, seed, budget
+                ).result()
+            results.append(result)
+            if "error" in result:
+                print(f"{instance:<22}{solver:<8} error: {result['error']}")
+            else:
+                gap = f"{result['gap']:.1%}" if result["gap"] is not None else "-"
+                print(
+                    f"{instance:<22}{solver:<8} cost {result['best_cost']:>7} "
+                    f"gap {gap:>7} {result['time']:>8.2f} s "
+                    f"{result['evaluations_per_second']:>10.1f} eval/s "
+                    f"{result['peak_memory_kb'] or 0:>8} KiB "
+                    f"({result['peak_traced_kb']} KiB traced)"
+                )
+    return results
+
+
+def compare_to_baseline(
+    results: List[dict], baseline: List[dict], tolerance: float
+) -> List[str]:
+    """Compare results with a baseline run.
+
+    Costs must not get worse, time, evaluations per second and peak memory may
+    get worse by at most tolerance (relative). Time and throughput of runs
+    shorter than MIN_TIMED_RUN seconds are not compared, memory always is.
+
+    Args:
+        results (List[dict]): Current results.
+        baseline (List[dict]): Baseline results.
+        tolerance (float): Allowed relative slowdown or memory growth.
+
+    Returns:
+        List[str]: Description of every regression
+    """
+    baseline_by_key = {(row["instance"], row["solver"]): row for row in baseline}
+    regressions = []
+    for row in results:
+        old = baseline_by_key.get((row["instance"], row["solver"]))
+        if old is None or "error" in row or "error" in old:
+            continue
+        name = f"{row['instance']} {row['solver']}"
+        if row["best_cost"] > old["best_cost"]:
+            regressions.append(
+                f"{name}: best cost {old['best_cost']} -> {row['best_cost']}"
+            )
+        for key, label in [
+            ("peak_memory_kb", "peak memory"),
+            ("peak_traced_kb", "peak traced memory"),
+        ]:
+            if (
+                old.get(key)
+                and row.get(key)
+                and row[key] > old[key] * (1 + tolerance)
+            ):
+                regressions.append(f"{name}: {label} {old[key]} KiB -> {row[key]} KiB")
+        if row["time"] < MIN_TIMED_RUN and old["time"] < MIN_TIMED_RUN:
+            continue  # Timings of such short runs are noise
+        if row["time"] > old["time"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: time {old['time']:.2f} s -> {row['time']:.2f} s"
+            )
+        if (
+            old["evaluations_per_second"]
+            and row["evaluations_per_second"]
+            < old["evaluations_per_second"] * (1 - tolerance)
+        ):
+            regressions.append(
+                f"{name}: evaluations/s {old['evaluations_per_second']:.1f} -> "
+                f"{row['evaluations_per_second']:.1f}"
+            )
+    return regressions
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--instances", nargs="+", help="Instance files (default: all in instances/)"
+    )
+    parser.add_argument("--solvers", nargs="+", choices=SOLVERS, default=SOLVERS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--budget", choices=sorted(BUDGETS), default="full")
+    parser.add_argument(
+        "--quick", action="store_true", help="Shortcut for --budget quick"
+    )
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--baseline", help="Results file to compare against")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed relative slowdown or memory growth (default 0.2)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        args.budget = "quick"
+    budget = BUDGETS[args.budget]
+    instances = args.instances or list_instances()
+    results = run_benchmarks(instances, args.solvers, args.seed, budget)
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "budget": args.budget,
+            **budget,
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare_to_baseline(results, baseline, args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} regression(s) against {args.baseline}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"No regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,13 +3,17 @@
 from solution import Solution
 from validator import Validator
 from mutations import Mutations
-import random
+from rng import RandomLike, as_random
 
 
 class Crossovers:
     @staticmethod
     def uniform_crossover(
-        parent1: Solution, parent2: Solution, validator: Validator
+        parent1: Solution,
+        parent2: Solution,
+        validator: Validator,
+        rng: RandomLike = None,
+        repair_method: str = "random",
     ) -> Solution:
         """Uniform crossover - randomly selects subsets from both parents.
 
@@ -17,25 +21,32 @@ class Crossovers:
             parent1 (Solution): First parent solution.
             parent2 (Solution): Second parent solution.
             validator (Validator): Validator to check the solution.
+            rng (random.Random or numpy.random.Generator, optional): Random number generator. Defaults to the global one.
+            repair_method (str): Repair method passed to Mutations.repair_solution. Default "random".
 
         Returns:
             Solution: A new solution created from the parents.
         """
+        rng = as_random(rng)
         combined = list(set(parent1.subsets + parent2.subsets))
         child_subsets = []
 
         for subset in combined:
-            if random.random() < 0.5:
+            if rng.random() < 0.5:
                 child_subsets.append(subset)
 
         child = Solution(child_subsets)
-        child = Mutations.repair_solution(child, validator)
+        child = Mutations.repair_solution(child, validator, rng, repair_method)
         validator.remove_redundant_subsets(child, continuous=True)
         return child
 
     @staticmethod
     def greedy_crossover(
-        parent1: Solution, parent2: Solution, validator: Validator
+        parent1: Solution,
+        parent2: Solution,
+        validator: Validator,
+        rng: RandomLike = None,
+        repair_method: str = "random",
     ) -> Solution:
         """Greedy crossover - combines subsets from both parents and optimizes them.
 
@@ -43,6 +54,8 @@ class Crossovers:
             parent1 (Solution): First parent solution.
             parent2 (Solution): Second parent solution.
             validator (Validator): Validator to check the solution.
+            rng (random.Random or numpy.random.Generator, optional): Random number generator. Defaults to the global one.
+            repair_method (str): Repair method passed to Mutations.repair_solution. Default "random".
         Returns:
             Solution: A new solution created from the parents.
         """
@@ -51,12 +64,16 @@ class Crossovers:
 
         validator.remove_redundant_subsets(child, continuous=True)
         if not child.is_correct():
-            child = Mutations.repair_solution(child, validator)
+            child = Mutations.repair_solution(child, validator, rng, repair_method)
         return child
 
     @staticmethod
     def pmx_crossover(
-        parent1: Solution, parent2: Solution, validator: Validator
+        parent1: Solution,
+        parent2: Solution,
+        validator: Validator,
+        rng: RandomLike = None,
+        repair_method: str = "random",
     ) -> Solution:
         """Modified PMX crossover - combines subsets from both parents for Set Cover Problem.
 
@@ -64,18 +81,20 @@ class Crossovers:
             parent1 (Solution): First parent solution.
             parent2 (Solution): Second parent solution.
             validator (Validator): Validator to check the solution.
+            rng (random.Random or numpy.random.Generator, optional): Random number generator. Defaults to the global one.
+            repair_method (str): Repair method passed to Mutations.repair_solution. Default "random".
         Returns:
             Solution: A new solution created from the parents.
         """
-        cut_start = random.randint(0, len(parent1.subsets) - 1)
-        cut_end = random.randint(cut_start, len(parent1.subsets))
-        child_subsets = parent1.subsets[cut_start:cut_end]
+        rng = as_random(rng)
+        cut_start = rng.randint(0, len(parent1.subsets) - 1)
+        cut_end = rng.randint(cut_start, len(parent1.subsets))
+        child = Solution(parent1.subsets[cut_start:cut_end])
 
         for subset in parent2.subsets:
-            if subset not in child_subsets:
-                child_subsets.append(subset)
+            if not child.contains(subset):
+                child.add(subset)
 
-        child = Solution(child_subsets)
-        child = Mutations.repair_solution(child, validator)
+        child = Mutations.repair_solution(child, validator, rng, repair_method)
         validator.remove_redundant_subsets(child, continuous=True)
         return child
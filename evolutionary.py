@@ -1,7 +1,16 @@
 """This file contains Evolutionary Algorithm (EA) implementation for the Set Cover Problem (SCP)."""
 
-from typing import List, Tuple
+from typing import List, Tuple, Union
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+import json
+import os
 import random
+from rng import SeedLike, make_rng, seed_sequence, spawn_seeds
 from solution import Solution
 from validator import Validator
 from population import PopulationGenerator
@@ -9,6 +18,52 @@ from selections import Selection
 from crossovers import Crossovers
 from mutations import Mutations
 from visualiser import plot_histories
+from stopping import StoppingCriterion, as_criteria, first_fired
+from profiling import Observer, section
+
+# Algorithm copy owned by a worker process of the "process" backend
+_worker_ea = None
+
+
+def _init_worker(ea: "EvolutionaryAlgorithm") -> None:
+    """Keep a read-only copy of the algorithm (and its Validator) in the worker process."""
+    global _worker_ea
+    _worker_ea = ea
+
+
+def _breed_in_worker(
+    population: List[Solution], batches: List[Tuple[int, int]]
+) -> List[Solution]:
+    """Breed several (count, seed) batches of offspring in a worker process."""
+    offspring = []
+    for count, seed in batches:
+        offspring.extend(_worker_ea._breed_offspring(population, count, seed))
+    return offspring
+
+
+# Validator copy owned by a worker process of a comparison sweep
+_worker_validator = None
+
+
+def _init_comparison_worker(validator: Validator) -> None:
+    """Keep a read-only copy of the Validator in the worker process."""
+    global _worker_validator
+    _worker_validator = validator
+
+
+def _run_comparison(
+    config: dict, generations: int, seed: int, validator: Validator = None
+) -> dict:
+    """Run the EA once with a configuration, in a worker process if validator is None."""
+    ea = EvolutionaryAlgorithm(
+        validator or _worker_validator, **{**config, "seed": seed}
+    )
+    best_solution, _, _ = ea.run(generations, verbose=False)
+    return {
+        "fitness": best_solution.get_cost_sum(),
+        "cost": best_solution.get_cost_sum(),
+        "subsets_count": len(best_solution.subsets),
+    }
 
 
 class EvolutionaryAlgorithm:
@@ -23,6 +78,13 @@ class EvolutionaryAlgorithm:
         crossover_method: str = "uniform",  # uniform, greedy, pmx
         mutation_method: str = "swap",  # add, remove, swap
         selection_method: str = "tournament",  # tournament, roulette
+        repair_method: str = "random",  # random, random_cover, cheapest, ratio
+        backend: str = "serial",  # serial, thread, process
+        workers: int = None,
+        batch_size: int = 25,
+        seed: SeedLike = None,
+        observer: Observer = None,
+        repair_methods: dict = None,
     ):
         """
         Initialize the Evolutionary Algorithm.
@@ -37,6 +99,17 @@ class EvolutionaryAlgorithm:
             crossover_method: Crossover method ("uniform", "greedy", "pmx")
             mutation_method: Mutation method ("add", "remove", "swap")
             selection_method: Selection method ("tournament", "roulette")
+            repair_method: Repair method of crossovers and mutations ("random", "random_cover",
+                "cheapest", "ratio")
+            backend: Offspring generation backend ("serial", "thread", "process")
+            workers: Number of pool workers, defaults to the number of CPUs
+            batch_size: Number of offspring bred by one task with its own RNG stream
+            seed: Seed for reproducible runs - int, SeedSequence, random.Random or numpy
+                Generator, None draws it from the global random state
+            observer: Observer (e.g. profiling.Profiler) notified of timed sections, counters
+                and progress; with the "process" backend work done in workers is not reported
+            repair_methods: Repair method of single operators, overriding repair_method,
+                keyed by crossover or mutation method, e.g. {"swap": "ratio"}
         """
         self.validator = validator
         self.population_size = population_size
@@ -48,18 +121,35 @@ class EvolutionaryAlgorithm:
         self.crossover_method = crossover_method.lower()
         self.mutation_method = mutation_method.lower()
         self.selection_method = selection_method.lower()
+        self.repair_method = repair_method.lower()
+        self.repair_methods = {
+            operator.lower(): method.lower()
+            for operator, method in (repair_methods or {}).items()
+        }
+        self.backend = backend.lower()
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.seed = seed
+        self.observer = observer
 
         self._validate_methods()
 
         self.best_fitness_history = []
         self.avg_fitness_history = []
         self.best_solution = None
+        self.stop_reason = None
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["observer"] = None  # Workers of the "process" backend do not report
+        return state
 
     def _validate_methods(self) -> None:
         """Validate that the chosen methods are available."""
         valid_crossovers = ["uniform", "greedy", "pmx"]
         valid_mutations = ["add", "remove", "swap"]
         valid_selections = ["tournament", "roulette"]
+        valid_backends = ["serial", "thread", "process"]
 
         if self.crossover_method not in valid_crossovers:
             raise ValueError(
@@ -79,13 +169,44 @@ class EvolutionaryAlgorithm:
                 f"Valid options: {valid_selections}"
             )
 
+        if self.repair_method not in Mutations.REPAIR_METHODS:
+            raise ValueError(
+                f"Invalid repair method: {self.repair_method}. "
+                f"Valid options: {Mutations.REPAIR_METHODS}"
+            )
+
+        for operator, method in self.repair_methods.items():
+            if operator not in valid_crossovers + valid_mutations:
+                raise ValueError(
+                    f"Invalid repair operator: {operator}. "
+                    f"Valid options: {valid_crossovers + valid_mutations}"
+                )
+            if method not in Mutations.REPAIR_METHODS:
+                raise ValueError(
+                    f"Invalid repair method: {method}. "
+                    f"Valid options: {Mutations.REPAIR_METHODS}"
+                )
+
+        if self.backend not in valid_backends:
+            raise ValueError(
+                f"Invalid backend: {self.backend}. Valid options: {valid_backends}"
+            )
+
         print("EA Configuration:")
         print(f"  Crossover: {self.crossover_method}")
         print(f"  Mutation: {self.mutation_method}")
         print(f"  Selection: {self.selection_method}")
+        print(f"  Repair: {self.repair_method}")
+        if self.repair_methods:
+            print(f"  Repair per operator: {self.repair_methods}")
+        print(f"  Backend: {self.backend}")
 
     def run(
-        self, generations: int, verbose: bool = True, draw: bool = False
+        self,
+        generations: int,
+        verbose: bool = True,
+        draw: bool = False,
+        stopping: Union[StoppingCriterion, List[StoppingCriterion]] = None,
     ) -> Tuple[Solution, List[float], List[float]]:
         """
         Run the evolutionary algorithm for specified number of generations.
@@ -93,22 +214,94 @@ class EvolutionaryAlgorithm:
         Args:
             generations: Number of generations to run
             verbose: Whether to print progress information
+            draw: Whether to plot the progress after completion
+            stopping: Criteria checked after every generation, the run ends as soon
+                as any of them fires; stop_reason records which one ("generations"
+                if the run was not stopped early)
 
         Returns:
             Tuple of (best_solution, best_fitness_history, avg_fitness_history)
         """
+        # Root of the run's streams, every batch of offspring gets its own child stream
+        self._seed_sequence = seed_sequence(self.seed)
+        self._rng = make_rng(self._seed_sequence)
+        observer = self.observer
+        previous_observer = self.validator.observer
+        if observer is not None:
+            observer.on_start(self)
+            self.validator.observer = observer
+
+        executor = None
+        try:
+            if verbose:
+                print("Initializing population...")
+            with section(observer, "initial_population"):
+                population = PopulationGenerator.generate_initial_population(
+                    self.population_size, self.validator, self._rng
+                )
+
+            executor = self._create_executor()
+            population = self._evolve(
+                population, generations, executor, verbose, draw, stopping
+            )
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            self.validator.observer = previous_observer
+            if observer is not None:
+                observer.on_end(self)
+
         if draw:
-            best_history = []
-            avg_history = []
-            worst_history = []
-        if verbose:
-            print("Initializing population...")
-        population = PopulationGenerator.generate_initial_population(
-            self.population_size, self.validator
-        )
+            plot_histories(self._best_history, self._avg_history, self._worst_history)
+            input("Press Enter to close the graph window...")
+        return self.best_solution, self.best_fitness_history, self.avg_fitness_history
+
+    def _create_executor(self) -> Executor:
+        """Create the pool for the configured backend, None for serial runs."""
+        if self.backend == "thread":
+            return ThreadPoolExecutor(max_workers=self.workers)
+        if self.backend == "process":
+            return ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_init_worker, initargs=(self,)
+            )
+        return None
+
+    def _evolve(
+        self,
+        population: List[Solution],
+        generations: int,
+        executor: Executor,
+        verbose: bool,
+        draw: bool,
+        stopping: Union[StoppingCriterion, List[StoppingCriterion]] = None,
+    ) -> List[Solution]:
+        """Run the generational loop on a population.
+
+        Args:
+            population: Initial population
+            generations: Number of generations to run
+            executor: Pool used to breed offspring, None to breed in this process
+            verbose: Whether to print progress information
+            draw: Whether to record best/avg/worst histories for plotting
+            stopping: Criteria checked after every generation
+
+        Returns:
+            List[Solution]: Final population
+        """
+        criteria = as_criteria(stopping)
+        for criterion in criteria:
+            criterion.reset()
+        evaluations = 0
+        self.stop_reason = "generations"
+
+        if draw:
+            best_history = self._best_history = []
+            avg_history = self._avg_history = []
+            worst_history = self._worst_history = []
 
         for generation in range(generations):
-            self._evaluate_population(population)
+            with section(self.observer, "evaluation"):
+                self._evaluate_population(population)
 
             current_best = min(population, key=lambda sol: sol.get_cost_sum())
             current_worst = max(population, key=lambda sol: sol.get_cost_sum())
@@ -132,13 +325,27 @@ class EvolutionaryAlgorithm:
                     f"Avg fitness = {avg_fitness:.4f}, Best cost = {current_best.get_cost_sum()}"
                 )
 
-            new_population = self._create_new_population(population)
+            evaluations += len(population)
+            if criteria:
+                reason = first_fired(
+                    criteria, self.best_solution.get_cost_sum(), evaluations
+                )
+                if reason is not None:
+                    self.stop_reason = reason
+                    if verbose:
+                        print(f"Stopped after generation {generation}: {reason}")
+                    break
+
+            if self.observer is not None:
+                self.observer.on_step(
+                    self, generation, self.best_solution.get_cost_sum()
+                )
+
+            with section(self.observer, "breeding"):
+                new_population = self._create_new_population(population, executor)
             population = new_population
 
-        if draw:
-            plot_histories(best_history, avg_history, worst_history)
-            input("Press Enter to close the graph window...")
-        return self.best_solution, self.best_fitness_history, self.avg_fitness_history
+        return population
 
     def _evaluate_population(self, population: List[Solution]) -> None:
         """Evaluate all solutions in the population and update statistics.
@@ -146,20 +353,26 @@ class EvolutionaryAlgorithm:
         Args:
             population: List of solutions to evaluate
         """
-        fitness_values = []
-
-        for solution in population:
-            self.validator.complex_eval_without_fitness(solution)
-            fitness_values.append(solution.get_cost_sum())
+        costs, _, _ = self.validator.evaluate_batch(population)
+        fitness_values = costs.tolist()
 
         self.best_fitness_history.append(min(fitness_values))
         self.avg_fitness_history.append(sum(fitness_values) / len(fitness_values))
 
-    def _create_new_population(self, population: List[Solution]) -> List[Solution]:
+    def _create_new_population(
+        self, population: List[Solution], executor: Executor = None
+    ) -> List[Solution]:
         """Create a new population using selection, crossover, and mutation.
 
+        Offspring are bred in batches of batch_size, each with its own RNG stream
+        spawned from the run's SeedSequence, so a fixed seed gives the same
+        population on every backend. The process backend sends each worker one
+        task with its share of the batches, so the parents are pickled once
+        per worker and generation.
+
         Args:
             population: List of current solutions
+            executor: Pool used to breed offspring, None to breed in this process
 
         Returns:
             List[Solution]: New population of solutions
@@ -172,81 +385,155 @@ class EvolutionaryAlgorithm:
             ]
             new_population.extend([Solution(list(sol.subsets)) for sol in elite])
 
-        while len(new_population) < self.population_size:
-            parents = self._perform_selection(population, num_parents=2)
+        remaining = self.population_size - len(new_population)
+        counts = []
+        while remaining > 0:
+            counts.append(min(self.batch_size, remaining))
+            remaining -= counts[-1]
+        batches = list(zip(counts, spawn_seeds(self._seed_sequence, len(counts))))
+
+        if executor is None:
+            for count, seed in batches:
+                new_population.extend(self._breed_offspring(population, count, seed))
+        elif self.backend == "process":
+            # One task per worker, so the population is pickled once per worker
+            # rather than once per batch; batches keep their seeds and order
+            tasks = min(self.workers, len(batches))
+            size, extra = divmod(len(batches), tasks)
+            futures = []
+            start = 0
+            for i in range(tasks):
+                end = start + size + (1 if i < extra else 0)
+                futures.append(
+                    executor.submit(_breed_in_worker, population, batches[start:end])
+                )
+                start = end
+            for future in futures:
+                new_population.extend(future.result())
+        else:
+            futures = [
+                executor.submit(self._breed_offspring, population, count, seed)
+                for count, seed in batches
+            ]
+            for future in futures:
+                new_population.extend(future.result())
+
+        return new_population[: self.population_size]
+
+    def _breed_offspring(
+        self, population: List[Solution], count: int, seed: int
+    ) -> List[Solution]:
+        """Breed a batch of offspring. They are evaluated together with the
+        rest of the next generation by _evaluate_population.
+
+        Args:
+            population: List of current solutions
+            count: Number of offspring to create
+            seed: Seed of the batch's RNG stream
+
+        Returns:
+            List[Solution]: Offspring
+        """
+        rng = random.Random(seed)
+        observer = self.observer
+        offspring = []
+        for _ in range(count):
+            with section(observer, "selection"):
+                parents = self._perform_selection(population, 2, rng)
             parent1, parent2 = parents[0], parents[1]
 
-            if random.random() < self.crossover_rate:
-                child = self._perform_crossover(parent1, parent2)
+            if rng.random() < self.crossover_rate:
+                with section(observer, "crossover"):
+                    child = self._perform_crossover(parent1, parent2, rng)
             else:
-                child = Solution(list(random.choice([parent1, parent2]).subsets))
+                child = Solution(list(rng.choice([parent1, parent2]).subsets))
 
-            if random.random() < self.mutation_rate:
-                child = self._perform_mutation(child)
+            if rng.random() < self.mutation_rate:
+                with section(observer, "mutation"):
+                    child = self._perform_mutation(child, rng)
 
-            self.validator.complex_eval_without_fitness(child)
-            new_population.append(child)
-
-        return new_population[: self.population_size]
+            offspring.append(child)
+        return offspring
 
     def _perform_selection(
-        self, population: List[Solution], num_parents: int
+        self, population: List[Solution], num_parents: int, rng: random.Random = None
     ) -> List[Solution]:
         """Perform selection based on the chosen method.
 
         Args:
             population: List of current solutions
             num_parents: Number of parents to select
+            rng: Random number generator
 
         Returns:
             List[Solution]: Selected parents
         """
         if self.selection_method == "tournament":
             return Selection.tournament_selection(
-                population, num_parents, self.tournament_size
+                population, num_parents, self.tournament_size, rng
             )
         elif self.selection_method == "roulette":
-            return Selection.roulette_selection(population, num_parents)
+            return Selection.roulette_selection(population, num_parents, rng)
         else:
             raise ValueError(f"Unknown selection method: {self.selection_method}")
 
-    def _perform_crossover(self, parent1: Solution, parent2: Solution) -> Solution:
+    def _perform_crossover(
+        self, parent1: Solution, parent2: Solution, rng: random.Random = None
+    ) -> Solution:
         """Perform crossover based on the chosen method.
 
         Args:
             parent1: First parent solution
             parent2: Second parent solution
+            rng: Random number generator
 
         Returns:
             Solution: Child solution created from parents
         """
+        repair_method = self._repair_method_of(self.crossover_method)
         if self.crossover_method == "uniform":
-            return Crossovers.uniform_crossover(parent1, parent2, self.validator)
+            return Crossovers.uniform_crossover(
+                parent1, parent2, self.validator, rng, repair_method
+            )
         elif self.crossover_method == "greedy":
-            return Crossovers.greedy_crossover(parent1, parent2, self.validator)
+            return Crossovers.greedy_crossover(
+                parent1, parent2, self.validator, rng, repair_method
+            )
         elif self.crossover_method == "pmx":
-            return Crossovers.pmx_crossover(parent1, parent2, self.validator)
+            return Crossovers.pmx_crossover(
+                parent1, parent2, self.validator, rng, repair_method
+            )
         else:
             raise ValueError(f"Unknown crossover method: {self.crossover_method}")
 
-    def _perform_mutation(self, solution: Solution) -> Solution:
+    def _perform_mutation(
+        self, solution: Solution, rng: random.Random = None
+    ) -> Solution:
         """Perform mutation based on the chosen method.
 
         Args:
             solution: Solution to mutate
+            rng: Random number generator
 
         Returns:
             Solution: Mutated solution
         """
+        repair_method = self._repair_method_of(self.mutation_method)
         if self.mutation_method == "add":
-            return Mutations.add_mutation(solution, self.validator)
+            return Mutations.add_mutation(solution, self.validator, rng, repair_method)
         elif self.mutation_method == "remove":
-            return Mutations.remove_mutation(solution, self.validator)
+            return Mutations.remove_mutation(
+                solution, self.validator, rng, repair_method
+            )
         elif self.mutation_method == "swap":
-            return Mutations.swap_mutation(solution, self.validator)
+            return Mutations.swap_mutation(solution, self.validator, rng, repair_method)
         else:
             raise ValueError(f"Unknown mutation method: {self.mutation_method}")
 
+    def _repair_method_of(self, operator: str) -> str:
+        """Return the repair method of a crossover or mutation operator."""
+        return self.repair_methods.get(operator, self.repair_method)
+
     def get_statistics(self) -> dict:
         """Get algorithm statistics.
 
@@ -265,6 +552,9 @@ class EvolutionaryAlgorithm:
             "crossover_method": self.crossover_method,
             "mutation_method": self.mutation_method,
             "selection_method": self.selection_method,
+            "repair_method": self.repair_method,
+            "repair_methods": self.repair_methods,
+            "stop_reason": self.stop_reason,
         }
 
     def set_parameters(
@@ -277,6 +567,8 @@ class EvolutionaryAlgorithm:
         crossover_method: str = None,
         mutation_method: str = None,
         selection_method: str = None,
+        repair_method: str = None,
+        repair_methods: dict = None,
     ) -> None:
         """Update algorithm parameters.
 
@@ -289,6 +581,8 @@ class EvolutionaryAlgorithm:
             crossover_method: New crossover method
             mutation_method: New mutation method
             selection_method: New selection method
+            repair_method: New repair method
+            repair_methods: New repair methods of single operators
         """
         if population_size is not None:
             self.population_size = population_size
@@ -306,8 +600,17 @@ class EvolutionaryAlgorithm:
             self.mutation_method = mutation_method.lower()
         if selection_method is not None:
             self.selection_method = selection_method.lower()
+        if repair_method is not None:
+            self.repair_method = repair_method.lower()
+        if repair_methods is not None:
+            self.repair_methods = {
+                operator.lower(): method.lower()
+                for operator, method in repair_methods.items()
+            }
 
-        if any([crossover_method, mutation_method, selection_method]):
+        if any(
+            [crossover_method, mutation_method, selection_method, repair_method]
+        ) or repair_methods is not None:
             self._validate_methods()
 
 
@@ -320,6 +623,10 @@ class EvolutionaryAlgorithmComparison:
         configurations: List[dict],
         generations: int = 100,
         runs_per_config: int = 5,
+        backend: str = "serial",
+        workers: int = None,
+        seed: SeedLike = None,
+        results_file: str = None,
     ) -> dict:
         """
         Compare different EA configurations.
@@ -329,46 +636,47 @@ class EvolutionaryAlgorithmComparison:
             configurations: List of configuration dictionaries
             generations: Number of generations per run
             runs_per_config: Number of runs per configuration
+            backend: Where runs execute ("serial", "process")
+            workers: Number of pool workers, defaults to the number of CPUs
+            seed: Root seed, every run gets its own stream spawned from it;
+                None draws one, or resumes with the one recorded in results_file
+            results_file: JSON lines file receiving every finished run; runs
+                already in it with the same seed are not repeated
 
         Returns:
             Dictionary with comparison results
         """
-        results = {}
-
-        for i, config in enumerate(configurations):
-            print(f"Testing configuration {i+1}/{len(configurations)}: {config}")
-
-            run_results = []
-            for run in range(runs_per_config):
-                ea = EvolutionaryAlgorithm(validator, **config)
-                best_solution, _, _ = ea.run(generations, verbose=False)
-                run_results.append(
-                    {
-                        "fitness": best_solution.get_cost_sum(),
-                        "cost": best_solution.get_cost_sum(),
-                        "subsets_count": len(best_solution.subsets),
-                    }
-                )
-
-            fitnesses = [r["fitness"] for r in run_results]
-            costs = [r["cost"] for r in run_results]
+        sweep = {
+            f"config_{i+1}": config for i, config in enumerate(configurations)
+        }
+        runs = EvolutionaryAlgorithmComparison._run_sweep(
+            validator,
+            sweep,
+            generations,
+            runs_per_config,
+            backend,
+            workers,
+            seed,
+            results_file,
+        )
 
-            results[f"config_{i+1}"] = {
+        results = {}
+        for name, config in sweep.items():
+            results[name] = {
                 "configuration": config,
-                "avg_fitness": sum(fitnesses) / len(fitnesses),
-                "best_fitness": min(fitnesses),
-                "worst_fitness": max(fitnesses),
-                "avg_cost": sum(costs) / len(costs),
-                "best_cost": min(costs),
-                "worst_cost": max(costs),
-                "runs": run_results,
+                **EvolutionaryAlgorithmComparison._summarize(runs[name]),
             }
-
         return results
 
     @staticmethod
     def compare_methods(
-        validator: Validator, generations: int = 100, runs_per_method: int = 3
+        validator: Validator,
+        generations: int = 100,
+        runs_per_method: int = 3,
+        backend: str = "serial",
+        workers: int = None,
+        seed: SeedLike = None,
+        results_file: str = None,
     ) -> dict:
         """
         Compare different combinations of crossover, mutation, and selection methods.
@@ -377,6 +685,12 @@ class EvolutionaryAlgorithmComparison:
             validator: Validator instance
             generations: Number of generations per run
             runs_per_method: Number of runs per method combination
+            backend: Where runs execute ("serial", "process")
+            workers: Number of pool workers, defaults to the number of CPUs
+            seed: Root seed, every run gets its own stream spawned from it;
+                None draws one, or resumes with the one recorded in results_file
+            results_file: JSON lines file receiving every finished run; runs
+                already in it with the same seed are not repeated
 
         Returns:
             Dictionary with method comparison results
@@ -385,54 +699,183 @@ class EvolutionaryAlgorithmComparison:
         mutation_methods = ["add", "remove", "swap"]
         selection_methods = ["tournament", "roulette"]
 
-        results = {}
-        total_combinations = (
-            len(crossover_methods) * len(mutation_methods) * len(selection_methods)
-        )
-        current_combination = 0
-
+        sweep = {}
         for crossover in crossover_methods:
             for mutation in mutation_methods:
                 for selection in selection_methods:
-                    current_combination += 1
-                    method_name = f"{crossover}_{mutation}_{selection}"
+                    sweep[f"{crossover}_{mutation}_{selection}"] = {
+                        "crossover_method": crossover,
+                        "mutation_method": mutation,
+                        "selection_method": selection,
+                    }
+        runs = EvolutionaryAlgorithmComparison._run_sweep(
+            validator,
+            sweep,
+            generations,
+            runs_per_method,
+            backend,
+            workers,
+            seed,
+            results_file,
+        )
 
-                    print(
-                        f"Testing combination {current_combination}/{total_combinations}: "
-                        f"Crossover={crossover}, Mutation={mutation}, Selection={selection}"
-                    )
+        results = {}
+        for method_name, config in sweep.items():
+            results[method_name] = {
+                "crossover": config["crossover_method"],
+                "mutation": config["mutation_method"],
+                "selection": config["selection_method"],
+                **EvolutionaryAlgorithmComparison._summarize(runs[method_name]),
+            }
+        return results
+
+    @staticmethod
+    def _summarize(run_results: List[dict]) -> dict:
+        """Aggregate the runs of one configuration."""
+        fitnesses = [r["fitness"] for r in run_results]
+        costs = [r["cost"] for r in run_results]
+        return {
+            "avg_fitness": sum(fitnesses) / len(fitnesses),
+            "best_fitness": min(fitnesses),
+            "worst_fitness": max(fitnesses),
+            "avg_cost": sum(costs) / len(costs),
+            "best_cost": min(costs),
+            "worst_cost": max(costs),
+            "runs": run_results,
+        }
+
+    @staticmethod
+    def _run_sweep(
+        validator: Validator,
+        sweep: dict,
+        generations: int,
+        runs: int,
+        backend: str,
+        workers: int,
+        seed: SeedLike,
+        results_file: str,
+    ) -> dict:
+        """
+        Run every configuration of a sweep a number of times.
+
+        Seeds are spawned in sweep order (configuration, then run), so a run's
+        seed depends only on the root seed and its position, not on the
+        backend or on which runs a resumed sweep still has to do. Finished
+        runs are printed and appended to results_file as they complete.
+
+        Args:
+            validator: Validator instance
+            sweep: Configuration dictionary of every name
+            generations: Number of generations per run
+            runs: Number of runs per configuration
+            backend: Where runs execute ("serial", "process")
+            workers: Number of pool workers, defaults to the number of CPUs
+            seed: Root seed of the sweep, None to draw one - or to take the
+                root seed of the last run recorded in results_file
+            results_file: JSON lines file of finished runs, None to keep none;
+                recorded runs are reused only if their seed matches
 
-                    run_results = []
-                    for run in range(runs_per_method):
-                        ea = EvolutionaryAlgorithm(
-                            validator,
-                            crossover_method=crossover,
-                            mutation_method=mutation,
-                            selection_method=selection,
-                        )
-                        best_solution, _, _ = ea.run(generations, verbose=False)
-                        run_results.append(
-                            {
-                                "fitness": best_solution.get_cost_sum(),
-                                "cost": best_solution.get_cost_sum(),
-                                "subsets_count": len(best_solution.subsets),
-                            }
-                        )
-
-                    fitnesses = [r["fitness"] for r in run_results]
-                    costs = [r["cost"] for r in run_results]
-
-                    results[method_name] = {
-                        "crossover": crossover,
-                        "mutation": mutation,
-                        "selection": selection,
-                        "avg_fitness": sum(fitnesses) / len(fitnesses),
-                        "best_fitness": min(fitnesses),
-                        "worst_fitness": max(fitnesses),
-                        "avg_cost": sum(costs) / len(costs),
-                        "best_cost": min(costs),
-                        "worst_cost": max(costs),
-                        "runs": run_results,
+        Returns:
+            Dictionary mapping names to their run results, in run order
+        """
+        if backend not in ["serial", "process"]:
+            raise ValueError(
+                f"Invalid backend: {backend}. Valid options: ['serial', 'process']"
+            )
+
+        records = []
+        if results_file is not None and os.path.exists(results_file):
+            with open(results_file) as f:
+                records = [json.loads(line) for line in f if line.strip()]
+
+        if seed is None and records and "root_seed" in records[-1]:
+            # Without an explicit seed, continue the sweep the file was started with
+            root = seed_sequence(records[-1]["root_seed"])
+            print(f"Resuming with root seed {root.entropy} of {results_file}")
+        else:
+            root = seed_sequence(seed)
+        seeds = spawn_seeds(root, len(sweep) * runs)
+        positions = {name: i for i, name in enumerate(sweep)}
+        finished = {name: {} for name in sweep}
+        skipped = 0
+        for record in records:
+            name = record["name"]
+            run = record["run"]
+            if (
+                name in finished
+                and record["configuration"] == sweep[name]
+                and record["generations"] == generations
+                and run < runs
+            ):
+                # Runs of another root seed would mix two seed streams
+                if record["seed"] == seeds[positions[name] * runs + run]:
+                    finished[name][run] = record["result"]
+                else:
+                    skipped += 1
+        if skipped:
+            print(
+                f"Ignoring {skipped} runs of {results_file} made with a different seed"
+            )
+
+        tasks = [
+            (name, run, seeds[i * runs + run])
+            for i, name in enumerate(sweep)
+            for run in range(runs)
+            if run not in finished[name]
+        ]
+        total = len(sweep) * runs
+        done = total - len(tasks)
+        if done:
+            print(f"Resuming with {done}/{total} runs already finished")
+
+        output = open(results_file, "a") if results_file is not None else None
+
+        def record(name: str, run: int, task_seed: int, result: dict) -> None:
+            nonlocal done
+            done += 1
+            finished[name][run] = result
+            print(
+                f"Run {done}/{total}: {name} #{run + 1} - cost {result['cost']}"
+            )
+            if output is not None:
+                entry = {
+                    "name": name,
+                    "run": run,
+                    "seed": task_seed,
+                    "root_seed": root.entropy,
+                    "generations": generations,
+                    "configuration": sweep[name],
+                    "result": result,
+                }
+                output.write(json.dumps(entry) + "\n")
+                output.flush()
+
+        try:
+            if backend == "serial":
+                for name, run, task_seed in tasks:
+                    result = _run_comparison(
+                        sweep[name], generations, task_seed, validator
+                    )
+                    record(name, run, task_seed, result)
+            elif tasks:
+                with ProcessPoolExecutor(
+                    max_workers=min(workers or os.cpu_count() or 1, len(tasks)),
+                    initializer=_init_comparison_worker,
+                    initargs=(validator,),
+                ) as executor:
+                    futures = {
+                        executor.submit(
+                            _run_comparison, sweep[name], generations, task_seed
+                        ): (name, run, task_seed)
+                        for name, run, task_seed in tasks
                     }
+                    for future in as_completed(futures):
+                        record(*futures[future], future.result())
+        finally:
+            if output is not None:
+                output.close()
 
-        return results
+        return {
+            name: [results[run] for run in range(runs)]
+            for name, results in finished.items()
+        }
@@ -2,13 +2,62 @@
 
 from validator import Validator
 from solution import Solution
-from typing import Set, List
+from typing import Set, List, Optional, Sequence
+from concurrent.futures import ProcessPoolExecutor
+import heapq
+import os
 import time
 
+# Generator owned by a worker process of generate_population_parallel
+_worker_generator = None
+
+
+def _init_worker(
+    validator: Validator, method: str, priority_costs: Optional[List[float]]
+) -> None:
+    """Create the worker's generator once, so instance data is shipped per worker, not per task."""
+    global _worker_generator
+    _worker_generator = GreedySolutionGenerator(
+        validator, method=method, priority_costs=priority_costs
+    )
+
+
+def _generate_in_worker(start_subset: int) -> Optional[Solution]:
+    """Generate one greedy solution in a worker process, None if it failed or is incorrect."""
+    try:
+        solution = _worker_generator._generate_greedy_solution(start_subset)
+    except Exception:
+        return None
+    return solution if solution.is_correct() else None
+
 
 class GreedySolutionGenerator:
-    def __init__(self, validator: Validator) -> None:
+    def __init__(
+        self,
+        validator: Validator,
+        method: str = "lazy",
+        priority_costs: Optional[Sequence[float]] = None,
+    ) -> None:
+        """Initialize the greedy generator.
+
+        Args:
+            validator (Validator): Validator instance for the Set Cover Problem.
+            method (str): Subset selection method - "lazy" (priority queue) or "scan" (full rescan every round).
+            priority_costs (Sequence[float], optional): Positive costs used in the selection ratio instead of
+                the subset costs, e.g. LagrangianBound.priority_costs(). Solutions are still evaluated with
+                the real costs.
+        """
         self.validator = validator
+        self.priority_costs = (
+            [float(cost) for cost in priority_costs]
+            if priority_costs is not None
+            else None
+        )
+        self.method = method.lower()
+        if self.method not in ["lazy", "scan"]:
+            raise ValueError(
+                f"Invalid greedy method: {self.method}. Valid options: ['lazy', 'scan']"
+            )
 
     def _generate_greedy_solution(self, start_subset: int = None) -> Solution:
         """Generates a greedy solution, selecting subsets with the best ratio of new elements to cost.
@@ -19,8 +68,28 @@ class GreedySolutionGenerator:
         Returns:
             Solution: A greedy solution that covers all elements.
         """
+        if self.method == "lazy":
+            solution_subsets = self._select_subsets_lazy(start_subset)
+        else:
+            solution_subsets = self._select_subsets_scan(start_subset)
+
+        solution = Solution(solution_subsets)
+        self.validator.complex_eval(solution)
+        self.validator.remove_redundant_subsets_for_greedy(solution, continuous=True)
+        self.validator.complex_eval(solution)
+        return solution
+
+    def _select_subsets_scan(self, start_subset: int = None) -> List[int]:
+        """Select greedy subsets by rescanning every available subset each round.
+
+        Args:
+            start_subset (int, optional): Starting subset index.
+
+        Returns:
+            List[int]: Selected subsets in order of selection.
+        """
         n = self.validator._n
-        costs = self.validator._costs
+        costs = self.priority_costs or self.validator._costs
         covers = self.validator._covers
 
         all_elements = set(range(n))
@@ -55,11 +124,67 @@ class GreedySolutionGenerator:
             covered.update(covers[best_subset])
             available_subsets.remove(best_subset)
 
-        solution = Solution(solution_subsets)
-        self.validator.complex_eval(solution)
-        self.validator.remove_redundant_subsets_for_greedy(solution, continuous=True)
-        self.validator.complex_eval(solution)
-        return solution
+        return solution_subsets
+
+    def _select_subsets_lazy(self, start_subset: int = None) -> List[int]:
+        """Select greedy subsets using a max-heap of cost-effectiveness ratios.
+
+        Heap entries are upper bounds, because the number of new elements a subset
+        brings can only drop. A popped entry is re-evaluated and pushed back if stale,
+        otherwise it is the best subset of the round. Ties are broken by the lower
+        index, which gives exactly the same selection as the scan method.
+
+        Args:
+            start_subset (int, optional): Starting subset index.
+
+        Returns:
+            List[int]: Selected subsets in order of selection.
+        """
+        n = self.validator._n
+        m = self.validator._m
+        costs = self.priority_costs or self.validator._costs
+        covers = self.validator._covers
+        element_covers = self.validator._element_covers
+
+        # Number of not yet covered elements in each subset
+        new_counts = [len(set(cover)) for cover in covers]
+        covered = [False] * n
+        uncovered_count = n
+        solution_subsets = []
+
+        def cover_with(subset: int) -> None:
+            nonlocal uncovered_count
+            for e in covers[subset]:
+                if not covered[e]:
+                    covered[e] = True
+                    uncovered_count -= 1
+                    for s in element_covers[e]:
+                        new_counts[s] -= 1
+
+        if start_subset is not None and 0 <= start_subset < m:
+            solution_subsets.append(start_subset)
+            cover_with(start_subset)
+
+        heap = [
+            (-new_counts[s] / costs[s], s)
+            for s in range(m)
+            if new_counts[s] > 0 and s != start_subset
+        ]
+        heapq.heapify(heap)
+
+        while uncovered_count > 0 and heap:
+            neg_ratio, subset = heapq.heappop(heap)
+            if new_counts[subset] == 0:
+                continue
+            ratio = new_counts[subset] / costs[subset]
+            if ratio != -neg_ratio:
+                heapq.heappush(heap, (-ratio, subset))
+                continue
+
+            solution_subsets.append(subset)
+            cover_with(subset)
+
+        return solution_subsets
 
     def generate_population(self) -> List[Solution]:
         """Generates m solutions each starting from a different subset.
@@ -84,6 +209,40 @@ class GreedySolutionGenerator:
         print(f"Time it took to generate: {elapsed_time:.2f} seconds")
         return solutions
 
+    def generate_population_parallel(
+        self, max_workers: int = None, chunksize: int = None
+    ) -> List[Solution]:
+        """Generates m solutions each starting from a different subset, using a process pool.
+
+        Args:
+            max_workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+            chunksize (int, optional): Start subsets sent to a worker at once. Chosen automatically if None.
+
+        Returns:
+            List[Solution]: A list of greedy solutions, in the same order as generate_population.
+        """
+        m = self.validator._m
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if chunksize is None:
+            chunksize = max(1, m // (max_workers * 4))
+
+        start_time = time.time()
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(self.validator, self.method, self.priority_costs),
+        ) as executor:
+            results = executor.map(_generate_in_worker, range(m), chunksize=chunksize)
+            solutions = [solution for solution in results if solution is not None]
+        end_time = time.time()
+        elapsed_time = end_time - start_time
+        print(
+            f"Time it took to generate {len(solutions)} solutions "
+            f"with {max_workers} workers: {elapsed_time:.2f} seconds"
+        )
+        return solutions
+
     def get_best_solution(self, solutions: List[Solution]) -> Solution:
         """Returns the best solution from a list of solutions.
 
@@ -0,0 +1,91 @@
+"""This file contains IndexPool class - a reusable set of unselected subset indices used by the operators."""
+
+import random
+from typing import Iterable
+
+
+class IndexPool:
+    """Set of available indices 0..m-1 with O(1) remove, insert and random sampling.
+
+    Indices are kept in a permutation array with a position map. The first
+    `size` entries of the permutation are the available indices, removing one
+    swaps it behind that boundary. Swaps are logged and reset() undoes them, so
+    the pool can be reused by every operator call without allocating and the
+    permutation (and so sampling with a seeded RNG) does not depend on earlier
+    calls.
+    """
+
+    __slots__ = ("_perm", "_pos", "_size", "_swaps")
+
+    def __init__(self, m: int) -> None:
+        self._perm = list(range(m))
+        self._pos = list(range(m))
+        self._size = m
+        self._swaps = []
+
+    def reset(self) -> None:
+        """Make all indices available again, in O(number of changes since the last reset)"""
+        perm = self._perm
+        pos = self._pos
+        swaps = self._swaps
+        while swaps:
+            a, b = swaps.pop()
+            index_a, index_b = perm[a], perm[b]
+            perm[a], perm[b] = index_b, index_a
+            pos[index_a], pos[index_b] = b, a
+        self._size = len(perm)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, index: int) -> bool:
+        return self._pos[index] < self._size
+
+    def discard(self, index: int) -> None:
+        """Remove an index from the available ones (no-op if already removed)"""
+        pos = self._pos[index]
+        last = self._size - 1
+        if pos > last:
+            return
+        perm = self._perm
+        moved = perm[last]
+        perm[pos], perm[last] = moved, index
+        self._pos[moved], self._pos[index] = pos, last
+        self._swaps.append((pos, last))
+        self._size = last
+
+    def discard_all(self, indices: Iterable[int]) -> None:
+        """Remove several indices from the available ones"""
+        for index in indices:
+            self.discard(index)
+
+    def add(self, index: int) -> None:
+        """Make an index available again (no-op if already available)"""
+        pos = self._pos[index]
+        first = self._size
+        if pos < first:
+            return
+        perm = self._perm
+        moved = perm[first]
+        perm[pos], perm[first] = moved, index
+        self._pos[moved], self._pos[index] = pos, first
+        self._swaps.append((pos, first))
+        self._size = first + 1
+
+    def sample(self, rng: random.Random = None) -> int:
+        """Return a random available index (the pool must not be empty)
+
+        Args:
+            rng (random.Random, optional): Random number generator. Defaults to the global one.
+        """
+        return self._perm[(rng or random).randrange(self._size)]
+
+    def pop_random(self, rng: random.Random = None) -> int:
+        """Remove and return a random available index (the pool must not be empty)
+
+        Args:
+            rng (random.Random, optional): Random number generator. Defaults to the global one.
+        """
+        index = self.sample(rng)
+        self.discard(index)
+        return index
@@ -0,0 +1,160 @@
+"""This file contains the binary instance cache used by DataLoader (memory-mapped on load)."""
+
+import hashlib
+import os
+import struct
+import zlib
+from typing import Optional, Tuple
+import numpy as np
+
+CACHE_DIR_NAME = "__cache__"
+_MAGIC = b"SCPC"
+_VERSION = 1
+# magic, version, n, m, nnz, source size, source mtime (ns), source sha256, payload crc32
+_HEADER = struct.Struct("<4sIQQQQq32sI")
+_HEADER_SIZE = 128  # Header is padded, so the int32 payload is aligned
+
+CachedInstance = Tuple[int, int, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def cache_path_for(source_path: str) -> str:
+    """Return path of the cache file of an instance file
+
+    Args:
+        source_path (str): Path to instance file
+
+    Returns:
+        str: Path to cache file, inside __cache__ next to the instance file
+    """
+    directory, name = os.path.split(source_path)
+    return os.path.join(directory, CACHE_DIR_NAME, name + ".bin")
+
+
+def _file_sha256(path: str) -> bytes:
+    """Hash file content"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def load_cache(source_path: str, verify: bool = False) -> Optional[CachedInstance]:
+    """Memory-map the cached arrays of an instance file.
+
+    The cache is used if the source file's size and mtime match the stored ones,
+    or if its content hash still matches. Missing, stale or truncated caches give
+    None. The payload checksum reads the whole cache, so it is only checked when
+    asked for or when the source's mtime changed; a cache matching by size and
+    mtime is trusted and stays memory-mapped without being read.
+
+    Args:
+        source_path (str): Path to instance file
+        verify (bool): If True, also check the payload checksum of a cache
+            matching by size and mtime, so corrupted caches give None
+
+    Returns:
+        Optional[CachedInstance]: (n, m, costs, element_indptr, element_indices,
+            subset_indptr, subset_indices) as read-only memory-mapped int32 arrays,
+            or None if there is no valid cache
+    """
+    path = cache_path_for(source_path)
+    try:
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+        magic, version, n, m, nnz, size, mtime_ns, sha256, crc = _HEADER.unpack(header)
+    except (OSError, struct.error):
+        return None
+    if magic != _MAGIC or version != _VERSION:
+        return None
+
+    stat = os.stat(source_path)
+    if (stat.st_size, stat.st_mtime_ns) != (size, mtime_ns):
+        verify = True
+        if _file_sha256(source_path) != sha256:
+            return None
+        # Same content with a new mtime, remember it to skip hashing next time
+        header = _HEADER.pack(
+            magic, version, n, m, nnz, stat.st_size, stat.st_mtime_ns, sha256, crc
+        )
+        try:
+            with open(path, "r+b") as f:
+                f.write(header)
+        except OSError:
+            pass
+
+    payload_length = m + (n + 1) + nnz + (m + 1) + nnz
+    if os.path.getsize(path) != _HEADER_SIZE + payload_length * 4:
+        return None
+    payload = np.memmap(
+        path, dtype=np.int32, mode="r", offset=_HEADER_SIZE, shape=(payload_length,)
+    )
+    if verify and zlib.crc32(payload) != crc:
+        return None
+
+    bounds = np.cumsum([0, m, n + 1, nnz, m + 1, nnz])
+    costs, element_indptr, element_indices, subset_indptr, subset_indices = (
+        payload[start:end] for start, end in zip(bounds[:-1], bounds[1:])
+    )
+    if element_indptr[-1] != nnz or subset_indptr[-1] != nnz:
+        return None
+    return n, m, costs, element_indptr, element_indices, subset_indptr, subset_indices
+
+
+def store_cache(
+    source_path: str,
+    n: int,
+    m: int,
+    costs: np.ndarray,
+    element_indptr: np.ndarray,
+    element_indices: np.ndarray,
+    subset_indptr: np.ndarray,
+    subset_indices: np.ndarray,
+) -> None:
+    """Write the cache file of an instance file.
+
+    The file is written under a temporary name and renamed, so readers in other
+    processes never see a partial cache.
+
+    Args:
+        source_path (str): Path to instance file
+        n (int): Number of elements
+        m (int): Number of subsets
+        costs (np.ndarray): Cost of each subset
+        element_indptr (np.ndarray): CSR row pointers of subsets covering each element
+        element_indices (np.ndarray): CSR indices of subsets covering each element
+        subset_indptr (np.ndarray): CSR row pointers of elements covered by each subset
+        subset_indices (np.ndarray): CSR indices of elements covered by each subset
+    """
+    payload = np.concatenate(
+        [
+            np.asarray(array, dtype=np.int32)
+            for array in (
+                costs,
+                element_indptr,
+                element_indices,
+                subset_indptr,
+                subset_indices,
+            )
+        ]
+    )
+    stat = os.stat(source_path)
+    header = _HEADER.pack(
+        _MAGIC,
+        _VERSION,
+        n,
+        m,
+        len(element_indices),
+        stat.st_size,
+        stat.st_mtime_ns,
+        _file_sha256(source_path),
+        zlib.crc32(payload),
+    )
+
+    path = cache_path_for(source_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(header.ljust(_HEADER_SIZE, b"\0"))
+        f.write(payload.tobytes())
+    os.replace(temp_path, path)
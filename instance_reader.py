@@ -0,0 +1,183 @@
+"""This file contains the streaming OR-Library instance reader used by DataLoader."""
+
+import bz2
+import gzip
+import lzma
+import re
+from array import array
+from itertools import islice
+from typing import BinaryIO, Iterator, Tuple
+import numpy as np
+
+_TOKEN = re.compile(rb"\S+")
+_COMPRESSED_FORMATS = (
+    (b"\x1f\x8b", gzip.open),
+    (b"BZh", bz2.open),
+    (b"\xfd7zXZ\x00", lzma.open),
+)
+
+
+def open_instance(file_path: str) -> BinaryIO:
+    """Open an instance file for binary reading, decompressing gzip, bz2 and xz
+    files transparently (detected by their magic bytes).
+
+    Args:
+        file_path (str): Path to instance file
+
+    Returns:
+        BinaryIO: Buffered binary stream of the (decompressed) file
+    """
+    with open(file_path, "rb") as f:
+        magic = f.read(6)
+    for prefix, opener in _COMPRESSED_FORMATS:
+        if magic.startswith(prefix):
+            return opener(file_path, "rb")
+    return open(file_path, "rb")
+
+
+class IntTokenizer:
+    """Generator of integers from a binary stream, read and converted chunk by chunk.
+
+    Tokens are numbered from 0 in the order they are produced. offset_of maps a
+    token number back to its byte offset (in the decompressed stream) for error
+    messages; it is exact for tokens of the current chunk.
+    """
+
+    def __init__(self, stream: BinaryIO, chunk_size: int = 1 << 16) -> None:
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._chunk_base = 0  # Byte offset of the current chunk
+        self._chunk_data = b""
+        self._chunk_first = 0  # Number of the first token in the current chunk
+        self._chunk_count = 0
+        self.bytes_read = 0
+        self._tokens = self._read_tokens()
+
+    def _read_tokens(self) -> Iterator[int]:
+        tail = b""
+        while True:
+            chunk = self._stream.read(self._chunk_size)
+            data = tail + chunk
+            self.bytes_read += len(chunk)
+            parts = data.split()
+            tail = b""
+            if chunk and parts and not data[-1:].isspace():
+                # Last token may continue in the next chunk
+                tail = parts.pop()
+            self._chunk_first += self._chunk_count
+            self._chunk_count = len(parts)
+            self._chunk_base = self.bytes_read - len(data)
+            self._chunk_data = data[: len(data) - len(tail)]
+            try:
+                values = list(map(int, parts))
+            except ValueError:
+                for match in _TOKEN.finditer(self._chunk_data):
+                    if not match.group().lstrip(b"+-").isdigit():
+                        raise ValueError(
+                            f"Invalid integer {match.group().decode(errors='replace')!r} "
+                            f"at byte offset {self._chunk_base + match.start()}"
+                        ) from None
+                raise
+            yield from values
+            if not chunk:
+                return
+
+    def __iter__(self) -> Iterator[int]:
+        return self._tokens
+
+    def offset_of(self, token: int) -> int:
+        """Return byte offset of a token, or of the current chunk if the token is not in it
+
+        Args:
+            token (int): Token number
+        """
+        index = token - self._chunk_first
+        if index >= 0:
+            for i, match in enumerate(_TOKEN.finditer(self._chunk_data)):
+                if i == index:
+                    return self._chunk_base + match.start()
+        return self._chunk_base
+
+
+def read_instance(
+    file_path: str,
+) -> Tuple[int, int, np.ndarray, np.ndarray, np.ndarray]:
+    """Parse an OR-Library set cover instance without materialising its lines.
+
+    Format: n m, then m subset costs, then for every element the number of
+    subsets covering it followed by their one-based indices. Line breaks are
+    irrelevant.
+
+    Args:
+        file_path (str): Path to (optionally compressed) instance file
+
+    Returns:
+        Tuple of (n, m, costs, element_indptr, element_indices) with zero-based
+        subset indices in element_indices
+    """
+    with open_instance(file_path) as stream:
+        tokens = IntTokenizer(stream)
+        values = iter(tokens)
+        header = list(islice(values, 2))
+        if not header:
+            raise ValueError("File is empty or unreadable.")
+        if len(header) < 2:
+            raise ValueError(
+                f"Unexpected end of file when reading number of subsets "
+                f"(byte offset {tokens.bytes_read})."
+            )
+        n_elements, n_subsets = header
+        if n_elements <= 0 or n_subsets <= 0:
+            raise ValueError(
+                f"Invalid instance: n_elements={n_elements}, n_subsets={n_subsets}"
+            )
+
+        costs = np.fromiter(islice(values, n_subsets), dtype=np.int32)
+        if len(costs) < n_subsets:
+            raise ValueError(
+                f"Not enough cost entries: expected {n_subsets}, got {len(costs)} "
+                f"(end of file at byte offset {tokens.bytes_read})"
+            )
+        consumed = 2 + n_subsets
+
+        element_indptr = np.empty(n_elements + 1, dtype=np.int32)
+        element_indptr[0] = 0
+        element_indices = array("i")
+        for e in range(n_elements):
+            count = next(values, None)
+            if count is None:
+                raise ValueError(
+                    f"Unexpected end of file when reading element covers "
+                    f"(element {e + 1} of {n_elements}, byte offset {tokens.bytes_read})."
+                )
+            if count < 0:
+                raise ValueError(
+                    f"Negative cover count {count} for element {e + 1} "
+                    f"at byte offset {tokens.offset_of(consumed)}"
+                )
+            consumed += 1
+            start = len(element_indices)
+            element_indices.extend(islice(values, count))
+            end = len(element_indices)
+            if end - start < count:
+                raise ValueError(
+                    f"Not enough subset indices for element {e + 1}: expected {count}, "
+                    f"got {end - start} (end of file at byte offset {tokens.bytes_read})"
+                )
+            if count and not (
+                1 <= min(element_indices[start:end])
+                and max(element_indices[start:end]) <= n_subsets
+            ):
+                for k in range(start, end):
+                    if not 1 <= element_indices[k] <= n_subsets:
+                        break
+                raise ValueError(
+                    f"Subset index {element_indices[k]} out of range 1..{n_subsets} "
+                    f"for element {e + 1} at byte offset {tokens.offset_of(consumed + k - start)}"
+                )
+            consumed += count
+            element_indptr[e + 1] = end
+
+    # One-based to zero-based subset indices
+    element_indices = np.frombuffer(element_indices, dtype=np.int32) - 1
+    return n_elements, n_subsets, costs, element_indptr, element_indices
@@ -0,0 +1,276 @@
+"""This file contains the island model Evolutionary Algorithm (EA) for the Set Cover Problem (SCP)."""
+
+from typing import List, Tuple, Union
+from concurrent.futures import ProcessPoolExecutor
+from rng import SeedLike, make_rng, seed_sequence, spawn_seeds
+from solution import Solution
+from validator import Validator
+from evolutionary import EvolutionaryAlgorithm
+from population import PopulationGenerator
+from stopping import StoppingCriterion, as_criteria, first_fired
+
+# Island algorithms owned by a worker process
+_worker_islands = None
+
+
+def _init_worker(islands: List[EvolutionaryAlgorithm]) -> None:
+    """Keep the islands (sharing one Validator) in the worker process."""
+    global _worker_islands
+    _worker_islands = islands
+
+
+def _run_island_epoch(
+    index: int, population: List[Solution], generations: int, seed: int
+) -> Tuple[List[Solution], List[float], List[float], Solution]:
+    """Evolve one island for a number of generations in a worker process."""
+    return _evolve_island(_worker_islands[index], population, generations, seed)
+
+
+def _evolve_island(
+    island: EvolutionaryAlgorithm,
+    population: List[Solution],
+    generations: int,
+    seed: int,
+) -> Tuple[List[Solution], List[float], List[float], Solution]:
+    """Evolve an island, creating its initial population when population is None.
+
+    Returns:
+        Tuple of (population, best_fitness_history, avg_fitness_history, best_solution)
+    """
+    island._seed_sequence = seed_sequence(seed)
+    island._rng = make_rng(island._seed_sequence)
+    island.best_solution = None
+    island.best_fitness_history = []
+    island.avg_fitness_history = []
+    if population is None:
+        population = PopulationGenerator.generate_initial_population(
+            island.population_size, island.validator, island._rng
+        )
+    population = island._evolve(population, generations, None, False, False)
+    return (
+        population,
+        island.best_fitness_history,
+        island.avg_fitness_history,
+        island.best_solution,
+    )
+
+
+class IslandEvolutionaryAlgorithm(EvolutionaryAlgorithm):
+    def __init__(
+        self,
+        validator: Validator,
+        island_configs: List[dict],
+        migration_interval: int = 10,
+        migration_size: int = 2,
+        topology: str = "ring",  # ring, full
+        backend: str = "process",  # serial, process
+        workers: int = None,
+        seed: SeedLike = None,
+        **defaults,
+    ):
+        """
+        Initialize the island model Evolutionary Algorithm.
+
+        Every island is a separate EvolutionaryAlgorithm with its own population and
+        operator configuration. Islands evolve independently (in separate processes
+        for the "process" backend) and every migration_interval generations they
+        send their best solutions to neighbouring islands, replacing the worst ones.
+
+        Args:
+            validator: Validator instance for the Set Cover Problem
+            island_configs: One dictionary of EvolutionaryAlgorithm arguments per island
+            migration_interval: Number of generations between migrations
+            migration_size: Number of best solutions each island sends
+            topology: Migration topology ("ring", "full")
+            backend: Where islands run ("serial", "process")
+            workers: Number of worker processes, defaults to the number of CPUs
+            seed: Seed for reproducible runs (see EvolutionaryAlgorithm), None draws it from the global random state
+            defaults: EvolutionaryAlgorithm arguments shared by all islands
+        """
+        super().__init__(
+            validator, backend=backend, workers=workers, seed=seed, **defaults
+        )
+        if not island_configs:
+            raise ValueError("At least one island configuration is required.")
+        if self.backend not in ["serial", "process"]:
+            raise ValueError(
+                f"Invalid backend: {self.backend}. Valid options: ['serial', 'process']"
+            )
+        self.topology = topology.lower()
+        if self.topology not in ["ring", "full"]:
+            raise ValueError(
+                f"Invalid topology: {self.topology}. Valid options: ['ring', 'full']"
+            )
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+
+        self.islands = [
+            EvolutionaryAlgorithm(validator, **{**defaults, **config})
+            for config in island_configs
+        ]
+        self.island_best_histories = []
+        self.island_avg_histories = []
+
+    def run(
+        self,
+        generations: int,
+        verbose: bool = True,
+        draw: bool = False,
+        stopping: Union[StoppingCriterion, List[StoppingCriterion]] = None,
+    ) -> Tuple[Solution, List[float], List[float]]:
+        """
+        Run all islands for specified number of generations with periodic migration.
+
+        Per-island histories are kept in island_best_histories and
+        island_avg_histories.
+
+        Args:
+            generations: Number of generations to run on each island
+            verbose: Whether to print progress information
+            draw: Unused, kept for compatibility with EvolutionaryAlgorithm.run
+            stopping: Criteria checked after every migration epoch (islands
+                evolve independently in between), with the best cost over all
+                islands and the evaluations of all islands; stop_reason records
+                which one fired ("generations" if the run was not stopped early)
+
+        Returns:
+            Tuple of (best_solution, best_fitness_history, avg_fitness_history),
+            the histories being the best and average over islands per generation
+        """
+        criteria = as_criteria(stopping)
+        for criterion in criteria:
+            criterion.reset()
+        evaluations = 0
+        self.stop_reason = "generations"
+        self._seed_sequence = seed_sequence(self.seed)
+        islands_count = len(self.islands)
+        self.best_solution = None
+        self.island_best_histories = [[] for _ in range(islands_count)]
+        self.island_avg_histories = [[] for _ in range(islands_count)]
+        populations = [None] * islands_count
+
+        executor = None
+        if self.backend == "process":
+            executor = ProcessPoolExecutor(
+                max_workers=min(self.workers, islands_count),
+                initializer=_init_worker,
+                initargs=(self.islands,),
+            )
+
+        try:
+            done = 0
+            while done < generations:
+                epoch = min(self.migration_interval, generations - done)
+                seeds = spawn_seeds(self._seed_sequence, islands_count)
+                if executor is None:
+                    results = [
+                        _evolve_island(island, populations[i], epoch, seeds[i])
+                        for i, island in enumerate(self.islands)
+                    ]
+                else:
+                    futures = [
+                        executor.submit(
+                            _run_island_epoch, i, populations[i], epoch, seeds[i]
+                        )
+                        for i in range(islands_count)
+                    ]
+                    results = [future.result() for future in futures]
+
+                for i, (population, best_history, avg_history, best) in enumerate(
+                    results
+                ):
+                    populations[i] = population
+                    self.island_best_histories[i].extend(best_history)
+                    self.island_avg_histories[i].extend(avg_history)
+                    evaluations += len(best_history) * self.islands[i].population_size
+                    if (
+                        self.best_solution is None
+                        or best.get_cost_sum() < self.best_solution.get_cost_sum()
+                    ):
+                        self.best_solution = best
+
+                done += epoch
+                if verbose:
+                    print(
+                        f"Generation {done}: Best cost = {self.best_solution.get_cost_sum()}, "
+                        f"Island best = {[h[-1] for h in self.island_best_histories]}"
+                    )
+                if criteria:
+                    reason = first_fired(
+                        criteria, self.best_solution.get_cost_sum(), evaluations
+                    )
+                    if reason is not None:
+                        self.stop_reason = reason
+                        if verbose:
+                            print(f"Stopped after generation {done}: {reason}")
+                        break
+                if done < generations and islands_count > 1:
+                    self._migrate(populations)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        self.best_fitness_history = [
+            min(costs) for costs in zip(*self.island_best_histories)
+        ]
+        self.avg_fitness_history = [
+            sum(costs) / len(costs) for costs in zip(*self.island_avg_histories)
+        ]
+        return self.best_solution, self.best_fitness_history, self.avg_fitness_history
+
+    def _migrate(self, populations: List[List[Solution]]) -> None:
+        """Send copies of each island's best solutions to its neighbours,
+        replacing their worst solutions.
+
+        Args:
+            populations: Current population of every island, modified in place
+        """
+        for population in populations:
+            for solution in population:
+                self.validator.complex_eval_without_fitness(solution)
+
+        migrants = [
+            sorted(population, key=lambda sol: sol.get_cost_sum())[
+                : self.migration_size
+            ]
+            for population in populations
+        ]
+
+        islands_count = len(populations)
+        for target in range(islands_count):
+            if self.topology == "ring":
+                sources = [(target - 1) % islands_count]
+            else:
+                sources = [i for i in range(islands_count) if i != target]
+            incoming = [sol.copy() for i in sources for sol in migrants[i]]
+
+            population = populations[target]
+            population.sort(key=lambda sol: sol.get_cost_sum())
+            incoming = incoming[: len(population)]
+            population[len(population) - len(incoming) :] = incoming
+
+    def get_statistics(self) -> dict:
+        """Get algorithm statistics.
+
+        Returns:
+            dict: Dictionary with statistics
+        """
+        if not self.best_solution:
+            return {}
+
+        return {
+            "best_fitness": self.best_solution.get_cost_sum(),
+            "best_cost": self.best_solution.get_cost_sum(),
+            "best_subsets": sorted(self.best_solution.subsets),
+            "num_subsets": len(self.best_solution.subsets),
+            "generations_run": len(self.best_fitness_history),
+            "islands": [
+                {
+                    "crossover_method": island.crossover_method,
+                    "mutation_method": island.mutation_method,
+                    "selection_method": island.selection_method,
+                    "best_fitness": min(history) if history else None,
+                }
+                for island, history in zip(self.islands, self.island_best_histories)
+            ],
+        }
@@ -0,0 +1,216 @@
+"""This file contains LagrangianBound class - a Lagrangian relaxation lower bound for the Set Cover Problem (SCP)."""
+
+from typing import Optional
+from DataLoader import DataLoader
+import math
+import numpy as np
+
+
+class LagrangianBound:
+    def __init__(self, dl: DataLoader) -> None:
+        """Initialize the Lagrangian relaxation of an instance.
+
+        Relaxing the cover constraints with multipliers u >= 0 gives the bound
+        L(u) = sum(u) + sum(min(0, c_j - sum of u over elements of j)), optimised
+        with subgradient steps. Everything is computed on the nonzeros of the
+        subset CSR arrays, so an iteration is a few bincounts.
+
+        Args:
+            dl (DataLoader): Loaded instance data.
+        """
+        self._n = dl.get_n()
+        self._m = dl.get_m()
+        self._costs = dl.get_cost_array().astype(np.float64)
+        subset_csr = dl.get_subset_csr()
+        # Element and subset of every nonzero of the matrix
+        self._rows = subset_csr.indices.astype(np.intp)
+        self._cols = np.repeat(np.arange(self._m), subset_csr.row_lengths())
+        self._dl = dl
+
+        self.lagrangian_value = -math.inf
+        self.lower_bound = 0
+        self.upper_bound = None
+        self.multipliers = None
+        self.reduced_costs = None
+        self.history = []
+        self.iterations = 0
+
+    def _evaluate(self, multipliers: np.ndarray):
+        """Return (L(u), reduced costs, subsets selected by the relaxation)"""
+        reduced_costs = self._costs - np.bincount(
+            self._cols, weights=multipliers[self._rows], minlength=self._m
+        )
+        selected = reduced_costs < 0
+        value = multipliers.sum() + reduced_costs[selected].sum()
+        return value, reduced_costs, selected
+
+    def _initial_multipliers(self) -> np.ndarray:
+        """Cheapest cost per element over the subsets covering each element"""
+        sizes = np.bincount(self._cols, minlength=self._m)
+        per_element = self._costs[self._cols] / sizes[self._cols]
+        multipliers = np.full(self._n, np.inf)
+        np.minimum.at(multipliers, self._rows, per_element)
+        multipliers[np.isinf(multipliers)] = 0.0
+        return multipliers
+
+    def _greedy_upper_bound(self) -> int:
+        """Cost of a lazy greedy solution"""
+        from validator import Validator
+        from greedy import GreedySolutionGenerator
+
+        generator = GreedySolutionGenerator(Validator(self._dl))
+        return generator._generate_greedy_solution().get_cost_sum()
+
+    def run(
+        self,
+        upper_bound: Optional[int] = None,
+        max_iterations: int = 1000,
+        step_factor: float = 2.0,
+        halve_after: int = 30,
+        min_step_factor: float = 0.005,
+    ) -> int:
+        """Optimise the multipliers with subgradient steps.
+
+        The step is step_factor * (1.05 * upper_bound - L(u)) / |g|^2, step_factor
+        is halved after halve_after iterations without improving the bound.
+
+        Args:
+            upper_bound (int, optional): Cost of a known solution, a greedy solution is used if None.
+            max_iterations (int): Maximum number of subgradient iterations.
+            step_factor (float): Initial step factor.
+            halve_after (int): Iterations without improvement before halving the step factor.
+            min_step_factor (float): Stop once the step factor gets below this value.
+
+        Returns:
+            int: Lower bound on the optimal cost (rounded up, as costs are integers)
+        """
+        if upper_bound is None:
+            upper_bound = self._greedy_upper_bound()
+        self.upper_bound = upper_bound
+        self.history = []
+
+        multipliers = self._initial_multipliers()
+        best_value = -math.inf
+        without_improvement = 0
+        for _ in range(max_iterations):
+            value, reduced_costs, selected = self._evaluate(multipliers)
+            self.history.append(value)
+            if value > best_value + 1e-9:
+                best_value = value
+                self.multipliers = multipliers.copy()
+                self.reduced_costs = reduced_costs
+                without_improvement = 0
+            else:
+                without_improvement += 1
+                if without_improvement >= halve_after:
+                    step_factor /= 2
+                    without_improvement = 0
+                    if step_factor < min_step_factor:
+                        break
+            if math.ceil(best_value - 1e-6) >= upper_bound:
+                break  # upper_bound is proven optimal
+
+            # Subgradient - 1 minus the number of selected subsets covering each element
+            subgradient = 1.0 - np.bincount(
+                self._rows, weights=selected[self._cols], minlength=self._n
+            )
+            subgradient[(multipliers <= 0) & (subgradient < 0)] = 0.0
+            norm = subgradient @ subgradient
+            if norm == 0:
+                break  # Relaxed solution is a cover with complementary slackness
+            step = step_factor * (1.05 * upper_bound - value) / norm
+            multipliers = np.maximum(multipliers + step * subgradient, 0.0)
+
+        self.iterations = len(self.history)
+        self.lagrangian_value = best_value
+        self.lower_bound = max(math.ceil(best_value - 1e-6), 0)
+        return self.lower_bound
+
+    def gap(self, cost: float) -> float:
+        """Relative gap of a solution cost to the lower bound
+
+        Args:
+            cost (float): Cost of a solution
+
+        Returns:
+            float: (cost - lower_bound) / lower_bound, 0 if the bound is 0
+        """
+        if self.lower_bound <= 0:
+            return 0.0
+        return (cost - self.lower_bound) / self.lower_bound
+
+    def _require_run(self) -> None:
+        if self.reduced_costs is None:
+            raise ValueError("Lower bound has not been computed yet, call run() first.")
+
+    def fixed_columns(self, upper_bound: Optional[int] = None) -> np.ndarray:
+        """Subsets that every solution cheaper than upper_bound contains.
+
+        Leaving out a subset with negative reduced cost c_j raises the bound to
+        L(u) - c_j, if that reaches upper_bound the subset can be fixed.
+
+        Args:
+            upper_bound (int, optional): Cost to beat, defaults to the one used by run().
+
+        Returns:
+            np.ndarray: Indices of subsets that can be fixed
+        """
+        self._require_run()
+        upper_bound = self.upper_bound if upper_bound is None else upper_bound
+        forced_bound = np.ceil(self.lagrangian_value - self.reduced_costs - 1e-6)
+        return np.flatnonzero(
+            (self.reduced_costs < 0) & (forced_bound >= upper_bound)
+        )
+
+    def excluded_columns(self, upper_bound: Optional[int] = None) -> np.ndarray:
+        """Subsets that no solution cheaper than upper_bound contains.
+
+        Adding a subset with non-negative reduced cost c_j raises the bound to
+        L(u) + c_j, if that reaches upper_bound the subset can be excluded.
+
+        Args:
+            upper_bound (int, optional): Cost to beat, defaults to the one used by run().
+
+        Returns:
+            np.ndarray: Indices of subsets that can be excluded
+        """
+        self._require_run()
+        upper_bound = self.upper_bound if upper_bound is None else upper_bound
+        forced_bound = np.ceil(self.lagrangian_value + self.reduced_costs - 1e-6)
+        return np.flatnonzero(
+            (self.reduced_costs >= 0) & (forced_bound >= upper_bound)
+        )
+
+    def priority_costs(self, floor: float = 1e-3) -> np.ndarray:
+        """Reduced costs usable in place of costs to bias subset choices (e.g.
+        GreedySolutionGenerator's priority_costs), clipped to floor * cost so they
+        stay positive.
+
+        Args:
+            floor (float): Minimum value as a fraction of the subset's cost.
+
+        Returns:
+            np.ndarray: Positive priority cost of each subset
+        """
+        self._require_run()
+        return np.maximum(self.reduced_costs, floor * self._costs)
+
+
+if __name__ == "__main__":
+    import time
+
+    known_optima = {"scp41.txt": 429, "scpa1.txt": 253, "scpd1.txt": 60}
+    for file_name, optimum in known_optima.items():
+        dl = DataLoader(file_name)
+        dl.fetch_data()
+        bound = LagrangianBound(dl)
+        start_time = time.perf_counter()
+        lower_bound = bound.run()
+        elapsed = time.perf_counter() - start_time
+        print(
+            f"{file_name}: lower bound {lower_bound} (optimum {optimum}), "
+            f"greedy {bound.upper_bound}, gap {bound.gap(bound.upper_bound):.1%}, "
+            f"{bound.iterations} iterations in {elapsed:.2f} s, "
+            f"{len(bound.fixed_columns())} fixed / "
+            f"{len(bound.excluded_columns())} excluded of {dl.get_m()} subsets"
+        )
@@ -12,7 +12,7 @@ from visualiser import EA_Graph
 
 # Testing
 dl = DataLoader("scp41.txt")
-dl.fetch_data()
+dl.fetch_data(use_cache=True)
 vd = Validator(dl)
 # Example 1: Testing the Evolutionary Algorithm
 print("=== Basic EA with User-Defined Methods ===")
@@ -1,112 +1,222 @@
 """This file contains different mutation methods for the Evolutionary Algorithm (EA) implementation as well as for the Simulated Annealing (SA) algorithm."""
 
+from typing import List
 from solution import Solution
 from validator import Validator
-import random
+from profiling import section
+from rng import RandomLike, as_random
 
 
 class Mutations:
+    REPAIR_METHODS = ["random", "random_cover", "cheapest", "ratio"]
+
     @staticmethod
-    def repair_solution(solution: Solution, validator: Validator) -> Solution:
-        """Add random subsets to the solution until it is valid.
+    def repair_solution(
+        solution: Solution,
+        validator: Validator,
+        rng: RandomLike = None,
+        repair_method: str = "random",
+    ) -> Solution:
+        """Add subsets to the solution until it is valid.
+
+        "random" adds random unselected subsets. "random_cover", "cheapest" and
+        "ratio" go over the uncovered elements only and cover each one still
+        uncovered with a random subset containing it, the cheapest one, or the
+        one of lowest cost per newly covered element; subsets made redundant
+        are dropped afterwards.
 
         Args:
             solution (Solution): Solution to repair.
             validator (Validator): Validator to check the solution.
+            rng (random.Random or numpy.random.Generator, optional): Random number generator. Defaults to the global one.
+            repair_method (str): Repair method - "random", "random_cover", "cheapest" or "ratio".
+                Default "random".
 
         Returns:
             Solution: A valid solution.
         """
-        temp_solution = Solution(list(solution.subsets))
-        validator.complex_eval_without_fitness(temp_solution)
+        if repair_method not in Mutations.REPAIR_METHODS:
+            raise ValueError(
+                f"Invalid repair method: {repair_method}. "
+                f"Valid options: {Mutations.REPAIR_METHODS}"
+            )
+        observer = validator.observer
+        with section(observer, "repair"):
+            rng = as_random(rng)
+            temp_solution = solution.copy()
+            if temp_solution._cover_counts is None:
+                validator.init_coverage_state(temp_solution)
+            if temp_solution.is_correct():
+                return temp_solution
+
+            if repair_method == "random":
+                available = validator.unselected_pool(temp_solution)
+                while not temp_solution.is_correct() and available:
+                    validator.add_subset(temp_solution, available.pop_random(rng))
+                    if observer is not None:
+                        observer.on_count("repair_additions")
+                return temp_solution
+
+            costs = validator._costs
+            cover_masks = validator._cover_masks
+            covers_by_cost = validator._get_element_covers_by_cost()
+            counts = temp_solution._cover_counts
+            uncovered = [e for e, count in enumerate(counts) if count == 0]
+            uncovered_mask = validator._to_mask(uncovered)
+            for e in uncovered:
+                candidates = covers_by_cost[e]
+                if counts[e] or not candidates:
+                    continue  # Covered by a subset added earlier, or cannot be covered
+                if repair_method == "random_cover":
+                    subset_to_add = rng.choice(validator._element_covers[e])
+                elif repair_method == "cheapest":
+                    subset_to_add = candidates[0]
+                else:
+                    subset_to_add = Mutations._lowest_ratio(
+                        candidates, costs, cover_masks, uncovered_mask
+                    )
+                validator.add_subset(temp_solution, subset_to_add)
+                uncovered_mask &= ~cover_masks[subset_to_add]
+                if observer is not None:
+                    observer.on_count("repair_additions")
+
+            validator.eliminate_redundant_subsets(temp_solution, order="cost")
+            return temp_solution
 
-        current_subsets = set(temp_solution.subsets)
-        all_subsets = set(range(validator._m))
-        available = list(all_subsets - current_subsets)
+    @staticmethod
+    def _lowest_ratio(
+        candidates: List[int],
+        costs: List[int],
+        cover_masks: List[int],
+        uncovered_mask: int,
+        excluded: int = -1,
+    ) -> int:
+        """Return the candidate of lowest cost per newly covered element.
+
+        Candidates must be sorted by (cost, index). No subset covers more than
+        all uncovered elements, so once cost / their number reaches the best
+        ratio no later candidate can beat it and the scan stops. Ties go to
+        the lowest index.
 
-        while not temp_solution.is_correct() and available:
-            subset_to_add = random.choice(available)
-            temp_solution.subsets.append(subset_to_add)
-            available.remove(subset_to_add)
-            validator.complex_eval_without_fitness(temp_solution)
+        Args:
+            candidates (List[int]): Subsets covering an uncovered element, sorted by (cost, index).
+            costs (List[int]): Cost of every subset.
+            cover_masks (List[int]): Cover bitmask of every subset.
+            uncovered_mask (int): Bitmask of uncovered elements.
+            excluded (int): Subset that must not be chosen, -1 for none.
 
-        return temp_solution
+        Returns:
+            int: Index of the chosen subset, -1 if there is no candidate
+        """
+        uncovered_count = uncovered_mask.bit_count()
+        best_subset = -1
+        best_ratio = float("inf")
+        for j in candidates:
+            if costs[j] / uncovered_count > best_ratio:
+                break
+            if j == excluded:
+                continue
+            ratio = costs[j] / (cover_masks[j] & uncovered_mask).bit_count()
+            if ratio < best_ratio or (ratio == best_ratio and j < best_subset):
+                best_subset = j
+                best_ratio = ratio
+        return best_subset
 
     @staticmethod
-    def add_mutation(solution: Solution, validator: Validator) -> Solution:
+    def add_mutation(
+        solution: Solution,
+        validator: Validator,
+        rng: RandomLike = None,
+        repair_method: str = "random",
+    ) -> Solution:
         """Adds a random subset to the solution and repairs it if necessary.
 
         Args:
             solution (Solution): Solution to mutate.
             validator (Validator): Validator to check the solution.
+            rng (random.Random or numpy.random.Generator, optional): Random number generator. Defaults to the global one.
+            repair_method (str): Repair method passed to repair_solution. Default "random".
 
         Returns:
             Solution: A mutated solution.
         """
-        current_subsets = set(solution.subsets)
-        all_subsets = set(range(validator._m))
-        available = list(all_subsets - current_subsets)
+        rng = as_random(rng)
+        available = validator.unselected_pool(solution)
 
+        new_solution = solution.copy()
         if available:
-            subset_to_add = random.choice(available)
-            new_subsets = solution.subsets + [subset_to_add]
-        else:
-            new_subsets = list(solution.subsets)
+            validator.add_subset(new_solution, available.sample(rng))
 
-        new_solution = Solution(new_subsets)
-        new_solution = Mutations.repair_solution(new_solution, validator)
+        new_solution = Mutations.repair_solution(
+            new_solution, validator, rng, repair_method
+        )
         return new_solution
 
     @staticmethod
-    def remove_mutation(solution: Solution, validator: Validator) -> Solution:
+    def remove_mutation(
+        solution: Solution,
+        validator: Validator,
+        rng: RandomLike = None,
+        repair_method: str = "random",
+    ) -> Solution:
         """Deletes a random subset from the solution and repairs it if necessary.
 
         Args:
             solution (Solution): Solution to mutate.
             validator (Validator): Validator to check the solution.
+            rng (random.Random or numpy.random.Generator, optional): Random number generator. Defaults to the global one.
+            repair_method (str): Repair method passed to repair_solution. Default "random".
 
         Returns:
             Solution: A mutated solution.
         """
+        rng = as_random(rng)
         if not solution.subsets:
             return Solution(list(solution.subsets))
 
-        index_to_remove = random.randrange(len(solution.subsets))
-        new_subsets = list(solution.subsets)
-        del new_subsets[index_to_remove]
+        index_to_remove = rng.randrange(len(solution.subsets))
+        new_solution = solution.copy()
+        validator.remove_subset(new_solution, solution.subsets[index_to_remove])
 
-        new_solution = Solution(new_subsets)
-        new_solution = Mutations.repair_solution(new_solution, validator)
+        new_solution = Mutations.repair_solution(
+            new_solution, validator, rng, repair_method
+        )
         return new_solution
 
     @staticmethod
-    def swap_mutation(solution: Solution, validator: Validator) -> Solution:
+    def swap_mutation(
+        solution: Solution,
+        validator: Validator,
+        rng: RandomLike = None,
+        repair_method: str = "random",
+    ) -> Solution:
         """Swaps a random subset in the solution with a random one and repairs it if necessary.
 
         Args:
             solution (Solution): Solution to mutate.
             validator (Validator): Validator to check the solution.
+            rng (random.Random or numpy.random.Generator, optional): Random number generator. Defaults to the global one.
+            repair_method (str): Repair method passed to repair_solution. Default "random".
 
         Returns:
             Solution: A mutated solution.
         """
+        rng = as_random(rng)
         if not solution.subsets:
             return Solution(list(solution.subsets))
 
-        current_subsets = set(solution.subsets)
-        all_subsets = set(range(validator._m))
-        available = list(all_subsets - current_subsets)
-
+        available = validator.unselected_pool(solution)
         if not available:
             return Solution(list(solution.subsets))
 
-        index_to_remove = random.randrange(len(solution.subsets))
-        subset_to_add = random.choice(available)
+        index_to_remove = rng.randrange(len(solution.subsets))
+        subset_to_add = available.sample(rng)
 
-        new_subsets = list(solution.subsets)
-        del new_subsets[index_to_remove]
-        new_subsets.append(subset_to_add)
+        new_solution = solution.copy()
+        validator.remove_subset(new_solution, solution.subsets[index_to_remove])
+        validator.add_subset(new_solution, subset_to_add)
 
-        new_solution = Solution(new_subsets)
-        new_solution = Mutations.repair_solution(new_solution, validator)
+        new_solution = Mutations.repair_solution(
+            new_solution, validator, rng, repair_method
+        )
         return new_solution
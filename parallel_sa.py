@@ -0,0 +1,271 @@
+"""This file contains the multi-chain (parallel tempering) Simulated Annealing algorithm for the Set Cover Problem (SCP)."""
+
+from typing import List, Literal, Tuple
+from concurrent.futures import ProcessPoolExecutor
+import math
+import os
+import random
+from rng import SeedLike, make_rng, seed_sequence, spawn_seeds
+from validator import Validator
+from solution import Solution
+from simulated_annealing import SimulatedAnnealing
+
+# Annealer owned by a worker process
+_worker_sa = None
+
+
+def _init_worker(validator: Validator, sa_options: dict) -> None:
+    """Create the worker's annealer once, so instance data is shipped per worker, not per task."""
+    global _worker_sa
+    _worker_sa = SimulatedAnnealing(validator, **sa_options)
+
+
+def _run_chain_segment(chain: dict, schedule: dict, steps: int, seed: int) -> dict:
+    """Anneal one chain for a number of iterations in a worker process."""
+    return _anneal_chain(_worker_sa, chain, schedule, steps, seed)
+
+
+def _anneal_chain(
+    sa: SimulatedAnnealing, chain: dict, schedule: dict, steps: int, seed: int
+) -> dict:
+    """Anneal a chain, creating its initial solution when it has none.
+
+    Args:
+        sa (SimulatedAnnealing): Annealer to run the chain with.
+        chain (dict): Chain state - current, best, temperature, initial_temp and iteration.
+        schedule (dict): Shared schedule - min_temp, cooling_rate, cooling_strategy and max_iterations.
+        steps (int): Number of iterations to run.
+        seed (int): Seed of the segment's RNG stream.
+
+    Returns:
+        dict: Updated chain state with the segment's history.
+    """
+    sa._rng = random.Random(seed)
+    sa.history = {key: [] for key in sa.history}
+    current = chain["current"]
+    if current is None:
+        current = sa._initial_solution()
+    best = chain["best"] or current
+
+    current, best, temperature, iteration = sa._anneal(
+        current,
+        best,
+        chain["temperature"],
+        chain["iteration"],
+        chain["initial_temp"],
+        schedule["min_temp"],
+        schedule["cooling_rate"],
+        schedule["cooling_strategy"],
+        schedule["max_iterations"],
+        steps=steps,
+    )
+    return {
+        **chain,
+        "current": current,
+        "best": best,
+        "temperature": temperature,
+        "iteration": iteration,
+        "history": sa.history,
+    }
+
+
+class ParallelSimulatedAnnealing:
+    def __init__(
+        self,
+        validator: Validator,
+        chains: int = 4,
+        mode: Literal["exchange", "restart"] = "exchange",
+        backend: Literal["serial", "process"] = "process",
+        workers: int = None,
+        seed: SeedLike = None,
+        engine: Literal["solution", "delta"] = "solution",
+        repair_method: str = "random",
+        history_interval: int = 1,
+        repair_methods: dict = None,
+    ) -> None:
+        """Initialize multi-chain Simulated Annealing.
+
+        Chains follow the same cooling schedule from a geometric ladder of initial
+        temperatures. In "exchange" mode neighbouring chains swap their states with
+        the replica exchange acceptance rule, in "restart" mode all chains restart
+        from the global best solution.
+
+        Args:
+            validator (Validator): Validator instance for the Set Cover Problem.
+            chains (int): Number of chains.
+            mode (str): State sharing between chains - "exchange" or "restart".
+            backend (str): Where chains run - "serial" or "process".
+            workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+            seed (optional): Seed for reproducible runs - int, SeedSequence, random.Random or numpy
+                Generator, None draws it from the global random state. Every segment of every
+                chain gets its own stream spawned from it.
+            engine (str): Annealing engine of every chain - "solution" or "delta"
+                (see SimulatedAnnealing).
+            repair_method (str): Repair method of neighbour moves - "random", "random_cover",
+                "cheapest" or "ratio".
+            history_interval (int): Record chain history every history_interval iterations.
+            repair_methods (dict, optional): Repair method of single moves, overriding
+                repair_method (see SimulatedAnnealing).
+        """
+        if chains < 1:
+            raise ValueError("At least one chain is required.")
+        if mode not in ["exchange", "restart"]:
+            raise ValueError(
+                f"Invalid mode: {mode}. Valid options: ['exchange', 'restart']"
+            )
+        if backend not in ["serial", "process"]:
+            raise ValueError(
+                f"Invalid backend: {backend}. Valid options: ['serial', 'process']"
+            )
+        self.validator = validator
+        self.chains = chains
+        self.mode = mode
+        self.backend = backend
+        self.workers = workers or os.cpu_count() or 1
+        self.seed = seed
+        self.sa_options = {
+            "engine": engine,
+            "repair_method": repair_method,
+            "history_interval": history_interval,
+            "repair_methods": repair_methods,
+        }
+        # Rejects invalid options here rather than in the worker processes
+        SimulatedAnnealing(validator, **self.sa_options)
+        self.chain_histories = []
+        self.exchanges_accepted = 0
+
+    def run(
+        self,
+        initial_temp: float = 1000.0,
+        min_temp: float = 0.01,
+        cooling_rate: float = 0.95,
+        cooling_strategy: Literal[
+            "exponential", "linear", "logarithmic"
+        ] = "exponential",
+        max_iterations: int = 100000,
+        temperature_ratio: float = 0.5,
+        exchange_interval: int = 1000,
+        verbose: bool = False,
+    ) -> Tuple[Solution, List[dict]]:
+        """Run all chains, sharing states every exchange_interval iterations.
+
+        Args:
+            initial_temp (float): Initial temperature of the hottest chain.
+            min_temp (float): Minimum temperature to stop a chain.
+            cooling_rate (float): Rate at which the temperature decreases (for exponential)
+                                 or step size (for linear/logarithmic).
+            cooling_strategy (str): Cooling strategy - "exponential", "linear", or "logarithmic".
+            max_iterations (int): Maximum number of iterations of each chain.
+            temperature_ratio (float): Ratio between initial temperatures of neighbouring chains.
+            exchange_interval (int): Number of iterations between exchanges or restarts.
+            verbose (bool): If True, print the best cost after every interval.
+
+        Returns:
+            Tuple of (best_solution, per-chain histories)
+        """
+        sequence = seed_sequence(self.seed)
+        rng = make_rng(sequence)
+        schedule = {
+            "min_temp": min_temp,
+            "cooling_rate": cooling_rate,
+            "cooling_strategy": cooling_strategy,
+            "max_iterations": max_iterations,
+        }
+        states = []
+        for i in range(self.chains):
+            chain_temp = initial_temp * temperature_ratio**i
+            states.append(
+                {
+                    "current": None,
+                    "best": None,
+                    "temperature": chain_temp,
+                    "initial_temp": chain_temp,
+                    "iteration": 0,
+                }
+            )
+        self.chain_histories = [
+            {"iterations": [], "temperatures": [], "current_costs": [], "best_costs": []}
+            for _ in range(self.chains)
+        ]
+        self.exchanges_accepted = 0
+        best = None
+
+        executor = None
+        sa = None
+        if self.backend == "process":
+            executor = ProcessPoolExecutor(
+                max_workers=min(self.workers, self.chains),
+                initializer=_init_worker,
+                initargs=(self.validator, self.sa_options),
+            )
+        else:
+            sa = SimulatedAnnealing(self.validator, **self.sa_options)
+
+        try:
+            interval = 0
+            while any(self._is_running(state, schedule) for state in states):
+                seeds = spawn_seeds(sequence, len(states))
+                if executor is None:
+                    states = [
+                        _anneal_chain(sa, state, schedule, exchange_interval, seed)
+                        for state, seed in zip(states, seeds)
+                    ]
+                else:
+                    futures = [
+                        executor.submit(
+                            _run_chain_segment, state, schedule, exchange_interval, seed
+                        )
+                        for state, seed in zip(states, seeds)
+                    ]
+                    states = [future.result() for future in futures]
+
+                for state, history in zip(states, self.chain_histories):
+                    for key, values in state.pop("history").items():
+                        history[key].extend(values)
+                    if best is None or state["best"].get_cost_sum() < best.get_cost_sum():
+                        best = state["best"]
+
+                if verbose:
+                    print(
+                        f"Interval {interval}: Best cost = {best.get_cost_sum()}, "
+                        f"Chain costs = {[s['current'].get_cost_sum() for s in states]}"
+                    )
+
+                if self.mode == "exchange":
+                    self._exchange(states, interval % 2, rng)
+                else:
+                    for state in states:
+                        state["current"] = best
+                interval += 1
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        return best, self.chain_histories
+
+    @staticmethod
+    def _is_running(state: dict, schedule: dict) -> bool:
+        """Check whether a chain has not reached its stop condition yet."""
+        return (
+            state["current"] is None
+            or state["temperature"] > schedule["min_temp"]
+            and state["iteration"] < schedule["max_iterations"]
+        )
+
+    def _exchange(self, states: List[dict], offset: int, rng: random.Random) -> None:
+        """Replica exchange between neighbouring chains, alternating between even and odd pairs.
+
+        Args:
+            states (List[dict]): Chain states ordered from the hottest, modified in place.
+            offset (int): 0 to pair chains (0, 1), (2, 3)..., 1 to pair (1, 2), (3, 4)...
+            rng (random.Random): Random number generator.
+        """
+        for i in range(offset, len(states) - 1, 2):
+            hot, cold = states[i], states[i + 1]
+            temp_hot = hot["temperature"] + 1e-6
+            temp_cold = cold["temperature"] + 1e-6
+            energy_diff = hot["current"].get_cost_sum() - cold["current"].get_cost_sum()
+            exponent = (1 / temp_cold - 1 / temp_hot) * -energy_diff
+            if exponent >= 0 or rng.random() < math.exp(exponent):
+                hot["current"], cold["current"] = cold["current"], hot["current"]
+                self.exchanges_accepted += 1
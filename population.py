@@ -2,6 +2,7 @@
 
 from random_correct import RandomSolutionGenerator
 from typing import List
+from rng import RandomLike
 from validator import Validator
 from solution import Solution
 
@@ -9,13 +10,14 @@ from solution import Solution
 class PopulationGenerator:
     @staticmethod
     def generate_initial_population(
-        pop_size: int, validator: Validator
+        pop_size: int, validator: Validator, rng: RandomLike = None
     ) -> List[Solution]:
         """Generates an initial population of random solutions.
 
         Args:
             pop_size (int): Size of the population.
             validator (Validator): Validator instance for checking solution validity.
+            rng (random.Random or numpy.random.Generator, optional): Random number generator. Defaults to the global one.
 
         Returns:
             List[Solution]: List of random solutions.
@@ -23,6 +25,6 @@ class PopulationGenerator:
         generator = RandomSolutionGenerator(validator)
         population = []
         for _ in range(pop_size):
-            solution = generator.generate_random_solution()
+            solution = generator.generate_random_solution(rng)
             population.append(solution)
         return population
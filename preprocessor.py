@@ -0,0 +1,306 @@
+"""This file contains Preprocessor class - classical Set Cover Problem (SCP) instance reductions."""
+
+from typing import Iterable, List
+from DataLoader import DataLoader
+from solution import Solution
+import numpy as np
+import time
+
+
+class Preprocessor:
+    def __init__(
+        self,
+        dl: DataLoader,
+        row_dominance: bool = True,
+        column_dominance: bool = True,
+    ) -> None:
+        """Initialize the preprocessor of an instance.
+
+        Reductions are applied until none of them changes the instance:
+            - forced columns: an element covered by a single subset fixes that subset,
+              the elements it covers are removed,
+            - dominated rows: an element whose covering subsets are a superset of
+              another element's is always covered with that element and is removed,
+            - dominated columns: a subset is removed if a single subset covers all of
+              its elements at no higher cost, or if the cheapest other subsets of its
+              elements together cost no more than it does.
+        Every reduction keeps at least one optimal solution.
+
+        Args:
+            dl (DataLoader): Loaded instance data.
+            row_dominance (bool): If True, remove dominated rows (elements).
+            column_dominance (bool): If True, remove dominated columns (subsets).
+        """
+        self.dl = dl
+        self.row_dominance = row_dominance
+        self.column_dominance = column_dominance
+
+        self.column_map: List[int] = []  # Reduced subset index -> original index
+        self.row_map: List[int] = []  # Reduced element index -> original index
+        self.fixed_columns: List[int] = []  # Original indices of forced subsets
+        self.fixed_cost = 0
+        self.statistics = {}
+
+    def reduce(self, representation: str = "lists") -> DataLoader:
+        """Apply the reductions and build the reduced instance.
+
+        Args:
+            representation (str): Representation of the returned loader - "lists" or "csr".
+
+        Returns:
+            DataLoader: Reduced instance, its indices map to the original ones
+                through column_map and row_map
+        """
+        start_time = time.perf_counter()
+        n = self.dl.get_n()
+        m = self.dl.get_m()
+        self._costs = self.dl.get_costs()
+        self._row_cols = self.dl.get_element_covers()
+        self._col_rows = self.dl.get_subset_covers()
+        self._active_rows = [True] * n
+        self._active_cols = [True] * m
+        self.fixed_columns = []
+        self.statistics = {
+            "forced_columns": 0,
+            "dominated_rows": 0,
+            "dominated_columns": 0,
+            "passes": 0,
+        }
+
+        changed = True
+        while changed:
+            self.statistics["passes"] += 1
+            changed = self._fix_forced_columns()
+            if self.row_dominance:
+                changed |= self._remove_dominated_rows()
+            if self.column_dominance:
+                changed |= self._remove_dominated_columns()
+
+        self.row_map = [i for i in range(n) if self._active_rows[i]]
+        self.column_map = [j for j in range(m) if self._active_cols[j]]
+        self.fixed_cost = sum(self._costs[j] for j in self.fixed_columns)
+
+        column_index = {j: k for k, j in enumerate(self.column_map)}
+        rows = [
+            sorted(column_index[j] for j in self._row_cols[i] if self._active_cols[j])
+            for i in self.row_map
+        ]
+        indptr = np.zeros(len(rows) + 1, dtype=np.int32)
+        indptr[1:] = np.cumsum([len(row) for row in rows])
+        indices = np.fromiter(
+            (j for row in rows for j in row), dtype=np.int32, count=indptr[-1]
+        )
+        reduced = DataLoader.from_arrays(
+            len(self.row_map),
+            len(self.column_map),
+            np.array([self._costs[j] for j in self.column_map], dtype=np.int32),
+            indptr,
+            indices,
+            representation,
+        )
+
+        self.statistics.update(
+            {
+                "original_n": n,
+                "original_m": m,
+                "reduced_n": len(self.row_map),
+                "reduced_m": len(self.column_map),
+                "fixed_cost": self.fixed_cost,
+                "time": time.perf_counter() - start_time,
+            }
+        )
+        return reduced
+
+    def restore(self, solution: Solution) -> Solution:
+        """Map a solution of the reduced instance back to the original one.
+
+        Args:
+            solution (Solution): Solution of the reduced instance.
+
+        Returns:
+            Solution: Fixed subsets plus the solution's subsets, with original
+                indices (not evaluated)
+        """
+        return Solution(
+            self.fixed_columns + [self.column_map[j] for j in solution.subsets]
+        )
+
+    def get_statistics(self) -> dict:
+        """Get reduction statistics of the last reduce() call.
+
+        Returns:
+            dict: Dictionary with statistics
+        """
+        return dict(self.statistics)
+
+    def _active_columns_of(self, row: int) -> List[int]:
+        """Return active subsets covering an element"""
+        active_cols = self._active_cols
+        return [j for j in self._row_cols[row] if active_cols[j]]
+
+    def _active_rows_of(self, column: int) -> List[int]:
+        """Return active elements covered by a subset"""
+        active_rows = self._active_rows
+        return [i for i in self._col_rows[column] if active_rows[i]]
+
+    def _remove_column(self, column: int) -> None:
+        self._active_cols[column] = False
+
+    def _remove_rows(self, rows: Iterable[int]) -> None:
+        for i in rows:
+            self._active_rows[i] = False
+
+    def _fix_forced_columns(self) -> bool:
+        """Fix subsets that are the only cover of an element.
+
+        Returns:
+            bool: True if any subset was fixed
+        """
+        changed = False
+        for i in range(len(self._active_rows)):
+            if not self._active_rows[i]:
+                continue
+            columns = self._active_columns_of(i)
+            if not columns:
+                raise ValueError(f"Element {i} is not covered by any subset.")
+            if len(columns) == 1:
+                column = columns[0]
+                self.fixed_columns.append(column)
+                self._remove_rows(self._active_rows_of(column))
+                self._remove_column(column)
+                self.statistics["forced_columns"] += 1
+                changed = True
+        return changed
+
+    def _remove_dominated_rows(self) -> bool:
+        """Remove elements whose covering subsets contain those of another element.
+
+        Returns:
+            bool: True if any element was removed
+        """
+        rows = [i for i in range(len(self._active_rows)) if self._active_rows[i]]
+        masks = {}
+        for i in rows:
+            mask = 0
+            for j in self._active_columns_of(i):
+                mask |= 1 << j
+            masks[i] = mask
+        rows.sort(key=lambda i: masks[i].bit_count())
+
+        changed = False
+        for k in rows:
+            if not self._active_rows[k]:
+                continue
+            mask_k = masks[k]
+            # Every row dominating k contains its column covering the fewest rows
+            pivot = min(
+                self._active_columns_of(k), key=lambda j: len(self._col_rows[j])
+            )
+            for i in self._active_rows_of(pivot):
+                if i != k and mask_k & ~masks[i] == 0:
+                    self._active_rows[i] = False
+                    self.statistics["dominated_rows"] += 1
+                    changed = True
+        return changed
+
+    def _remove_dominated_columns(self) -> bool:
+        """Remove subsets dominated by a single cheaper subset or by the cheapest
+        other covers of their elements.
+
+        Returns:
+            bool: True if any subset was removed
+        """
+        costs = self._costs
+        active_cols = self._active_cols
+        rows = [i for i in range(len(self._active_rows)) if self._active_rows[i]]
+        # Covers of each element sorted by cost, pointer to the first active one
+        row_sorted = {
+            i: sorted(self._active_columns_of(i), key=lambda j: (costs[j], j))
+            for i in rows
+        }
+        row_first = dict.fromkeys(rows, 0)
+
+        def cheapest_other(i: int, column: int) -> int:
+            """Cost of the cheapest active subset other than column covering element i, -1 if none"""
+            columns = row_sorted[i]
+            p = row_first[i]
+            while not active_cols[columns[p]]:
+                p += 1
+            row_first[i] = p
+            while p < len(columns):
+                j = columns[p]
+                if j != column and active_cols[j]:
+                    return costs[j]
+                p += 1
+            return -1
+
+        column_masks = {}
+        for j in range(len(active_cols)):
+            if active_cols[j]:
+                mask = 0
+                for i in self._active_rows_of(j):
+                    mask |= 1 << i
+                column_masks[j] = mask
+
+        changed = False
+        # Most expensive first, they are the most likely to be dominated
+        for j in sorted(column_masks, key=lambda j: (-costs[j], -j)):
+            column_rows = self._active_rows_of(j)
+            total = 0
+            for i in column_rows:
+                other_cost = cheapest_other(i, j)
+                if other_cost < 0:
+                    total = -1
+                    break
+                total += other_cost
+                if total > costs[j]:
+                    break
+            dominated = 0 <= total <= costs[j]
+
+            if not dominated:
+                # Single subset covering all elements of j at no higher cost
+                mask_j = column_masks[j]
+                pivot = min(column_rows, key=lambda i: len(row_sorted[i]))
+                for l in row_sorted[pivot]:
+                    if costs[l] > costs[j]:
+                        break
+                    if (
+                        l != j
+                        and active_cols[l]
+                        and mask_j & ~column_masks[l] == 0
+                    ):
+                        dominated = True
+                        break
+
+            if dominated:
+                self._remove_column(j)
+                self.statistics["dominated_columns"] += 1
+                changed = True
+        return changed
+
+
+if __name__ == "__main__":
+    from validator import Validator
+    from greedy import GreedySolutionGenerator
+
+    for file_name in ["scp41.txt", "scpd1.txt"]:
+        dl = DataLoader(file_name)
+        dl.fetch_data()
+        preprocessor = Preprocessor(dl)
+        reduced = preprocessor.reduce()
+        stats = preprocessor.get_statistics()
+        print(
+            f"{file_name}: {stats['original_n']}x{stats['original_m']} -> "
+            f"{stats['reduced_n']}x{stats['reduced_m']} in {stats['time']:.2f} s "
+            f"({stats['forced_columns']} fixed, {stats['dominated_rows']} rows and "
+            f"{stats['dominated_columns']} columns dominated)"
+        )
+
+        solution = GreedySolutionGenerator(Validator(reduced))._generate_greedy_solution()
+        restored = preprocessor.restore(solution)
+        validator = Validator(dl)
+        validator.complex_eval(restored)
+        print(
+            f"  greedy on reduced instance: cost {restored.get_cost_sum()}, "
+            f"correct {restored.is_correct()}"
+        )
@@ -0,0 +1,191 @@
+"""This file contains the observer interface and the Profiler used to instrument EA and SA runs."""
+
+from contextlib import nullcontext
+from typing import Optional
+import csv
+import json
+import threading
+import time
+
+_NO_SECTION = nullcontext()
+
+
+class Observer:
+    """Callbacks of an instrumented run, all of them do nothing by default.
+
+    Algorithms call on_start/on_step/on_end, timed sections report through
+    on_timing and counters through on_count. A Validator with an observer set
+    (EA and SA set it for the duration of a run) reports coverage
+    recomputations, repair and redundancy removal too.
+    """
+
+    def on_start(self, algorithm: object) -> None:
+        """Run of an algorithm started"""
+        pass
+
+    def on_step(self, algorithm: object, step: int, best_cost: float) -> None:
+        """Generation (EA) or iteration (SA) finished"""
+        pass
+
+    def on_end(self, algorithm: object) -> None:
+        """Run of an algorithm finished"""
+        pass
+
+    def on_timing(self, name: str, elapsed: float) -> None:
+        """Timed section finished after elapsed seconds"""
+        pass
+
+    def on_count(self, name: str, amount: int = 1) -> None:
+        """Counter increased by amount"""
+        pass
+
+
+class _Section:
+    """Context manager reporting its duration to an observer"""
+
+    __slots__ = ("_observer", "_name", "_start")
+
+    def __init__(self, observer: Observer, name: str) -> None:
+        self._observer = observer
+        self._name = name
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        self._observer.on_timing(self._name, time.perf_counter() - self._start)
+
+
+def section(observer: Optional[Observer], name: str):
+    """Return a context manager timing a section for an observer, a shared no-op one if observer is None
+
+    Args:
+        observer (Observer, optional): Observer to report to
+        name (str): Name of the section
+    """
+    if observer is None:
+        return _NO_SECTION
+    return _Section(observer, name)
+
+
+class Profiler(Observer):
+    def __init__(self, step_interval: int = 1) -> None:
+        """Observer collecting time and number of calls of every section, counters and progress.
+
+        Callbacks may come from several threads at once (the "thread" backend of
+        the EA), so updates of the collected data hold a lock.
+
+        Args:
+            step_interval (int): Record progress (time and best cost) every step_interval steps.
+        """
+        self.step_interval = step_interval
+        self.timings = {}  # name -> [calls, total seconds]
+        self.counters = {}
+        self.steps = []  # (algorithm, step, seconds since start, best cost)
+        self._start_time = None
+        self._algorithm = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_lock"]  # Locks cannot be pickled
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        """Clear all collected data"""
+        with self._lock:
+            self.timings = {}
+            self.counters = {}
+            self.steps = []
+
+    def on_start(self, algorithm: object) -> None:
+        self._start_time = time.perf_counter()
+        self._algorithm = type(algorithm).__name__
+
+    def on_step(self, algorithm: object, step: int, best_cost: float) -> None:
+        if step % self.step_interval == 0:
+            with self._lock:
+                self.steps.append(
+                    (
+                        self._algorithm,
+                        step,
+                        time.perf_counter() - self._start_time,
+                        best_cost,
+                    )
+                )
+
+    def on_end(self, algorithm: object) -> None:
+        self.on_timing("run", time.perf_counter() - self._start_time)
+
+    def on_timing(self, name: str, elapsed: float) -> None:
+        with self._lock:
+            timing = self.timings.get(name)
+            if timing is None:
+                self.timings[name] = [1, elapsed]
+            else:
+                timing[0] += 1
+                timing[1] += elapsed
+
+    def on_count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def to_dict(self) -> dict:
+        """Return collected data as a JSON-serializable dictionary"""
+        return {
+            "timings": {
+                name: {"calls": calls, "total": total, "mean": total / calls}
+                for name, (calls, total) in sorted(
+                    self.timings.items(), key=lambda item: -item[1][1]
+                )
+            },
+            "counters": dict(sorted(self.counters.items())),
+            "steps": [
+                {
+                    "algorithm": algorithm,
+                    "step": step,
+                    "time": elapsed,
+                    "best_cost": cost,
+                }
+                for algorithm, step, elapsed, cost in self.steps
+            ],
+        }
+
+    def to_json(self, path: str) -> None:
+        """Write collected data to a JSON file
+
+        Args:
+            path (str): Output file path
+        """
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def to_csv(self, path: str) -> None:
+        """Write timings and counters to a CSV file (kind, name, calls, total seconds / value)
+
+        Args:
+            path (str): Output file path
+        """
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["kind", "name", "calls", "value"])
+            for name, timing in self.to_dict()["timings"].items():
+                writer.writerow(["timing", name, timing["calls"], timing["total"]])
+            for name, value in sorted(self.counters.items()):
+                writer.writerow(["counter", name, "", value])
+
+    def summary(self) -> str:
+        """Return a table of sections sorted by total time"""
+        lines = [f"{'section':<24}{'calls':>10}{'total [s]':>12}{'mean [us]':>12}"]
+        for name, timing in self.to_dict()["timings"].items():
+            lines.append(
+                f"{name:<24}{timing['calls']:>10}{timing['total']:>12.4f}"
+                f"{timing['mean'] * 1e6:>12.1f}"
+            )
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"{name:<24}{value:>10}")
+        return "\n".join(lines)
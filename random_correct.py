@@ -1,6 +1,6 @@
 """This file contains RandomSolutionGenerator class for the Set Cover Problem (SCP) implementation."""
 
-import random
+from rng import RandomLike, as_random
 from DataLoader import DataLoader
 from validator import Validator
 from solution import Solution
@@ -11,21 +11,23 @@ class RandomSolutionGenerator:
         self.validator = validator
         pass
 
-    def generate_random_solution(self) -> Solution:
+    def generate_random_solution(self, rng: RandomLike = None) -> Solution:
         """Generate a random solution for the Set Cover Problem.
 
+        Args:
+            rng (random.Random or numpy.random.Generator, optional): Random number generator. Defaults to the global one.
+
         Returns:
             Solution: A random solution that covers all elements.
         """
+        rng = as_random(rng)
         all_subsets = list(range(0, self.validator._m))
-        random.shuffle(all_subsets)
+        rng.shuffle(all_subsets)
         solution = Solution(
-            [all_subsets.pop(all_subsets.index(random.choice(all_subsets)))]
+            [all_subsets.pop(all_subsets.index(rng.choice(all_subsets)))]
         )
         while not solution._is_correct:
-            solution.subsets.append(
-                all_subsets.pop(all_subsets.index(random.choice(all_subsets)))
-            )
+            solution.add(all_subsets.pop(all_subsets.index(rng.choice(all_subsets))))
             self.validator.is_correct(solution)
         self.validator.complex_eval_without_fitness(solution)
         self.validator.remove_redundant_subsets_for_greedy(solution, continuous=True)
@@ -0,0 +1,130 @@
+"""This file contains random number generator helpers - seeding and independent streams for parallel work."""
+
+from typing import List, Union
+import random
+import numpy as np
+
+RandomLike = Union[random.Random, np.random.Generator]
+SeedLike = Union[None, int, random.Random, np.random.Generator, np.random.SeedSequence]
+
+
+class GeneratorRandom(random.Random):
+    """random.Random drawing its bits from a numpy Generator.
+
+    random.Random builds every method (randrange, choice, shuffle, sample...)
+    on random() and getrandbits(), so overriding those two is enough for the
+    operators to use a numpy Generator.
+    """
+
+    def __init__(self, generator: np.random.Generator) -> None:
+        self.generator = generator
+        super().__init__()
+
+    def seed(self, *args, **kwargs) -> None:
+        pass  # State lives in the generator
+
+    def random(self) -> float:
+        return float(self.generator.random())
+
+    def getrandbits(self, k: int) -> int:
+        if k == 0:
+            return 0
+        if k <= 64:
+            return int(self.generator.integers(0, 1 << k, dtype=np.uint64))
+        words = self.generator.integers(
+            0, 1 << 32, size=(k + 31) // 32, dtype=np.uint64
+        )
+        value = 0
+        for word in words.tolist():
+            value = (value << 32) | word
+        return value >> (len(words) * 32 - k)
+
+    def getstate(self):
+        return self.generator.bit_generator.state
+
+    def setstate(self, state) -> None:
+        self.generator.bit_generator.state = state
+
+    def __reduce__(self):
+        return GeneratorRandom, (self.generator,)
+
+
+def as_random(rng: RandomLike = None) -> random.Random:
+    """Return a random.Random-compatible generator for the operators
+
+    Args:
+        rng (random.Random or numpy.random.Generator, optional): Generator to use,
+            None gives the global random module
+
+    Returns:
+        random.Random: rng itself, a GeneratorRandom wrapping a numpy Generator,
+            or the global random module
+    """
+    if rng is None:
+        return random
+    if isinstance(rng, np.random.Generator):
+        return GeneratorRandom(rng)
+    return rng
+
+
+def seed_sequence(seed: SeedLike = None) -> np.random.SeedSequence:
+    """Return the root SeedSequence of a run.
+
+    Args:
+        seed: int, SeedSequence, random.Random or numpy Generator (a seed is drawn
+            from it), or None to draw one from the global random state (so
+            random.seed() still makes runs reproducible)
+
+    Returns:
+        np.random.SeedSequence: Root of the run's independent streams
+    """
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    if seed is None:
+        seed = random.getrandbits(128)
+    elif isinstance(seed, np.random.Generator):
+        seed = int(seed.integers(0, 1 << 63))
+    elif isinstance(seed, random.Random):
+        seed = seed.getrandbits(128)
+    return np.random.SeedSequence(seed)
+
+
+def spawn_seeds(sequence: np.random.SeedSequence, count: int) -> List[int]:
+    """Spawn seeds of independent streams, e.g. one per worker task.
+
+    Successive calls on the same sequence give new, non-overlapping streams,
+    and the result depends only on the root seed and the number of earlier
+    spawns - not on which process or thread uses the seeds.
+
+    Args:
+        sequence (np.random.SeedSequence): Parent sequence
+        count (int): Number of seeds
+
+    Returns:
+        List[int]: 128-bit seeds for random.Random
+    """
+    seeds = []
+    for child in sequence.spawn(count):
+        high, low = child.generate_state(2, np.uint64).tolist()
+        seeds.append((high << 64) | low)
+    return seeds
+
+
+def make_rng(seed: SeedLike = None) -> random.Random:
+    """Create the random.Random of a run from a seed.
+
+    Args:
+        seed: int (random.Random(seed), as before), random.Random (used as is),
+            numpy Generator (wrapped), SeedSequence (first spawned stream) or
+            None (seeded from the global random state)
+
+    Returns:
+        random.Random: Generator of the run
+    """
+    if isinstance(seed, random.Random):
+        return seed
+    if isinstance(seed, np.random.Generator):
+        return GeneratorRandom(seed)
+    if isinstance(seed, np.random.SeedSequence):
+        return random.Random(spawn_seeds(seed, 1)[0])
+    return random.Random(seed if seed is not None else random.getrandbits(64))
@@ -2,13 +2,16 @@
 
 from solution import Solution
 from typing import List
-import random
+from rng import RandomLike, as_random
 
 
 class Selection:
     @staticmethod
     def tournament_selection(
-        population: List[Solution], num_parents: int, tournament_size: int = 3
+        population: List[Solution],
+        num_parents: int,
+        tournament_size: int = 3,
+        rng: RandomLike = None,
     ) -> List[Solution]:
         """Tournament selection - selects the best solution from a random subset of the population.
 
@@ -16,32 +19,36 @@ class Selection:
             population (List[Solution]): List of solutions to select from.
             num_parents (int): Number of parents to select.
             tournament_size (int): Number of participants in each tournament.
+            rng (random.Random or numpy.random.Generator, optional): Random number generator. Defaults to the global one.
 
         Returns:
             List[Solution]: Selected parents.
         """
+        rng = as_random(rng)
         selected = []
         for _ in range(num_parents):
-            participants = random.sample(population, tournament_size)
+            participants = rng.sample(population, tournament_size)
             best = min(participants, key=lambda sol: sol.get_cost_sum())
             selected.append(best)
         return selected
 
     @staticmethod
     def roulette_selection(
-        population: List[Solution], num_parents: int
+        population: List[Solution], num_parents: int, rng: RandomLike = None
     ) -> List[Solution]:
         """Roulette selection - selection probability proportional to 1/fitness.
 
         Args:
             population (List[Solution]): List of solutions to select from.
             num_parents (int): Number of parents to select.
+            rng (random.Random or numpy.random.Generator, optional): Random number generator. Defaults to the global one.
 
         Returns:
             List[Solution]: Selected parents.
         """
+        rng = as_random(rng)
         fitness_values = [(1 / (sol.get_cost_sum())) for sol in population]
         total = sum(fitness_values)
         probabilities = [f / total for f in fitness_values]
 
-        return random.choices(population, weights=probabilities, k=num_parents)
+        return rng.choices(population, weights=probabilities, k=num_parents)
@@ -7,14 +7,71 @@ from mutations import Mutations
 from random_correct import RandomSolutionGenerator
 import random
 import math
-from typing import Literal
+from typing import List, Literal, Union
+from stopping import StoppingCriterion, as_criteria, first_fired
+from profiling import Observer, section
+from rng import SeedLike, make_rng
 import matplotlib.pyplot as plt
 
 
 class SimulatedAnnealing:
-    def __init__(self, validator: Validator) -> None:
+    def __init__(
+        self,
+        validator: Validator,
+        seed: SeedLike = None,
+        repair_method: str = "random",
+        observer: Observer = None,
+        engine: Literal["solution", "delta"] = "solution",
+        history_interval: int = 1,
+        repair_methods: dict = None,
+    ) -> None:
+        """Initialize Simulated Annealing.
+
+        Args:
+            validator (Validator): Validator instance for the Set Cover Problem.
+            seed (optional): Seed for reproducible runs - int, random.Random or numpy Generator,
+                None draws it from the global random state.
+            repair_method (str): Repair method of neighbour moves - "random", "random_cover",
+                "cheapest" or "ratio".
+            observer (Observer, optional): Observer (e.g. profiling.Profiler) notified of timed
+                sections, counters and progress of every iteration.
+            engine (str): "solution" builds every neighbour as a new Solution with the mutation
+                operators, "delta" works in place on one cover and prices moves before applying
+                them (see _anneal_delta).
+            history_interval (int): Record history every history_interval iterations.
+            repair_methods (dict, optional): Repair method of single moves, overriding
+                repair_method, keyed by "add", "remove" or "swap", e.g. {"swap": "ratio"}.
+        """
+        repair_methods = dict(repair_methods or {})
+        for move, method in repair_methods.items():
+            if move not in ["add", "remove", "swap"]:
+                raise ValueError(
+                    f"Invalid repair move: {move}. Valid options: ['add', 'remove', 'swap']"
+                )
+        for method in [repair_method, *repair_methods.values()]:
+            if method not in Mutations.REPAIR_METHODS:
+                raise ValueError(
+                    f"Invalid repair method: {method}. "
+                    f"Valid options: {Mutations.REPAIR_METHODS}"
+                )
+        if engine not in ["solution", "delta"]:
+            raise ValueError(
+                f"Invalid engine: {engine}. Valid options: ['solution', 'delta']"
+            )
+        if history_interval < 1:
+            raise ValueError(
+                f"Invalid history interval: {history_interval}. Must be at least 1."
+            )
         self.validator = validator
+        self.repair_method = repair_method
+        self.repair_methods = repair_methods
+        self.engine = engine
+        self.history_interval = history_interval
+        self.observer = observer
         self.rsg = RandomSolutionGenerator(validator)
+        self.seed = seed
+        self._rng = random
+        self.stop_reason = None
         self.history = {
             "iterations": [],
             "temperatures": [],
@@ -33,6 +90,7 @@ class SimulatedAnnealing:
         max_iterations: int = 100000,
         debug: bool = False,
         draw: bool = False,
+        stopping: Union[StoppingCriterion, List[StoppingCriterion]] = None,
     ) -> Solution:
         """Run the Simulated Annealing algorithm to find the best solution.
 
@@ -45,25 +103,129 @@ class SimulatedAnnealing:
             max_iterations (int): Maximum number of iterations to run.
             debug (bool): If True, print debug information during execution.
             draw (bool): If True, plot the progress after completion.
+            stopping (StoppingCriterion or list, optional): Criteria checked after every
+                iteration, the run ends as soon as any of them fires. stop_reason records
+                which one, or "min_temp"/"max_iterations" for a full run.
 
         Returns:
             Solution: The best solution found by the algorithm.
         """
+        criteria = as_criteria(stopping)
+        for criterion in criteria:
+            criterion.reset()
+        self._rng = make_rng(self.seed)
+        observer = self.observer
+        previous_observer = self.validator.observer
+        if observer is not None:
+            observer.on_start(self)
+            self.validator.observer = observer
+        try:
+            with section(observer, "initial_solution"):
+                current = self._initial_solution()
+            best = current
+
+            current, best, _, _ = self._anneal(
+                current,
+                best,
+                initial_temp,
+                0,
+                initial_temp,
+                min_temp,
+                cooling_rate,
+                cooling_strategy,
+                max_iterations,
+                debug=debug,
+                criteria=criteria,
+            )
+        finally:
+            self.validator.observer = previous_observer
+            if observer is not None:
+                observer.on_end(self)
+
+        if draw:
+            self._plot_progress()
+
+        return best
+
+    def _initial_solution(self) -> Solution:
+        """Pick the cheapest of 5 random solutions as the starting point.
+
+        Returns:
+            Solution: Evaluated initial solution.
+        """
+        best_initial = None
         for _ in range(5):  # Generuj 5 rozwiązań początkowych
-            candidate = self.rsg.generate_random_solution()
+            candidate = self.rsg.generate_random_solution(self._rng)
             self.validator.complex_eval_without_fitness(candidate)
-            if candidate.get_cost_sum() < best_initial_cost:
+            if (
+                best_initial is None
+                or candidate.get_cost_sum() < best_initial.get_cost_sum()
+            ):
                 best_initial = candidate
-                best_initial_cost = candidate.get_cost_sum()
-        current = best_initial
-        self.validator.complex_eval_without_fitness(current)
-        best = current
+        return best_initial
 
-        temperature = initial_temp
-        iteration = 0
+    def _anneal(
+        self,
+        current: Solution,
+        best: Solution,
+        temperature: float,
+        iteration: int,
+        initial_temp: float,
+        min_temp: float,
+        cooling_rate: float,
+        cooling_strategy: str,
+        max_iterations: int,
+        steps: int = None,
+        debug: bool = False,
+        criteria: List[StoppingCriterion] = None,
+    ) -> tuple[Solution, Solution, float, int]:
+        """Run the annealing loop from a given state.
 
-        while temperature > min_temp and iteration < max_iterations:
-            neighbor = self._generate_neighbor(current)
+        Args:
+            current (Solution): Current solution.
+            best (Solution): Best solution found so far.
+            temperature (float): Current temperature.
+            iteration (int): Current iteration number.
+            initial_temp (float): Initial temperature of the schedule.
+            min_temp (float): Minimum temperature to stop the algorithm.
+            cooling_rate (float): Cooling parameter.
+            cooling_strategy (str): Cooling strategy to use.
+            max_iterations (int): Maximum number of iterations in total.
+            steps (int, optional): Stop after this many iterations of this call. Defaults to no limit.
+            debug (bool): If True, print debug information during execution.
+            criteria (List[StoppingCriterion], optional): Stopping criteria checked after every
+                iteration, with the iteration number as the number of evaluations.
+
+        Returns:
+            tuple: (current, best, temperature, iteration) after the loop.
+        """
+        if self.engine == "delta":
+            return self._anneal_delta(
+                current,
+                best,
+                temperature,
+                iteration,
+                initial_temp,
+                min_temp,
+                cooling_rate,
+                cooling_strategy,
+                max_iterations,
+                steps,
+                debug,
+                criteria,
+            )
+
+        step = 0
+        history_interval = self.history_interval
+        self.stop_reason = None
+        observer = self.observer
+        while (
+            temperature > min_temp
+            and iteration < max_iterations
+            and (steps is None or step < steps)
+        ):
+            with section(observer, "neighbour"):
+                neighbor = self._generate_neighbor(current)
 
             delta = neighbor.get_cost_sum() - current.get_cost_sum()
 
@@ -82,13 +244,268 @@ class SimulatedAnnealing:
                 temperature, initial_temp, iteration, cooling_rate, cooling_strategy
             )
             iteration += 1
+            step += 1
 
-            self._update_history(iteration, temperature, current, best)
+            if iteration % history_interval == 0:
+                self._update_history(
+                    iteration, temperature, current.get_cost_sum(), best.get_cost_sum()
+                )
+            if observer is not None:
+                observer.on_step(self, iteration, best.get_cost_sum())
 
-        if draw:
-            self._plot_progress()
+            if criteria:
+                reason = first_fired(criteria, best.get_cost_sum(), iteration)
+                if reason is not None:
+                    self.stop_reason = reason
+                    break
 
-        return best
+        self._set_stop_reason(temperature, min_temp, iteration, max_iterations)
+        return current, best, temperature, iteration
+
+    def _anneal_delta(
+        self,
+        current: Solution,
+        best: Solution,
+        temperature: float,
+        iteration: int,
+        initial_temp: float,
+        min_temp: float,
+        cooling_rate: float,
+        cooling_strategy: str,
+        max_iterations: int,
+        steps: int = None,
+        debug: bool = False,
+        criteria: List[StoppingCriterion] = None,
+    ) -> tuple[Solution, Solution, float, int]:
+        """Annealing loop of the "delta" engine, arguments and result as in _anneal.
+
+        The current cover lives in a list of subsets with their positions and
+        per-element cover counts, so the cost change of a move is known before
+        anything is changed and only accepted moves are applied. Moves keep the
+        cover feasible and use the same weights as _generate_neighbor:
+        add a random subset, remove a random one, swap a selected subset for an
+        unselected one, or drop redundant subsets. Elements a remove or swap
+        would leave uncovered are repaired following the repair method of the
+        move, with the same choices as Mutations.repair_solution: random
+        unselected subsets until covered ("random"), or per uncovered element a
+        random subset containing it ("random_cover"), the cheapest one or the one
+        of lowest cost per newly covered element.
+        """
+        validator = self.validator
+        covers = validator._covers
+        element_covers = validator._element_covers
+        covers_by_cost = validator._get_element_covers_by_cost()
+        costs = validator._costs
+        cover_masks = validator._cover_masks
+        m = validator._m
+        rng = self._rng
+        repair_method = self.repair_method
+        remove_repair = self.repair_methods.get("remove", repair_method)
+        swap_repair = self.repair_methods.get("swap", repair_method)
+        observer = self.observer
+        history_interval = self.history_interval
+
+        state = current.copy()
+        if state._cover_counts is None:
+            validator.init_coverage_state(state)
+        if not state.is_correct():
+            state = Mutations.repair_solution(state, validator, rng, repair_method)
+        counts = state._cover_counts
+        selected = []
+        position = [-1] * m
+        for subset in state.subsets:
+            if position[subset] >= 0:  # Duplicate, keep one copy
+                for e in covers[subset]:
+                    counts[e] -= 1
+                continue
+            position[subset] = len(selected)
+            selected.append(subset)
+        cost = sum(costs[subset] for subset in selected)
+        best_cost = best.get_cost_sum()
+        best_subsets = None  # Set when this call improves on best
+
+        def plan_repair(
+            uncovered: List[int], removed: int, swapped_in: int, repair_method: str
+        ) -> tuple[List[int], int]:
+            """Subsets covering the uncovered elements without removed, and their cost"""
+            added = []
+            added_cost = 0
+            remaining = 0
+            for e in uncovered:
+                remaining |= 1 << e
+            if repair_method == "random":
+                # Random unselected subsets until covered, as in repair_solution.
+                # Picked subsets are marked in position while planning.
+                available = m - len(selected) - (swapped_in >= 0)
+                random_float = rng.random
+                while remaining and len(added) < available:
+                    subset = int(random_float() * m)
+                    if position[subset] != -1 or subset == swapped_in:
+                        continue
+                    position[subset] = -2
+                    added.append(subset)
+                    added_cost += costs[subset]
+                    remaining &= ~cover_masks[subset]
+                for subset in added:
+                    position[subset] = -1
+                if remaining:
+                    return None, 0  # Cannot be covered without removed
+                return added, added_cost
+            for e in uncovered:
+                if not (remaining >> e) & 1:
+                    continue  # Covered by a subset planned earlier
+                if repair_method == "random_cover":
+                    candidates = [j for j in element_covers[e] if j != removed]
+                    subset = rng.choice(candidates) if candidates else -1
+                elif repair_method == "cheapest":
+                    subset = -1
+                    for j in covers_by_cost[e]:
+                        if j != removed:
+                            subset = j
+                            break
+                else:
+                    subset = Mutations._lowest_ratio(
+                        covers_by_cost[e], costs, cover_masks, remaining, removed
+                    )
+                if subset < 0:
+                    return None, 0  # Only the removed subset covers e
+                added.append(subset)
+                added_cost += costs[subset]
+                remaining &= ~cover_masks[subset]
+            return added, added_cost
+
+        def random_unselected() -> int:
+            subset = rng.randrange(m)
+            while position[subset] >= 0:
+                subset = rng.randrange(m)
+            return subset
+
+        def add(subset: int) -> None:
+            position[subset] = len(selected)
+            selected.append(subset)
+            for e in covers[subset]:
+                counts[e] += 1
+
+        def remove(subset: int) -> None:
+            index = position[subset]
+            last = selected.pop()
+            if last != subset:
+                selected[index] = last
+                position[last] = index
+            position[subset] = -1
+            for e in covers[subset]:
+                counts[e] -= 1
+
+        step = 0
+        self.stop_reason = None
+        while (
+            temperature > min_temp
+            and iteration < max_iterations
+            and (steps is None or step < steps)
+        ):
+            with section(observer, "neighbour"):
+                move = rng.random()
+                removed = -1
+                added = []
+                delta = 0
+                if move < 0.1 or not selected:  # add
+                    if len(selected) < m:
+                        added.append(random_unselected())
+                        delta = costs[added[0]]
+                elif move < 0.9:  # remove, or swap for the last 0.3
+                    removed = selected[rng.randrange(len(selected))]
+                    delta = -costs[removed]
+                    mask = 0
+                    if move >= 0.6 and len(selected) < m:
+                        added.append(random_unselected())
+                        delta += costs[added[0]]
+                        mask = cover_masks[added[0]]
+                    uncovered = [
+                        e
+                        for e in covers[removed]
+                        if counts[e] == 1 and not (mask >> e) & 1
+                    ]
+                    if uncovered:
+                        repair, repair_cost = plan_repair(
+                            uncovered,
+                            removed,
+                            added[0] if added else -1,
+                            swap_repair if added else remove_repair,
+                        )
+                        if repair is None:  # Cannot be repaired, no move
+                            removed = -1
+                            added = []
+                        else:
+                            added += repair
+                            delta += repair_cost
+                else:  # drop redundant subsets, never makes the cover worse
+                    # A subset is redundant if it covers no element covered only once
+                    once = 0
+                    for e, count in enumerate(counts):
+                        if count == 1:
+                            once |= 1 << e
+                    for subset in selected[:]:
+                        if not cover_masks[subset] & once:
+                            remove(subset)
+                            cost -= costs[subset]
+                            for e in covers[subset]:
+                                if counts[e] == 1:
+                                    once |= 1 << e
+
+            if (added or removed >= 0) and (
+                delta < 0 or rng.random() < math.exp(-delta / (temperature + 1e-6))
+            ):
+                for subset in added:
+                    add(subset)
+                if removed >= 0:
+                    remove(removed)
+                cost += delta
+            if cost < best_cost:
+                best_cost = cost
+                best_subsets = selected[:]
+
+            if debug:
+                print(
+                    f"Iter: {iteration}, Temp: {temperature:.6f}, "
+                    f"Current cost: {cost}, Best cost: {best_cost}"
+                )
+
+            temperature = self._update_temperature(
+                temperature, initial_temp, iteration, cooling_rate, cooling_strategy
+            )
+            iteration += 1
+            step += 1
+
+            if iteration % history_interval == 0:
+                self._update_history(iteration, temperature, cost, best_cost)
+            if observer is not None:
+                observer.on_step(self, iteration, best_cost)
+
+            if criteria:
+                reason = first_fired(criteria, best_cost, iteration)
+                if reason is not None:
+                    self.stop_reason = reason
+                    break
+
+        self._set_stop_reason(temperature, min_temp, iteration, max_iterations)
+        current = Solution(selected)
+        validator.init_coverage_state(current)
+        if best_subsets is not None:
+            best = Solution(best_subsets)
+            validator.complex_eval_without_fitness(best)
+        return current, best, temperature, iteration
+
+    def _set_stop_reason(
+        self, temperature: float, min_temp: float, iteration: int, max_iterations: int
+    ) -> None:
+        """Record why the annealing loop ended, unless a stopping criterion did it"""
+        if self.stop_reason is None:
+            if temperature <= min_temp:
+                self.stop_reason = "min_temp"
+            elif iteration >= max_iterations:
+                self.stop_reason = "max_iterations"
+            else:
+                self.stop_reason = "steps"
 
     def _update_temperature(
         self,
@@ -129,24 +546,33 @@ class SimulatedAnnealing:
         Returns:
             Solution: A neighbor solution generated by mutation.
         """
-        mutation_type = random.choices(
+        mutation_type = self._rng.choices(
             ["add", "remove", "swap", "optimize"], weights=[0.1, 0.5, 0.3, 0.1], k=1
         )[0]
 
+        repair_method = self.repair_methods.get(mutation_type, self.repair_method)
         if mutation_type == "add":
-            neighbor = Mutations.add_mutation(solution, self.validator)
+            neighbor = Mutations.add_mutation(
+                solution, self.validator, self._rng, repair_method
+            )
         elif mutation_type == "remove":
-            neighbor = Mutations.remove_mutation(solution, self.validator)
+            neighbor = Mutations.remove_mutation(
+                solution, self.validator, self._rng, repair_method
+            )
         elif mutation_type == "swap":
-            neighbor = Mutations.swap_mutation(solution, self.validator)
+            neighbor = Mutations.swap_mutation(
+                solution, self.validator, self._rng, repair_method
+            )
         else:
-            neighbor = Solution(solution.subsets.copy())
+            neighbor = Solution(solution.subsets)
             self.validator.remove_redundant_subsets_for_greedy(
                 neighbor, continuous=True
             )
 
         if not neighbor.is_correct():
-            neighbor = Mutations.repair_solution(neighbor, self.validator)
+            neighbor = Mutations.repair_solution(
+                neighbor, self.validator, self._rng, repair_method
+            )
         return neighbor
 
     def _accept_solution(self, delta: float, temp: float, neighbor: Solution) -> bool:
@@ -164,23 +590,23 @@ class SimulatedAnnealing:
             return False
         if delta < 0:
             return True
-        return random.random() < math.exp(-delta / (temp + 1e-6))
+        return self._rng.random() < math.exp(-delta / (temp + 1e-6))
 
     def _update_history(
-        self, iteration: int, temp: float, current: Solution, best: Solution
+        self, iteration: int, temp: float, current_cost: float, best_cost: float
     ):
         """Update the history of the algorithm's progress.
 
         Args:
             iteration (int): Current iteration number.
             temp (float): Current temperature of the system.
-            current (Solution): The current solution.
-            best (Solution): The best solution found so far.
+            current_cost (float): Cost of the current solution.
+            best_cost (float): Cost of the best solution found so far.
         """
         self.history["iterations"].append(iteration)
         self.history["temperatures"].append(temp)
-        self.history["current_costs"].append(current.get_cost_sum())
-        self.history["best_costs"].append(best.get_cost_sum())
+        self.history["current_costs"].append(current_cost)
+        self.history["best_costs"].append(best_cost)
 
     def _plot_progress(self):
         """Plot the progress of the algorithm showing cost evolution and temperature on one chart."""
@@ -232,7 +658,7 @@ class SimulatedAnnealing:
 # Przykład użycia
 if __name__ == "__main__":
     dl = DataLoader("scp41.txt")
-    dl.fetch_data()
+    dl.fetch_data(use_cache=True)
     vd = Validator(dl)
 
     sa = SimulatedAnnealing(vd)
@@ -1,14 +1,110 @@
-from typing import List
+from array import array
+from typing import Iterable, List, Optional
 
 
 class Solution:
+    """Selected subsets of a Set Cover solution with their evaluation.
 
-    def __init__(self, input_subsets: List[int]) -> None:
+    Subsets are stored in a compact array('i'). Membership of a subset is
+    answered from a bitmask that is built on first use and kept up to date by
+    add/discard/set_subsets - code changing the subsets array directly must go
+    through these methods for contains() to stay correct. They also drop the
+    incremental coverage state, use Validator.add_subset/remove_subset to keep it.
+    """
+
+    __slots__ = (
+        "_subsets",
+        "_selected",
+        "_is_correct",
+        "_cost_sum",
+        "_fitness",
+        "_covered_elements",
+        "_cover_counts",
+        "_uncovered",
+        "_penalty",
+    )
+
+    def __init__(self, input_subsets: Iterable[int]) -> None:
         self.subsets = input_subsets
         self._is_correct = False
         self._cost_sum = 0
         self._fitness = float("inf")  # Albo inf zależy od podejscia
-        self._covered_elements = []
+        # Filled in only when asked for (Validator.calculate_covered_elements)
+        self._covered_elements: Optional[List[int]] = None
+        # Incremental coverage state, filled in by Validator.init_coverage_state
+        self._cover_counts: Optional[List[int]] = None
+        self._uncovered = 0
+        # Conflict penalty part of fitness, kept up to date by Validator.add_subset/remove_subset
+        self._penalty: Optional[int] = None
+
+    @property
+    def subsets(self) -> array:
+        return self._subsets
+
+    @subsets.setter
+    def subsets(self, input_subsets: Iterable[int]) -> None:
+        self.set_subsets(input_subsets)
+
+    def set_subsets(self, input_subsets: Iterable[int]) -> None:
+        """Replace selected subsets, dropping coverage state (evaluation is not updated)"""
+        self._replace_subsets(input_subsets)
+        self._invalidate_coverage()
+
+    def add(self, subset: int) -> None:
+        """Append a subset, dropping coverage state (evaluation is not updated)"""
+        self._append_subset(subset)
+        self._invalidate_coverage()
+
+    def discard(self, subset: int) -> None:
+        """Remove first occurrence of a subset, dropping coverage state (evaluation is not updated)"""
+        self._remove_subset(subset)
+        self._invalidate_coverage()
+
+    def _invalidate_coverage(self) -> None:
+        """Forget cover counts and penalty, Validator rebuilds them on next use"""
+        self._cover_counts = None
+        self._penalty = None
+
+    # Validator updates coverage state itself and changes subsets through these
+
+    def _replace_subsets(self, input_subsets: Iterable[int]) -> None:
+        self._subsets = array("i", input_subsets)
+        self._selected = None
+
+    def _append_subset(self, subset: int) -> None:
+        self._subsets.append(subset)
+        if self._selected is not None:
+            self._selected |= 1 << subset
+
+    def _remove_subset(self, subset: int) -> None:
+        self._subsets.remove(subset)
+        if self._selected is not None and subset not in self._subsets:
+            self._selected &= ~(1 << subset)
+
+    def contains(self, subset: int) -> bool:
+        """Check if a subset is selected"""
+        if self._selected is None:
+            selected = 0
+            for j in self._subsets:
+                selected |= 1 << j
+            self._selected = selected
+        return (self._selected >> subset) & 1 == 1
+
+    def copy(self) -> "Solution":
+        """Copy the solution together with its evaluation and coverage state"""
+        new_solution = Solution.__new__(Solution)
+        new_solution._subsets = self._subsets[:]
+        new_solution._selected = self._selected
+        new_solution._is_correct = self._is_correct
+        new_solution._cost_sum = self._cost_sum
+        new_solution._fitness = self._fitness
+        new_solution._covered_elements = None
+        new_solution._cover_counts = (
+            self._cover_counts[:] if self._cover_counts is not None else None
+        )
+        new_solution._uncovered = self._uncovered
+        new_solution._penalty = self._penalty
+        return new_solution
 
     def get_cost_sum(self) -> int:
         return self._cost_sum
@@ -20,4 +116,7 @@ class Solution:
         return self._fitness
 
     def get_covered_elements(self) -> list[int]:
-        return self._covered_elements
+        return self._covered_elements if self._covered_elements is not None else []
+
+    def get_uncovered_count(self) -> int:
+        return self._uncovered
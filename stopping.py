@@ -0,0 +1,159 @@
+"""This file contains stopping criteria for the Evolutionary Algorithm (EA) and Simulated Annealing (SA) runs."""
+
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional, Union
+from DataLoader import DataLoader
+import time
+
+
+class StoppingCriterion(ABC):
+    """Condition ending a run early.
+
+    A run calls reset() when it starts and should_stop() after every
+    generation (EA) or iteration (SA) with the best cost so far and the number
+    of solutions evaluated so far.
+    """
+
+    name = "criterion"
+
+    def reset(self) -> None:
+        """Prepare for a new run"""
+        pass
+
+    @abstractmethod
+    def should_stop(self, best_cost: float, evaluations: int) -> bool:
+        """Check if the run should stop
+
+        Args:
+            best_cost (float): Cost of the best solution found so far
+            evaluations (int): Number of solutions evaluated so far
+        """
+
+
+class WallClockBudget(StoppingCriterion):
+    name = "wall_clock"
+
+    def __init__(self, seconds: float) -> None:
+        """Stop once a run has taken the given number of seconds.
+
+        Args:
+            seconds (float): Time budget in seconds.
+        """
+        self.seconds = seconds
+        self._start_time = None
+
+    def reset(self) -> None:
+        self._start_time = time.perf_counter()
+
+    def should_stop(self, best_cost: float, evaluations: int) -> bool:
+        if self._start_time is None:
+            self.reset()
+        return time.perf_counter() - self._start_time >= self.seconds
+
+
+class EvaluationBudget(StoppingCriterion):
+    name = "evaluations"
+
+    def __init__(self, evaluations: int) -> None:
+        """Stop once a run has evaluated the given number of solutions.
+
+        Args:
+            evaluations (int): Evaluation budget.
+        """
+        self.evaluations = evaluations
+
+    def should_stop(self, best_cost: float, evaluations: int) -> bool:
+        return evaluations >= self.evaluations
+
+
+class Stagnation(StoppingCriterion):
+    name = "stagnation"
+
+    def __init__(self, steps: int) -> None:
+        """Stop when the best cost has not improved for a number of generations (EA)
+        or iterations (SA).
+
+        Args:
+            steps (int): Number of generations or iterations without improvement.
+        """
+        self.steps = steps
+        self._best_cost = float("inf")
+        self._without_improvement = 0
+
+    def reset(self) -> None:
+        self._best_cost = float("inf")
+        self._without_improvement = 0
+
+    def should_stop(self, best_cost: float, evaluations: int) -> bool:
+        if best_cost < self._best_cost:
+            self._best_cost = best_cost
+            self._without_improvement = 0
+            return False
+        self._without_improvement += 1
+        return self._without_improvement >= self.steps
+
+
+class TargetGap(StoppingCriterion):
+    name = "target_gap"
+
+    def __init__(
+        self, gap: float, lower_bound: float = None, dl: DataLoader = None
+    ) -> None:
+        """Stop once the best cost is within a relative gap of a lower bound.
+
+        Args:
+            gap (float): Target (best_cost - lower_bound) / lower_bound, 0 stops at a proven optimum.
+            lower_bound (float, optional): Known lower bound of the instance.
+            dl (DataLoader, optional): Instance to compute the bound for with
+                LagrangianBound (on first reset) when lower_bound is not given.
+        """
+        if lower_bound is None and dl is None:
+            raise ValueError(
+                "TargetGap needs a lower_bound or a DataLoader to compute it."
+            )
+        self.gap = gap
+        self.lower_bound = lower_bound
+        self._dl = dl
+
+    def reset(self) -> None:
+        if self.lower_bound is None:
+            from lagrangian import LagrangianBound
+
+            self.lower_bound = LagrangianBound(self._dl).run()
+
+    def should_stop(self, best_cost: float, evaluations: int) -> bool:
+        if self.lower_bound is None:
+            self.reset()
+        if self.lower_bound <= 0:
+            return best_cost <= 0
+        return (best_cost - self.lower_bound) / self.lower_bound <= self.gap
+
+
+def as_criteria(
+    stopping: Union[StoppingCriterion, Iterable[StoppingCriterion], None],
+) -> List[StoppingCriterion]:
+    """Normalize a criterion, a list of criteria or None to a list"""
+    if stopping is None:
+        return []
+    if isinstance(stopping, StoppingCriterion):
+        return [stopping]
+    return list(stopping)
+
+
+def first_fired(
+    criteria: List[StoppingCriterion], best_cost: float, evaluations: int
+) -> Optional[str]:
+    """Return the name of the first criterion that fires, None if none does.
+
+    Every criterion is checked, so stateful ones (Stagnation) see every step.
+
+    Args:
+        criteria (List[StoppingCriterion]): Criteria to check
+        best_cost (float): Cost of the best solution found so far
+        evaluations (int): Number of solutions evaluated so far
+    """
+    reason = None
+    for criterion in criteria:
+        if criterion.should_stop(best_cost, evaluations) and reason is None:
+            reason = criterion.name
+    return reason
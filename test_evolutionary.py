@@ -7,7 +7,7 @@ import time
 
 # Testing
 dl = DataLoader("scp41.txt")
-dl.fetch_data()
+dl.fetch_data(use_cache=True)
 vd = Validator(dl)
 
 # Example 1: Testing the Evolutionary Algorithm
@@ -8,7 +8,7 @@ import time
 # Testing Greedy Solution Generator
 print("=== Greedy Solution Generator Test ===")
 dl = DataLoader("scp41.txt")
-dl.fetch_data()
+dl.fetch_data(use_cache=True)
 vd = Validator(dl)
 start_greedy = time.time()
 gsg = GreedySolutionGenerator(vd)
@@ -7,7 +7,7 @@ from random_correct import RandomSolutionGenerator
 # Testing Random Solution Generator
 print("=== Random Solution Generator Test ===")
 dl = DataLoader("scp41.txt")
-dl.fetch_data()
+dl.fetch_data(use_cache=True)
 vd = Validator(dl)
 rsg = RandomSolutionGenerator(vd)
 rand_sol = rsg.generate_random_solution()
@@ -8,7 +8,7 @@ import time
 # Testing Simulated Annealing
 print("=== Simulated Annealing Test ===")
 dl = DataLoader("scp41.txt")
-dl.fetch_data()
+dl.fetch_data(use_cache=True)
 vd = Validator(dl)
 sa = SimulatedAnnealing(vd)
 start_time = time.time()
@@ -0,0 +1,533 @@
+"""This file contains RacingTuner class - an iterated F-race hyperparameter tuner for the EA and SA.
+
+Usage:
+    python tuner.py sa scp41.txt scp51.txt --budget 300 --output sa_tuning.json
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+from typing import List, Literal, Tuple
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+from mutations import Mutations
+from rng import SeedLike, make_rng, seed_sequence, spawn_seeds
+
+# Parameter spaces: (name, kind, domain, condition). Kinds are "int" and "float"
+# (uniform on [low, high]), "log" (log-uniform) and "choice". A parameter with a
+# condition (parent, values) only exists when the parent takes one of the values.
+EA_SPACE = [
+    ("population_size", "int", (10, 100), None),
+    ("mutation_rate", "float", (0.01, 0.5), None),
+    ("crossover_rate", "float", (0.5, 1.0), None),
+    ("elitism_count", "int", (0, 5), None),
+    ("crossover_method", "choice", ["uniform", "greedy", "pmx"], None),
+    ("mutation_method", "choice", ["add", "remove", "swap"], None),
+    ("selection_method", "choice", ["tournament", "roulette"], None),
+    ("tournament_size", "int", (2, 8), ("selection_method", ["tournament"])),
+    ("repair_method", "choice", Mutations.REPAIR_METHODS, None),
+]
+
+# "logarithmic" cooling multiplies by cooling_rate just like "exponential", so
+# only exponential and linear schedules are raced.
+SA_SPACE = [
+    ("initial_temp", "log", (10.0, 10000.0), None),
+    ("cooling_strategy", "choice", ["exponential", "linear"], None),
+    (
+        "cooling_rate",
+        "float",
+        (0.99, 0.99999),
+        ("cooling_strategy", ["exponential"]),
+    ),
+    ("cooling_step", "log", (0.001, 10.0), ("cooling_strategy", ["linear"])),
+    ("repair_method", "choice", Mutations.REPAIR_METHODS, None),
+]
+
+# Budget of every tuning run
+RUN_BUDGETS = {
+    "ea": {"generations": 1000, "evaluations": 2000},
+    "sa": {"max_iterations": 5000, "min_temp": 0.01},
+}
+
+# Validators of the instances loaded by this process
+_validators = {}
+
+
+def _get_validator(instance: str):
+    """Load an instance (through the instance cache) once per process."""
+    from DataLoader import DataLoader
+    from validator import Validator
+
+    validator = _validators.get(instance)
+    if validator is None:
+        dl = DataLoader(instance)
+        dl.fetch_data(use_cache=True)
+        validator = _validators[instance] = Validator(dl)
+    return validator
+
+
+def evaluate_configuration(
+    algorithm: str, config: dict, instance: str, seed: int, run_budget: dict
+) -> int:
+    """Run an algorithm configuration once and return the cost of its best solution.
+
+    Args:
+        algorithm (str): "ea" or "sa".
+        config (dict): Sampled configuration.
+        instance (str): Instance file.
+        seed (int): Seed of the run.
+        run_budget (dict): Budget of the run, see RUN_BUDGETS.
+
+    Returns:
+        int: Cost of the best solution found
+    """
+    from evolutionary import EvolutionaryAlgorithm
+    from simulated_annealing import SimulatedAnnealing
+    from stopping import EvaluationBudget
+
+    validator = _get_validator(instance)
+    with contextlib.redirect_stdout(io.StringIO()):
+        if algorithm == "ea":
+            ea = EvolutionaryAlgorithm(validator, seed=seed)
+            ea.set_parameters(**config)
+            best, _, _ = ea.run(
+                run_budget["generations"],
+                verbose=False,
+                stopping=EvaluationBudget(run_budget["evaluations"]),
+            )
+        else:
+            params = dict(config)
+            repair_method = params.pop("repair_method", "random")
+            if "cooling_step" in params:
+                params["cooling_rate"] = params.pop("cooling_step")
+            sa = SimulatedAnnealing(validator, seed=seed, repair_method=repair_method)
+            best = sa.run(
+                max_iterations=run_budget["max_iterations"],
+                min_temp=run_budget["min_temp"],
+                **params,
+            )
+    return best.get_cost_sum()
+
+
+def chi2_sf(statistic: float, df: int) -> float:
+    """Upper tail probability of the chi-square distribution.
+
+    Regularized upper incomplete gamma Q(df / 2, statistic / 2), from its
+    series below a + 1 and its continued fraction above.
+
+    Args:
+        statistic (float): Value of the statistic.
+        df (int): Degrees of freedom.
+
+    Returns:
+        float: P(X >= statistic)
+    """
+    if statistic <= 0:
+        return 1.0
+    a = df / 2
+    x = statistic / 2
+    log_prefactor = -x + a * math.log(x) - math.lgamma(a)
+    if x < a + 1:
+        term = total = 1 / a
+        denominator = a
+        for _ in range(1000):
+            denominator += 1
+            term *= x / denominator
+            total += term
+            if abs(term) < abs(total) * 1e-15:
+                break
+        return max(0.0, 1.0 - total * math.exp(log_prefactor))
+
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    fraction = d
+    for i in range(1, 1000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        fraction *= d * c
+        if abs(d * c - 1) < 1e-15:
+            break
+    return math.exp(log_prefactor) * fraction
+
+
+def t_quantile(p: float, df: float) -> float:
+    """Quantile of Student's t distribution (Cornish-Fisher expansion around the normal one)
+
+    Args:
+        p (float): Probability.
+        df (float): Degrees of freedom.
+    """
+    z = NormalDist().inv_cdf(p)
+    g1 = (z**3 + z) / 4
+    g2 = (5 * z**5 + 16 * z**3 + 3 * z) / 96
+    g3 = (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / 384
+    g4 = (79 * z**9 + 776 * z**7 + 1482 * z**5 - 1920 * z**3 - 945 * z) / 92160
+    return z + g1 / df + g2 / df**2 + g3 / df**3 + g4 / df**4
+
+
+def _ranks(values: List[float]) -> List[float]:
+    """Ranks of values starting at 1, ties get their average rank"""
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    start = 0
+    while start < len(order):
+        end = start
+        value = values[order[start]]
+        while end + 1 < len(order) and values[order[end + 1]] == value:
+            end += 1
+        for position in range(start, end + 1):
+            ranks[order[position]] = (start + end) / 2 + 1
+        start = end + 1
+    return ranks
+
+
+def friedman_race_step(
+    costs: List[List[float]], alpha: float = 0.05
+) -> Tuple[float, float, List[int]]:
+    """Friedman test over blocks with Conover's post-hoc comparison to the best candidate.
+
+    Args:
+        costs (List[List[float]]): costs[block][candidate], lower is better.
+        alpha (float): Significance level.
+
+    Returns:
+        Tuple of (Friedman statistic, p-value, indices of candidates significantly
+        worse than the best one - empty unless the test rejects)
+    """
+    n = len(costs)
+    k = len(costs[0])
+    ranks = [_ranks(block) for block in costs]
+    rank_sums = [sum(block[j] for block in ranks) for j in range(k)]
+    spread = sum((r - (k + 1) / 2) ** 2 for block in ranks for r in block)
+    if n < 2 or k < 2 or spread == 0:
+        return 0.0, 1.0, []
+
+    statistic = (k - 1) * sum((s - n * (k + 1) / 2) ** 2 for s in rank_sums) / spread
+    p_value = chi2_sf(statistic, k - 1)
+    if p_value >= alpha:
+        return statistic, p_value, []
+
+    df = (n - 1) * (k - 1)
+    threshold = t_quantile(1 - alpha / 2, df) * math.sqrt(
+        max(0.0, 2 * n * (1 - statistic / (n * (k - 1))) * spread / df)
+    )
+    best = min(rank_sums)
+    worse = [j for j in range(k) if rank_sums[j] - best > threshold]
+    return statistic, p_value, worse
+
+
+class RacingTuner:
+    def __init__(
+        self,
+        algorithm: Literal["ea", "sa"],
+        instances: List[str],
+        budget: int = 500,
+        iterations: int = 3,
+        first_test: int = 5,
+        alpha: float = 0.05,
+        elites: int = 3,
+        run_budget: dict = None,
+        backend: Literal["serial", "process"] = "process",
+        workers: int = None,
+        seed: SeedLike = None,
+    ) -> None:
+        """Initialize an iterated F-race tuner (in the style of irace).
+
+        Every iteration samples candidate configurations - uniformly at first,
+        later around the elites of the previous race - and races them: all
+        surviving candidates run on the same block (instance and seed), and
+        from first_test blocks on a Friedman test drops candidates that are
+        significantly worse than the best one. Runs of a block go to a process
+        pool.
+
+        Args:
+            algorithm (str): Algorithm to tune - "ea" or "sa".
+            instances (List[str]): Instance files to race on.
+            budget (int): Total number of algorithm runs.
+            iterations (int): Number of races, each gets an equal share of the remaining budget.
+            first_test (int): Number of blocks before the first elimination test.
+            alpha (float): Significance level of the tests.
+            elites (int): Number of best candidates kept from a race to the next one.
+            run_budget (dict, optional): Budget of every run, defaults to RUN_BUDGETS[algorithm].
+            backend (str): Where runs execute - "serial" or "process".
+            workers (int, optional): Number of pool workers, defaults to the number of CPUs.
+            seed (optional): Seed of sampling and of the runs.
+        """
+        if algorithm not in RUN_BUDGETS:
+            raise ValueError(
+                f"Invalid algorithm: {algorithm}. Valid options: {list(RUN_BUDGETS)}"
+            )
+        if backend not in ["serial", "process"]:
+            raise ValueError(
+                f"Invalid backend: {backend}. Valid options: ['serial', 'process']"
+            )
+        self.algorithm = algorithm
+        self.space = EA_SPACE if algorithm == "ea" else SA_SPACE
+        self.instances = list(instances)
+        self.budget = budget
+        self.iterations = iterations
+        self.first_test = first_test
+        self.alpha = alpha
+        self.elites = elites
+        self.run_budget = run_budget or RUN_BUDGETS[algorithm]
+        self.backend = backend
+        self.workers = workers or os.cpu_count() or 1
+        self.seed = seed
+
+        self.runs_used = 0
+        self.best_configurations = []
+        self.races = []
+
+    def _sample(self, rng, parent: dict = None, spread: float = 1.0) -> dict:
+        """Sample a configuration, uniformly or around a parent one.
+
+        Args:
+            rng (random.Random): Generator to sample with.
+            parent (dict, optional): Configuration to sample around.
+            spread (float): Standard deviation of numeric parameters as a fraction of their range.
+        """
+        config = {}
+        for name, kind, domain, condition in self.space:
+            if condition is not None and config.get(condition[0]) not in condition[1]:
+                continue
+            inherited = parent is not None and name in parent
+            if kind == "choice":
+                if inherited and rng.random() > spread / 2:
+                    config[name] = parent[name]
+                else:
+                    config[name] = rng.choice(domain)
+                continue
+
+            low, high = domain
+            if kind == "log":
+                low, high = math.log(low), math.log(high)
+            if inherited:
+                center = math.log(parent[name]) if kind == "log" else parent[name]
+                value = min(high, max(low, rng.gauss(center, spread * (high - low))))
+            else:
+                value = rng.uniform(low, high)
+            if kind == "int":
+                config[name] = int(round(value))
+            elif kind == "log":
+                config[name] = round(math.exp(value), 6)
+            else:
+                config[name] = round(value, 6)
+        return config
+
+    def run(self, verbose: bool = True) -> List[dict]:
+        """Run the races.
+
+        Args:
+            verbose (bool): Print progress of the races.
+
+        Returns:
+            List[dict]: Best configurations with their mean cost and number of runs,
+                best first
+        """
+        sequence = seed_sequence(self.seed)
+        rng = make_rng(sequence)
+        self.runs_used = 0
+        self.races = []
+        elites = []  # (candidate, mean rank) of the previous race
+        next_id = 0
+
+        executor = None
+        if self.backend == "process":
+            executor = ProcessPoolExecutor(max_workers=self.workers)
+        try:
+            for iteration in range(self.iterations):
+                race_budget = (self.budget - self.runs_used) // (
+                    self.iterations - iteration
+                )
+                size = max(2, race_budget // (self.first_test + min(5, iteration)))
+                candidates = [candidate for candidate, _ in elites]
+                spread = 0.5 ** (iteration + 1)
+                while len(candidates) < size:
+                    parent = None
+                    if elites:
+                        # Better elites are picked more often
+                        weights = [len(elites) - i for i in range(len(elites))]
+                        parent = rng.choices(elites, weights=weights)[0][0]["config"]
+                    candidates.append(
+                        {"id": next_id, "config": self._sample(rng, parent, spread)}
+                    )
+                    next_id += 1
+
+                race = self._race(
+                    iteration, candidates, race_budget, sequence, rng, executor, verbose
+                )
+                self.races.append(race)
+                elites = race["ranking"][: self.elites]
+                if self.runs_used >= self.budget:
+                    break
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        self.best_configurations = [
+            {
+                "id": candidate["id"],
+                "config": candidate["config"],
+                "mean_rank": mean_rank,
+                "mean_cost": candidate["mean_cost"],
+                "runs": candidate["runs"],
+            }
+            for candidate, mean_rank in elites
+        ]
+        return self.best_configurations
+
+    def _race(
+        self, iteration, candidates, race_budget, sequence, rng, executor, verbose
+    ) -> dict:
+        """Race candidates until one is left or the race budget is used.
+
+        Returns:
+            dict: Trace of the race, "ranking" holds (candidate, mean rank) of the
+                survivors, best first
+        """
+        alive = list(range(len(candidates)))
+        costs = []  # costs[block][candidate] for all candidates alive at that block
+        stages = []
+        used = 0
+        instances = []
+        while len(alive) > 1 and used + len(alive) <= race_budget:
+            if not instances:
+                instances = list(self.instances)
+                rng.shuffle(instances)
+            instance = instances.pop()
+            block_seed = spawn_seeds(sequence, 1)[0]
+            configs = [candidates[c]["config"] for c in alive]
+            args = [
+                (self.algorithm, config, instance, block_seed, self.run_budget)
+                for config in configs
+            ]
+            if executor is None:
+                block = [evaluate_configuration(*arg) for arg in args]
+            else:
+                futures = [
+                    executor.submit(evaluate_configuration, *arg) for arg in args
+                ]
+                block = [future.result() for future in futures]
+            used += len(alive)
+            self.runs_used += len(alive)
+            costs.append(dict(zip(alive, block)))
+
+            stage = {
+                "block": len(costs),
+                "instance": instance,
+                "seed": block_seed,
+                "costs": {candidates[c]["id"]: cost for c, cost in zip(alive, block)},
+                "statistic": None,
+                "p_value": None,
+                "eliminated": [],
+            }
+            if len(costs) >= self.first_test:
+                matrix = [[row[c] for c in alive] for row in costs]
+                statistic, p_value, worse = friedman_race_step(matrix, self.alpha)
+                stage["statistic"] = statistic
+                stage["p_value"] = p_value
+                stage["eliminated"] = [candidates[alive[j]]["id"] for j in worse]
+                alive = [c for j, c in enumerate(alive) if j not in worse]
+            stages.append(stage)
+
+            if verbose:
+                best = min(alive, key=lambda c: sum(row[c] for row in costs))
+                print(
+                    f"Race {iteration + 1}, block {len(costs)} ({instance}): "
+                    f"{len(alive)} alive, best #{candidates[best]['id']} "
+                    f"mean cost {sum(row[best] for row in costs) / len(costs):.1f}"
+                    + (f", dropped {stage['eliminated']}" if stage["eliminated"] else "")
+                )
+
+        # Rank survivors over the blocks they all ran on
+        mean_ranks = {c: 0.0 for c in alive}
+        for row in costs:
+            for c, rank in zip(alive, _ranks([row[c] for c in alive])):
+                mean_ranks[c] += rank / len(costs)
+        for c in range(len(candidates)):
+            runs = [row[c] for row in costs if c in row]
+            candidates[c]["runs"] = len(runs)
+            # Candidates without runs rank last
+            candidates[c]["mean_cost"] = sum(runs) / len(runs) if runs else math.inf
+        ranking = sorted(
+            alive, key=lambda c: (mean_ranks[c], candidates[c]["mean_cost"])
+        )
+        return {
+            "iteration": iteration,
+            "candidates": [dict(candidate) for candidate in candidates],
+            "stages": stages,
+            "ranking": [(candidates[c], mean_ranks[c]) for c in ranking],
+        }
+
+    def write_results(self, path: str) -> None:
+        """Write the best configurations and the race traces to a JSON file
+
+        Args:
+            path (str): Output file path
+        """
+        report = {
+            "algorithm": self.algorithm,
+            "instances": self.instances,
+            "budget": self.budget,
+            "runs_used": self.runs_used,
+            "run_budget": self.run_budget,
+            "best_configurations": self.best_configurations,
+            "races": [
+                {
+                    "iteration": race["iteration"],
+                    "candidates": race["candidates"],
+                    "stages": race["stages"],
+                    "survivors": [
+                        {"id": candidate["id"], "mean_rank": mean_rank}
+                        for candidate, mean_rank in race["ranking"]
+                    ],
+                }
+                for race in self.races
+            ],
+        }
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("algorithm", choices=sorted(RUN_BUDGETS))
+    parser.add_argument("instances", nargs="+")
+    parser.add_argument("--budget", type=int, default=500)
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument("--backend", choices=["serial", "process"], default="process")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="tuning_results.json")
+    args = parser.parse_args()
+
+    tuner = RacingTuner(
+        args.algorithm,
+        args.instances,
+        budget=args.budget,
+        iterations=args.iterations,
+        backend=args.backend,
+        workers=args.workers,
+        seed=args.seed,
+    )
+    best_configurations = tuner.run()
+    tuner.write_results(args.output)
+    for candidate in best_configurations:
+        if not candidate["runs"]:
+            print(f"#{candidate['id']}: not run - {candidate['config']}")
+            continue
+        print(
+            f"#{candidate['id']}: mean cost {candidate['mean_cost']:.1f} over "
+            f"{candidate['runs']} runs - {candidate['config']}"
+        )
+    print(f"{tuner.runs_used} runs, results written to {args.output}")
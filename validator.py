@@ -1,27 +1,53 @@
 """This file contains Validator class for the Set Cover Problem (SCP) implementation."""
 
 from solution import Solution
-from typing import List
+from typing import List, Tuple, Union
 from DataLoader import DataLoader
+from index_pool import IndexPool
+from profiling import Observer, section
 import math
+import threading
+import numpy as np
+
+# Largest packed cover matrix evaluate_batch builds, bigger instances use the CSR arrays
+_MAX_COVER_WORDS_BYTES = 256 * 1024 * 1024
 
 
 class Validator:
-    def __init__(self, dl: DataLoader) -> None:
+    def __init__(self, dl: DataLoader, coverage_engine: str = "bitset") -> None:
         """Subclass for simulation used for calculating various things
 
         Args:
-            n (int): Number of elements that need to be covered
-            m (int): Number of subsets that can be choosen
-            costs (List[int]): Costs of subsets
-            covers (List[List[int]]): Elements covered by each subset
+            dl (DataLoader): Loaded instance data
+            coverage_engine (str): Coverage check backend, "bitset" (default) or "set"
         """
         self._n = dl.get_n()
         self._m = dl.get_m()
         self._costs = dl.get_costs()
         self._covers = dl.get_subset_covers()
+        self._element_covers = dl.get_element_covers()
+        self._element_csr = dl.get_element_csr()
+        self._subset_csr = dl.get_subset_csr()
+        self._cost_array = dl.get_cost_array()
+        self._cover_words = None
+        self._element_covers_by_cost = None
+        # Operators' IndexPool, one per thread (EA thread backend shares the validator)
+        self._local = threading.local()
         self._all_elements = set(range(self._n))
 
+        if coverage_engine not in ("bitset", "set"):
+            raise ValueError(
+                f"Invalid coverage engine: {coverage_engine}. "
+                f"Valid options: ['bitset', 'set']"
+            )
+        self.coverage_engine = coverage_engine
+        # Observer notified of coverage recomputations and redundancy removal (see profiling)
+        self.observer: Observer = None
+
+        # Each subset's cover as a bitmask (bit e set if element e is covered)
+        self._cover_masks = [self._to_mask(cover) for cover in self._covers]
+        self._full_mask = (1 << self._n) - 1
+
         # Calculate gamma for instance
         max_cost_per_element = 0
         for j in range(len(self._covers)):
@@ -33,8 +59,266 @@ class Validator:
                 max_cost_per_element = cost_per_element
 
         self._gamma = 10  # max(math.ceil(max_cost_per_element), 1)  # Gamma ≥ 1
+        # Threshold of the penalty tracked incrementally on solutions
+        self._conflict_threshold_k = 1
         pass
 
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_local"]
+        state["observer"] = None  # Observers stay in the process that set them
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    def unselected_pool(self, solution: Solution) -> IndexPool:
+        """Return the calling thread's IndexPool holding subsets not in a solution.
+
+        The pool is shared by all calls in a thread, so it is only valid until the
+        next unselected_pool call. It is not updated when the solution changes.
+
+        Args:
+            solution (Solution): Solution whose subsets are excluded
+
+        Returns:
+            IndexPool: Indices of unselected subsets
+        """
+        pool = getattr(self._local, "pool", None)
+        if pool is None:
+            pool = self._local.pool = IndexPool(self._m)
+        pool.reset()
+        pool.discard_all(solution.subsets)
+        return pool
+
+    @staticmethod
+    def _to_mask(elements: List[int]) -> int:
+        """Pack element indices into an integer bitmask
+
+        Args:
+            elements (List[int]): Element indices
+
+        Returns:
+            int: Bitmask with bit e set for every element e
+        """
+        mask = 0
+        for e in elements:
+            mask |= 1 << e
+        return mask
+
+    def coverage_mask(self, solution: Solution) -> int:
+        """OR-reduce cover bitmasks of all subsets in a solution
+
+        Args:
+            solution (Solution): Solution to calculate for
+
+        Returns:
+            int: Bitmask of covered elements
+        """
+        masks = self._cover_masks
+        covered = 0
+        for subset in solution.subsets:
+            covered |= masks[subset]
+        return covered
+
+    def init_coverage_state(self, solution: Solution) -> None:
+        """Build per-element cover counts, uncovered count and cost for a solution,
+        so it can later be modified with add_subset/remove_subset
+
+        Args:
+            solution (Solution): Solution to initialize
+        """
+        if self.observer is not None:
+            self.observer.on_count("coverage_recomputations")
+        counts = [0] * self._n
+        for subset in solution.subsets:
+            for e in self._covers[subset]:
+                counts[e] += 1
+        solution._cover_counts = counts
+        solution._uncovered = counts.count(0)
+        solution._is_correct = solution._uncovered == 0
+        self.sum_costs(solution)
+
+    def add_subset(self, solution: Solution, subset: int) -> None:
+        """Add a subset to the solution updating its state in O(|cover|)
+
+        Args:
+            solution (Solution): Solution to modify
+            subset (int): Index of subset to add
+        """
+        if solution._cover_counts is None:
+            self.init_coverage_state(solution)
+        counts = solution._cover_counts
+        newly_covered = 0
+        for e in self._covers[subset]:
+            if counts[e] == 0:
+                newly_covered += 1
+            counts[e] += 1
+        if solution._penalty is not None:
+            solution._penalty += self.overlap_penalty_delta(
+                solution.subsets, subset, self._conflict_threshold_k
+            )
+        solution._append_subset(subset)
+        solution._uncovered -= newly_covered
+        solution._is_correct = solution._uncovered == 0
+        solution._cost_sum += self._costs[subset]
+        self._update_fitness(solution)
+
+    def remove_subset(self, solution: Solution, subset: int) -> None:
+        """Remove a subset from the solution updating its state in O(|cover|)
+
+        Args:
+            solution (Solution): Solution to modify
+            subset (int): Index of subset to remove
+        """
+        if solution._cover_counts is None:
+            self.init_coverage_state(solution)
+        counts = solution._cover_counts
+        newly_uncovered = 0
+        for e in self._covers[subset]:
+            counts[e] -= 1
+            if counts[e] == 0:
+                newly_uncovered += 1
+        solution._remove_subset(subset)
+        if solution._penalty is not None:
+            solution._penalty -= self.overlap_penalty_delta(
+                solution.subsets, subset, self._conflict_threshold_k
+            )
+        solution._uncovered += newly_uncovered
+        solution._is_correct = solution._uncovered == 0
+        solution._cost_sum -= self._costs[subset]
+        self._update_fitness(solution)
+
+    def _update_fitness(self, solution: Solution) -> None:
+        """Set fitness from the incrementally tracked cost and penalty, inf if not tracked"""
+        if solution._penalty is not None and solution._is_correct:
+            solution._fitness = solution._cost_sum + solution._penalty
+        else:
+            solution._fitness = float("inf")
+
+    def evaluate_batch(
+        self,
+        solutions: Union[List[Solution], np.ndarray],
+        packed: bool = False,
+        write_back: bool = True,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Evaluate a whole population in one vectorised pass
+
+        Args:
+            solutions (Union[List[Solution], np.ndarray]): Solutions, or a (population x m)
+                0/1 selection matrix
+            packed (bool): If True, the selection matrix rows are packed bits (np.packbits)
+            write_back (bool): If True, store cost and correctness in the Solution objects
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Cost, correctness and number of
+                uncovered elements of every solution
+        """
+        if isinstance(solutions, np.ndarray):
+            selection = solutions
+            if packed:
+                selection = np.unpackbits(selection, axis=1, count=self._m)
+            count = selection.shape[0]
+            rows, cols = np.nonzero(selection)
+        else:
+            count = len(solutions)
+            lengths = [len(solution.subsets) for solution in solutions]
+            rows = np.repeat(np.arange(count), lengths)
+            cols = np.concatenate(
+                [np.frombuffer(solution.subsets, dtype=np.int32) for solution in solutions]
+                + [np.empty(0, dtype=np.int32)]
+            ).astype(np.int64)
+
+        costs = np.bincount(
+            rows, weights=self._cost_array[cols], minlength=count
+        ).astype(np.int64)
+
+        cover_words = self._get_cover_words()
+        if cover_words is not None:
+            uncovered = self._batch_uncovered_bitwise(cover_words, rows, cols, count)
+        else:
+            uncovered = self._batch_uncovered_csr(rows, cols, count)
+        correct = uncovered == 0
+
+        if write_back and not isinstance(solutions, np.ndarray):
+            for solution, cost, is_correct in zip(
+                solutions, costs.tolist(), correct.tolist()
+            ):
+                solution._cost_sum = cost
+                solution._is_correct = is_correct
+        return costs, correct, uncovered
+
+    def _get_element_covers_by_cost(self) -> List[List[int]]:
+        """Return subsets covering each element sorted by (cost, index), built on first use"""
+        if self._element_covers_by_cost is None:
+            costs = self._costs
+            self._element_covers_by_cost = [
+                sorted(candidates, key=lambda j: (costs[j], j))
+                for candidates in self._element_covers
+            ]
+        return self._element_covers_by_cost
+
+    def _get_cover_words(self) -> np.ndarray:
+        """Return cover bitmasks packed as a (m x words) uint64 matrix, built on first use.
+        None if the matrix would exceed _MAX_COVER_WORDS_BYTES."""
+        if self._cover_words is None:
+            words = (self._n + 63) // 64
+            if self._m * words * 8 > _MAX_COVER_WORDS_BYTES:
+                return None
+            bits = np.zeros((self._m, words * 64), dtype=bool)
+            csr = self._subset_csr
+            bits[np.repeat(np.arange(self._m), csr.row_lengths()), csr.indices] = True
+            packed = np.packbits(bits, axis=1, bitorder="little")
+            self._cover_words = packed.view(np.uint64)
+        return self._cover_words
+
+    def _batch_uncovered_bitwise(
+        self, cover_words: np.ndarray, rows: np.ndarray, cols: np.ndarray, count: int
+    ) -> np.ndarray:
+        """Count uncovered elements per solution by OR-reducing packed cover bitmasks
+
+        Args:
+            cover_words (np.ndarray): Packed cover bitmasks of all subsets
+            rows (np.ndarray): Solution index of every selected subset, ascending
+            cols (np.ndarray): Selected subset indices
+
+        Returns:
+            np.ndarray: Number of uncovered elements of every solution
+        """
+        covered = np.zeros((count, cover_words.shape[1]), dtype=np.uint64)
+        if len(cols):
+            present, starts = np.unique(rows, return_index=True)
+            covered[present] = np.bitwise_or.reduceat(cover_words[cols], starts, axis=0)
+        if hasattr(np, "bitwise_count"):  # numpy >= 2.0
+            covered_count = np.bitwise_count(covered).sum(axis=1, dtype=np.int64)
+        else:
+            covered_count = np.unpackbits(
+                covered.view(np.uint8), axis=1, count=self._n, bitorder="little"
+            ).sum(axis=1)
+        return self._n - covered_count
+
+    def _batch_uncovered_csr(
+        self, rows: np.ndarray, cols: np.ndarray, count: int
+    ) -> np.ndarray:
+        """Count uncovered elements per solution by scattering covers from the CSR arrays
+
+        Args:
+            rows (np.ndarray): Solution index of every selected subset
+            cols (np.ndarray): Selected subset indices
+
+        Returns:
+            np.ndarray: Number of uncovered elements of every solution
+        """
+        indptr = self._subset_csr.indptr
+        starts = indptr[cols]
+        lengths = indptr[cols + 1] - starts
+        row_offsets = np.cumsum(lengths) - lengths
+        positions = np.arange(lengths.sum()) + np.repeat(starts - row_offsets, lengths)
+        covered = np.zeros((count, self._n), dtype=bool)
+        covered[np.repeat(rows, lengths), self._subset_csr.indices[positions]] = True
+        return self._n - covered.sum(axis=1)
+
     def calculate_covered_elements(self, solution: Solution) -> list[int]:
         """Calculate elements covered by a solution
 
@@ -63,12 +347,16 @@ class Validator:
         Returns:
             bool: True if all elements are covered
         """
-        covered = self.calculate_covered_elements(solution)
-        # print(f"{covered=}")
-        if set(covered) == self._all_elements:
-            solution._is_correct = True
-            return True
-        return False
+        if self.observer is not None:
+            self.observer.on_count("coverage_recomputations")
+        if self.coverage_engine == "bitset":
+            correct = self.coverage_mask(solution) == self._full_mask
+        else:
+            covered = self.calculate_covered_elements(solution)
+            # print(f"{covered=}")
+            correct = set(covered) == self._all_elements
+        solution._is_correct = correct
+        return correct
 
     def sum_costs(self, solution: Solution) -> int:
         """Calculate sum of subsets' costs from a solution
@@ -129,6 +417,58 @@ class Validator:
         self.calculate_fitness(solution)
         pass
 
+    def eliminate_redundant_subsets(
+        self, solution: Solution, order: str = "index", continuous: bool = True
+    ) -> bool:
+        """Remove redundant subsets using per-element cover counts. A subset can be
+        dropped when every element it covers is covered at least twice, so each
+        check costs O(|cover|) instead of a full coverage recomputation.
+
+        Args:
+            solution (Solution): Solution to optimize
+            order (str): Order of checking - "index", "reverse" or "cost" (most expensive first). Default "index".
+            continuous (bool): If True, removes all redundant subsets, otherwise only the first one. Default True.
+
+        Returns:
+            bool: True if any redundant subset was found and removed, False otherwise
+        """
+        if order not in ("index", "reverse", "cost"):
+            raise ValueError(
+                f"Invalid order: {order}. Valid options: ['index', 'reverse', 'cost']"
+            )
+        with section(self.observer, "redundancy_removal"):
+            if solution._cover_counts is None:
+                self.init_coverage_state(solution)
+
+            counts = solution._cover_counts
+            subsets = solution.subsets
+            positions = range(len(subsets))
+            if order == "reverse":
+                positions = reversed(positions)
+            elif order == "cost":
+                positions = sorted(positions, key=lambda i: -self._costs[subsets[i]])
+
+            removed = set()
+            for i in positions:
+                cover = self._covers[subsets[i]]
+                if all(counts[e] > 1 for e in cover):
+                    for e in cover:
+                        counts[e] -= 1
+                    removed.add(i)
+                    if not continuous:
+                        break
+
+            if not removed:
+                return False
+
+            solution._cost_sum -= sum(self._costs[subsets[i]] for i in removed)
+            solution._penalty = None
+            solution._fitness = float("inf")
+            solution._replace_subsets(
+                subset for i, subset in enumerate(subsets) if i not in removed
+            )
+            return True
+
     def remove_redundant_subsets(
         self, solution: Solution, reverse: bool = False, continuous: bool = False
     ) -> bool:
@@ -142,43 +482,9 @@ class Validator:
         Returns:
             bool: True if any redundant subset was found and removed, False otherwise
         """
-        # if not solution.subsets:          # This might make no sense
-        #     return False
-
-        # Get current covered elements
-        current_covered = set(self.calculate_covered_elements(solution))
-        removed_any = False
-        subset_indices = range(len(solution.subsets))
-
-        # Reverse the order if needed
-        if reverse:
-            subset_indices = reversed(subset_indices)
-
-        # Create a copy of indices to avoid modifying while iterating
-        indices_to_check = list(subset_indices)
-
-        for i in indices_to_check:
-            # Skip if this subset was already removed in continuous mode
-            if i >= len(solution.subsets):
-                continue
-
-            # Calculate coverage without this subset
-            temp_subsets = solution.subsets[:i] + solution.subsets[i + 1 :]
-            temp_solution = Solution(temp_subsets)
-            temp_covered = set(self.calculate_covered_elements(temp_solution))
-
-            # If coverage is still complete, remove the subset
-            if temp_covered == current_covered:
-                solution.subsets.pop(i)
-                removed_any = True
-
-                # If not in continuous mode, return after first removal
-                if not continuous:
-                    break
-
-        if removed_any:
-            self.complex_eval_without_fitness(solution)
-        return removed_any
+        return self.eliminate_redundant_subsets(
+            solution, order="reverse" if reverse else "index", continuous=continuous
+        )
 
     def remove_redundant_subsets_for_greedy(
         self, solution: Solution, reverse: bool = False, continuous: bool = False
@@ -193,40 +499,9 @@ class Validator:
         Returns:
             bool: True if any redundant subset was found and removed, False otherwise
         """
-        # if not solution.subsets:          # This might make no sense
-        #     return False
-
-        # Get current covered elements
-        current_covered = set(self.calculate_covered_elements(solution))
-        removed_any = False
-        subset_indices = range(len(solution.subsets))
-
-        # Reverse the order if needed
-        if reverse:
-            subset_indices = reversed(subset_indices)
-
-        # Create a copy of indices to avoid modifying while iterating
-        indices_to_check = list(subset_indices)
-
-        for i in indices_to_check:
-            # Skip if this subset was already removed in continuous mode
-            if i >= len(solution.subsets):
-                continue
-
-            # Calculate coverage without this subset
-            temp_subsets = solution.subsets[:i] + solution.subsets[i + 1 :]
-            temp_solution = Solution(temp_subsets)
-            temp_covered = set(self.calculate_covered_elements(temp_solution))
-
-            # If coverage is still complete, remove the subset
-            if temp_covered == current_covered:
-                solution.subsets.pop(i)
-                removed_any = True
-
-                # If not in continuous mode, return after first removal
-                if not continuous:
-                    break
-
+        removed_any = self.eliminate_redundant_subsets(
+            solution, order="reverse" if reverse else "index", continuous=continuous
+        )
         if removed_any:
             self.complex_eval(solution)
         return removed_any
@@ -255,13 +530,53 @@ class Validator:
 
         # Calculate total cost and penalties for VALID solutions
         total_cost = sum(self._costs[j] for j in solution.subsets)
-
-        for i in range(len(solution.subsets)):
-            subset_i = self._covers[solution.subsets[i]]
-            for j in range(i + 1, len(solution.subsets)):
-                subset_j = self._covers[solution.subsets[j]]
-                overlap = len(set(subset_i) & set(subset_j))
-                if overlap > conflict_threshold_k:
-                    total_cost += self._gamma * (overlap - conflict_threshold_k)
+        penalty = self.overlap_penalty(solution.subsets, conflict_threshold_k)
+        if conflict_threshold_k == self._conflict_threshold_k:
+            solution._penalty = penalty
+        total_cost += penalty
         solution._fitness = total_cost
         return total_cost
+
+    def overlap_penalty(
+        self, subsets: List[int], conflict_threshold_k: int = 1
+    ) -> int:
+        """Calculate conflict penalty of a list of subsets. Overlaps are popcounts of
+        ANDed cover bitmasks, so each pair costs one big-int operation.
+
+        Args:
+            subsets (List[int]): Indices of selected subsets.
+            conflict_threshold_k (int): Maximum allowed overlap without penalty.
+
+        Returns:
+            int: Sum of gamma * (overlap - k) over pairs overlapping on more than k elements.
+        """
+        masks = [self._cover_masks[j] for j in subsets]
+        excess = 0
+        for i, mask_i in enumerate(masks):
+            for mask_j in masks[i + 1 :]:
+                overlap = (mask_i & mask_j).bit_count()
+                if overlap > conflict_threshold_k:
+                    excess += overlap - conflict_threshold_k
+        return self._gamma * excess
+
+    def overlap_penalty_delta(
+        self, subsets: List[int], subset: int, conflict_threshold_k: int = 1
+    ) -> int:
+        """Calculate penalty of the pairs a subset forms with a list of subsets,
+        i.e. how much the penalty grows when it is added (or drops when removed) in O(k).
+
+        Args:
+            subsets (List[int]): Indices of the other selected subsets.
+            subset (int): Index of the added or removed subset.
+            conflict_threshold_k (int): Maximum allowed overlap without penalty.
+
+        Returns:
+            int: Penalty of the pairs formed with the subset.
+        """
+        mask = self._cover_masks[subset]
+        excess = 0
+        for j in subsets:
+            overlap = (mask & self._cover_masks[j]).bit_count()
+            if overlap > conflict_threshold_k:
+                excess += overlap - conflict_threshold_k
+        return self._gamma * excess